@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import copy
+import dataclasses
 import logging
+import os
 import re
+import shutil
+import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from claude_runner import ClaudeResult, ClaudeRunner
-from config_schema import Config
+from config_schema import _DATACLASS_SLOTS, Config
+from git_manager import GitManager, Snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,20 @@ try:
 except ImportError:
     CycleStateWriter = None  # type: ignore[assignment,misc]
 
+# Planner runs attempted before giving up on an empty plan
+PLANNER_MAX_ATTEMPTS = 2
+
+# Reviewer verdict line, e.g. "VERDICT: APPROVED" (case-insensitive, at line start)
+_VERDICT_RE = re.compile(
+    r"^[ \t]*VERDICT:[ \t]*(APPROVED|REVISE)", re.MULTILINE | re.IGNORECASE,
+)
+# Tester outcome line, e.g. "TESTS: FAILED" (case-insensitive, at line start)
+_TEST_OUTCOME_RE = re.compile(
+    r"^[ \t]*TESTS:[ \t]*(PASSED|FAILED)", re.MULTILINE | re.IGNORECASE,
+)
+# Agent output searched for a trailing marker line before scanning all of it
+_MARKER_TAIL_CHARS = 4096
+
 
 class AgentRole(Enum):
     PLANNER = "planner"
@@ -30,7 +49,7 @@ class AgentRole(Enum):
     REVIEWER = "reviewer"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentResult:
     role: AgentRole
     success: bool
@@ -49,7 +68,7 @@ class AgentCostSummary:
     invocation_count: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PipelineResult:
     success: bool
     agent_results: List[AgentResult] = field(default_factory=list)
@@ -86,32 +105,73 @@ class AgentWorkspace:
 
     def clean(self) -> None:
         """Remove all files in the workspace, tolerating permission errors."""
-        if self._root.exists():
-            for child in self._root.iterdir():
-                try:
-                    if child.is_file():
-                        child.unlink()
-                    elif child.is_dir():
-                        import shutil
-                        shutil.rmtree(child)
-                except (PermissionError, OSError) as e:
-                    logger.warning("Could not remove workspace entry %s: %s", child, e)
+        shutil.rmtree(self._root, ignore_errors=True)
+        if self._root.exists() and any(self._root.iterdir()):
+            logger.warning("Could not remove all entries from workspace %s", self._root)
         self._root.mkdir(parents=True, exist_ok=True)
 
     def write(self, name: str, content: str) -> None:
         self._root.mkdir(parents=True, exist_ok=True)
-        (self._root / name).write_text(content)
+        self._write_atomic(name, content)
+
+    def write_batch(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Write several files at once, creating the workspace only once."""
+        self._root.mkdir(parents=True, exist_ok=True)
+        for name, content in items:
+            self._write_atomic(name, content)
+
+    def _write_atomic(self, name: str, content: str) -> None:
+        """Atomically write a file via tempfile + os.replace.
+
+        A terminated pipeline must never leave a truncated review.md behind,
+        since a verdict-less review is parsed as approved.  Uses raw
+        os.write so each file costs a single write with no text-mode layer.
+        """
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=str(self._root), prefix=f".{name}.", suffix=".tmp"
+        )
+        try:
+            try:
+                data = memoryview(content.encode("utf-8"))
+                while data:
+                    data = data[os.write(tmp_fd, data):]
+            finally:
+                os.close(tmp_fd)
+            os.replace(tmp_path, str(self._root / name))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def read(self, name: str) -> Optional[str]:
-        path = self._root / name
-        if path.exists():
-            return path.read_text()
-        return None
+        try:
+            return (self._root / name).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
 
     def exists(self, name: str) -> bool:
         return (self._root / name).exists()
 
 
+class _CostLedger:
+    """Thread-safe running cost total shared by concurrently running pipelines."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._total = 0.0
+
+    def add(self, cost_usd: float) -> None:
+        with self._lock:
+            self._total += cost_usd
+
+    @property
+    def total(self) -> float:
+        with self._lock:
+            return self._total
+
+
 class AgentPipeline:
     """Orchestrates a Planner -> Coder -> Tester -> Reviewer pipeline."""
 
@@ -120,26 +180,65 @@ class AgentPipeline:
         self._ws_dir = str(
             Path(config.target_dir) / config.paths.agent_workspace_dir
         )
-        self._active_runner: Optional[ClaudeRunner] = None
+        self._active_runners: Set[ClaudeRunner] = set()
+        self._runners: Dict[AgentRole, ClaudeRunner] = {}
+        # Roles told to stop by _terminate_runner(); checked under
+        # _runner_lock before each call so a stop that lands before the
+        # agent registers its runner is not lost
+        self._stopped_roles: Set[AgentRole] = set()
+        self._git = GitManager(config.target_dir)
+        ws_rel = Path(os.path.relpath(self._ws_dir, config.target_dir))
+        # Only a workspace strictly inside the repo can be excluded with a
+        # pathspec; excluding the repo root itself would hide every change
+        self._status_exclude: Tuple[str, ...] = (
+            () if not ws_rel.parts or ws_rel.parts[0] == ".." else (ws_rel.as_posix(),)
+        )
         self._runner_lock = threading.Lock()
         self._terminated = False
         self._cycle_state = cycle_state
+        # Set by run_batch() so concurrently running groups share one budget
+        self._cost_ledger: Optional[_CostLedger] = None
+        self._batch_pipelines: List[AgentPipeline] = []
 
     def terminate(self) -> None:
-        """Terminate the currently running agent subprocess.
+        """Terminate all currently running agent subprocesses.
 
         Thread-safe: can be called from a timeout handler in another thread.
         """
         self._terminated = True
         with self._runner_lock:
-            runner = self._active_runner
-        if runner is not None:
+            runners = list(self._active_runners)
+            batch_pipelines = list(self._batch_pipelines)
+        for runner in runners:
             logger.warning("Terminating active pipeline agent subprocess")
             runner.terminate()
+        for pipeline in batch_pipelines:
+            pipeline.terminate()
+
+    def _terminate_runner(self, role: AgentRole) -> None:
+        """Stop the current call of one agent role, whether or not it has started."""
+        with self._runner_lock:
+            self._stopped_roles.add(role)
+            runner = self._runners.get(role)
+            if runner is not None and runner in self._active_runners:
+                runner.terminate()
 
     def _build_runner_for_agent(self, role: AgentRole) -> ClaudeRunner:
+        """Return the ClaudeRunner for *role*, building it on first use.
+
+        Runner inputs never change across iterations, so one runner per
+        role is cached for the lifetime of the pipeline.
+        """
+        with self._runner_lock:
+            runner = self._runners.get(role)
+        if runner is None:
+            runner = self._create_runner_for_agent(role)
+            with self._runner_lock:
+                runner = self._runners.setdefault(role, runner)
+        return runner
+
+    def _create_runner_for_agent(self, role: AgentRole) -> ClaudeRunner:
         """Build a ClaudeRunner with per-agent model/timeout overrides."""
-        agent_config = copy.deepcopy(self.config)
         role_cfg = getattr(self.config.agent_pipeline, role.value)
         required_attrs = ("model", "max_turns", "timeout_seconds")
         missing = [a for a in required_attrs if not hasattr(role_cfg, a)]
@@ -148,31 +247,81 @@ class AgentPipeline:
                 f"Agent role '{role.value}' config is missing required attributes: "
                 f"{', '.join(missing)}. Check agent_pipeline.{role.value} in config."
             )
-        agent_config.claude.model = role_cfg.model
-        agent_config.claude.resolved_model = ""
-        agent_config.claude.max_turns = role_cfg.max_turns
-        agent_config.claude.timeout_seconds = role_cfg.timeout_seconds
+        # Only the claude section differs per agent, so a shallow copy of the
+        # top-level config with a fresh ClaudeConfig is enough.
+        agent_claude = dataclasses.replace(
+            self.config.claude,
+            model=role_cfg.model,
+            resolved_model="",
+            max_turns=role_cfg.max_turns,
+            timeout_seconds=role_cfg.timeout_seconds,
+        )
+        agent_config = dataclasses.replace(self.config, claude=agent_claude)
         return ClaudeRunner(agent_config)
 
+    def _rollback_if_changed(
+        self, rollback_fn: Callable[[Snapshot], None], snapshot: Snapshot,
+    ) -> None:
+        """Invoke rollback_fn unless the target repo is verifiably untouched.
+
+        The agent workspace is left out of the check: plan.md and the other
+        hand-off files are expected there and are not changes to the repo.
+        """
+        try:
+            changed = self._git.has_changes_since(
+                snapshot, exclude=self._status_exclude,
+            )
+        except RuntimeError:
+            changed = True
+        if changed:
+            rollback_fn(snapshot)
+        else:
+            logger.debug("Skipping rollback: working tree unchanged since snapshot")
+
     @staticmethod
-    def _parse_review_verdict(review_text: str) -> bool:
-        """Parse VERDICT from reviewer output. Defaults to approved."""
+    def _match_last_line(text: str, pattern: "re.Pattern[str]") -> Optional["re.Match[str]"]:
+        """Return the last match of a line-anchored *pattern* in *text*.
+
+        Agents are told to end with their marker line, so the tail of the
+        output is searched first and the rest only when the tail has none.
+        Each search is a single regex pass with no per-line Python loop.
+        """
+        # Start the tail window on a line boundary so "^" can match there.
+        tail_start = 0
+        if len(text) > _MARKER_TAIL_CHARS:
+            tail_start = text.rfind("\n", 0, len(text) - _MARKER_TAIL_CHARS) + 1
+        last = None
+        for last in pattern.finditer(text, tail_start):
+            pass
+        if last is None and tail_start > 0:
+            for last in pattern.finditer(text, 0, tail_start):
+                pass
+        return last
+
+    @classmethod
+    def _parse_review_verdict(cls, review_text: str) -> bool:
+        """Parse VERDICT from reviewer output. Defaults to approved.
+
+        The last VERDICT line wins.
+        """
         if not review_text:
             return True
-        for line in review_text.splitlines():
-            match = re.match(r"\s*VERDICT:\s*(APPROVED|REVISE)\s*", line, re.IGNORECASE)
-            if match:
-                return match.group(1).upper() == "APPROVED"
-        return True
+        match = cls._match_last_line(review_text, _VERDICT_RE)
+        return match is None or match.group(1).upper() == "APPROVED"
+
+    @classmethod
+    def _parse_test_outcome(cls, tester_text: str) -> bool:
+        """Parse TESTS outcome from tester output. Defaults to passed."""
+        if not tester_text:
+            return True
+        match = cls._match_last_line(tester_text, _TEST_OUTCOME_RE)
+        return match is None or match.group(1).upper() == "PASSED"
 
     def _build_task_description(self, tasks: list) -> str:
         """Combine task descriptions into a single prompt block."""
         if len(tasks) == 1:
             return tasks[0].description
-        lines = []
-        for i, t in enumerate(tasks, 1):
-            lines.append(f"{i}. {t.description}")
-        return "\n".join(lines)
+        return "\n".join(f"{i}. {t.description}" for i, t in enumerate(tasks, 1))
 
     @staticmethod
     def _update_cost_summary(
@@ -190,88 +339,186 @@ class AgentPipeline:
     def run(
         self,
         tasks: list,
-        rollback_fn: Callable[[str], None],
-        snapshot: str,
+        rollback_fn: Callable[[Snapshot], None],
+        snapshot: Snapshot,
     ) -> PipelineResult:
         """Execute the full pipeline, returning a PipelineResult."""
+        try:
+            return self._run_pipeline(tasks, rollback_fn, snapshot)
+        finally:
+            if self.config.agent_pipeline.persistent_sessions:
+                self._close_sessions()
+
+    def _close_sessions(self) -> None:
+        """Shut down the persistent CLI session held by each role's runner."""
+        with self._runner_lock:
+            runners = list(self._runners.values())
+        for runner in runners:
+            try:
+                runner.close()
+            except Exception:
+                logger.exception("Failed to close Claude session")
+
+    def _run_pipeline(
+        self,
+        tasks: list,
+        rollback_fn: Callable[[Snapshot], None],
+        snapshot: Snapshot,
+    ) -> PipelineResult:
         ap = self.config.agent_pipeline
         workspace = AgentWorkspace(self._ws_dir)
         task_desc = self._build_task_description(tasks)
 
         result = PipelineResult(success=False)
 
-        def _run_agent(role: AgentRole, prompt: str) -> AgentResult:
+        def _make_agent(role: AgentRole) -> Callable[[str], AgentResult]:
+            """Specialize the agent call for one role, binding its config and runner."""
             role_cfg = getattr(ap, role.value)
             if not role_cfg.enabled:
-                return AgentResult(
+                return lambda prompt: AgentResult(
                     role=role, success=True, output_text="(skipped)",
                 )
-            # Update live cycle state
-            if self._cycle_state is not None:
-                self._cycle_state.update(
-                    pipeline_agent=role.value,
-                    accumulated_cost=result.total_cost_usd,
-                )
+            role_name = role.value
             agent_runner = self._build_runner_for_agent(role)
-            with self._runner_lock:
-                self._active_runner = agent_runner
-            try:
-                if self._terminated:
-                    return AgentResult(
-                        role=role, success=False, error="Pipeline was terminated",
+            call = agent_runner.send if ap.persistent_sessions else agent_runner.run
+
+            def _run_agent(prompt: str) -> AgentResult:
+                # Update live cycle state
+                if self._cycle_state is not None:
+                    self._cycle_state.update(
+                        pipeline_agent=role_name,
+                        accumulated_cost=result.total_cost_usd,
                     )
-                cr = agent_runner.run(prompt)
-            finally:
                 with self._runner_lock:
-                    self._active_runner = None
-            return AgentResult(
-                role=role,
-                success=cr.success,
-                output_text=cr.result_text,
-                cost_usd=cr.cost_usd,
-                duration_seconds=cr.duration_seconds,
-                error=cr.error,
-            )
+                    if role in self._stopped_roles:
+                        return AgentResult(
+                            role=role, success=False, error="Stopped early",
+                        )
+                    # Drop any terminate() left over from a previous call;
+                    # from here on a stop is delivered to this call
+                    agent_runner.reset()
+                    self._active_runners.add(agent_runner)
+                try:
+                    if self._terminated:
+                        return AgentResult(
+                            role=role, success=False, error="Pipeline was terminated",
+                        )
+                    cr = call(prompt)
+                finally:
+                    with self._runner_lock:
+                        self._active_runners.discard(agent_runner)
+                return AgentResult(
+                    role=role,
+                    success=cr.success,
+                    output_text=cr.result_text,
+                    cost_usd=cr.cost_usd,
+                    duration_seconds=cr.duration_seconds,
+                    error=cr.error,
+                )
+
+            return _run_agent
+
+        agents = {role: _make_agent(role) for role in AgentRole}
+
+        def _record(agent_result: AgentResult) -> None:
+            result.agent_results.append(agent_result)
+            result.total_cost_usd += agent_result.cost_usd
+            result.total_duration_seconds += agent_result.duration_seconds
+            self._update_cost_summary(result, agent_result)
+            if self._cost_ledger is not None:
+                self._cost_ledger.add(agent_result.cost_usd)
 
         max_revisions = ap.max_revisions
         revision = 0
 
-        # --- Planner (runs once, not on revisions) ---
+        # Prompts that do not change across revisions are built once up front.
+        task_block = f"TASK:\n{task_desc}\n\n"
         planner_prompt = (
             f"You are the PLANNER agent.\n\n"
-            f"TASK:\n{task_desc}\n\n"
+            f"{task_block}"
             f"Create a detailed plan for implementing the above task. "
             f"Write the plan to {self._ws_dir}/plan.md"
         )
-        planner_result = _run_agent(AgentRole.PLANNER, planner_prompt)
-        result.agent_results.append(planner_result)
-        result.total_cost_usd += planner_result.cost_usd
-        result.total_duration_seconds += planner_result.duration_seconds
-        self._update_cost_summary(result, planner_result)
-
-        if not planner_result.success:
-            result.error = f"Planner failed: {planner_result.error}"
+        tester_prompt = (
+            f"You are the TESTER agent.\n\n"
+            f"{task_block}"
+            f"Run the test suite and report any failures.\n"
+            f"End your report with either:\n"
+            f"TESTS: PASSED\n"
+            f"or:\n"
+            f"TESTS: FAILED"
+        )
+        reviewer_prompt = (
+            f"You are the REVIEWER agent.\n\n"
+            f"{task_block}"
+            f"Review the code changes. Write your review to "
+            f"{self._ws_dir}/review.md.\n"
+            f"End your review with either:\n"
+            f"VERDICT: APPROVED\n"
+            f"or:\n"
+            f"VERDICT: REVISE"
+        )
+        pipeline_cost_limit = ap.max_pipeline_cost_usd
+        if pipeline_cost_limit <= 0:
+            pipeline_cost_limit = self.config.safety.max_cost_usd_per_hour * 0.5
+
+        # --- Planner (runs once, not on revisions) ---
+        # An empty plan would only send the coder off blind, so the planner
+        # gets one retry before the pipeline fails fast.
+        for planner_attempt in range(1, PLANNER_MAX_ATTEMPTS + 1):
+            planner_result = agents[AgentRole.PLANNER](planner_prompt)
+            _record(planner_result)
+
+            if not planner_result.success:
+                result.error = f"Planner failed: {planner_result.error}"
+                logger.info(result.format_cost_report())
+                return result
+
+            # Read the plan exactly once, before the rollback below can delete
+            # an untracked plan.md; every revision reuses this in-memory copy.
+            plan_text = workspace.read("plan.md") or planner_result.output_text
+            if plan_text.strip():
+                break
+            logger.warning(
+                "Planner produced an empty plan (attempt %d/%d)",
+                planner_attempt, PLANNER_MAX_ATTEMPTS,
+            )
+        else:
+            result.error = "Planner produced an empty plan"
             logger.info(result.format_cost_report())
             return result
 
         # Rollback any file changes from planner
-        rollback_fn(snapshot)
-
-        plan_text = workspace.read("plan.md") or planner_result.output_text
+        self._rollback_if_changed(rollback_fn, snapshot)
+        # Stable content (role, task, plan, instructions) leads every coder
+        # prompt and volatile review feedback is appended strictly after it,
+        # so all revisions share a byte-identical prefix the CLI's prompt
+        # cache can reuse.
+        coder_prompt_prefix = "".join([
+            "You are the CODER agent.\n\n",
+            task_block,
+            "PLAN:\n", plan_text, "\n\n",
+            "Implement the changes described in the plan.",
+        ])
+        # Feedback for the next coder turn.  Kept in memory rather than
+        # round-tripped through review.md, which clean() would wipe anyway.
+        review_text = ""
 
         while True:
             # Cost guard: abort if accumulated cost exceeds pipeline budget
-            pipeline_cost_limit = ap.max_pipeline_cost_usd
-            if pipeline_cost_limit <= 0:
-                pipeline_cost_limit = self.config.safety.max_cost_usd_per_hour * 0.5
-            if result.total_cost_usd >= pipeline_cost_limit:
+            # (shared across all groups when running under run_batch)
+            spent = (
+                self._cost_ledger.total if self._cost_ledger is not None
+                else result.total_cost_usd
+            )
+            if spent >= pipeline_cost_limit:
                 logger.warning(
                     "Pipeline cost guard: $%.2f accumulated (limit $%.2f), aborting",
-                    result.total_cost_usd, pipeline_cost_limit,
+                    spent, pipeline_cost_limit,
                 )
                 result.error = (
                     f"Pipeline cost limit exceeded "
-                    f"(${result.total_cost_usd:.2f} >= ${pipeline_cost_limit:.2f})"
+                    f"(${spent:.2f} >= ${pipeline_cost_limit:.2f})"
                 )
                 logger.info(result.format_cost_report())
                 return result
@@ -280,9 +527,15 @@ class AgentPipeline:
                 result.error = "Pipeline was terminated"
                 return result
 
-            # Read review feedback before cleaning workspace (reviewer wrote it last iteration)
-            review_text = workspace.read("review.md") or ""
             workspace.clean()
+            # Restore cross-iteration context that clean() (and rollback's
+            # git clean) removed, so agents can still consult it on disk.
+            # The last review goes to previous_review.md so a stale review.md
+            # is never mistaken for this iteration's verdict.
+            carried_over = [("plan.md", plan_text)]
+            if review_text:
+                carried_over.append(("previous_review.md", review_text))
+            workspace.write_batch(carried_over)
 
             # --- Coder ---
 
@@ -293,72 +546,75 @@ class AgentPipeline:
                     f"Address the reviewer's feedback in your implementation."
                 )
 
-            coder_prompt = (
-                f"You are the CODER agent.\n\n"
-                f"TASK:\n{task_desc}\n\n"
-                f"PLAN:\n{plan_text}\n"
-                f"{revision_context}\n"
-                f"Implement the changes described in the plan."
-            )
-            coder_result = _run_agent(AgentRole.CODER, coder_prompt)
-            result.agent_results.append(coder_result)
-            result.total_cost_usd += coder_result.cost_usd
-            result.total_duration_seconds += coder_result.duration_seconds
-            self._update_cost_summary(result, coder_result)
+            coder_prompt = coder_prompt_prefix + revision_context
+            coder_result = agents[AgentRole.CODER](coder_prompt)
+            _record(coder_result)
 
             if not coder_result.success:
                 result.error = f"Coder failed: {coder_result.error}"
                 logger.info(result.format_cost_report())
                 return result
 
-            # --- Tester ---
-            tester_prompt = (
-                f"You are the TESTER agent.\n\n"
-                f"TASK:\n{task_desc}\n\n"
-                f"Run the test suite and report any failures."
-            )
-            tester_result = _run_agent(AgentRole.TESTER, tester_prompt)
-            result.agent_results.append(tester_result)
-            result.total_cost_usd += tester_result.cost_usd
-            result.total_duration_seconds += tester_result.duration_seconds
-            self._update_cost_summary(result, tester_result)
-
-            # Fix 7: Check tester result — if the tester CLI crashed, treat
-            # it as a revision-needed signal rather than silently continuing.
-            if not tester_result.success:
-                logger.warning(
-                    "Tester agent failed: %s — treating as revision needed",
-                    tester_result.error,
+            # --- Tester + Reviewer ---
+            # Both consume the post-Coder repo state and neither depends on
+            # the other's output, so run them concurrently to take one agent
+            # round-trip off the critical path of each iteration.  If the
+            # tester reports failures, the revision is already decided, so the
+            # reviewer is stopped early instead of finishing its pass.
+            with self._runner_lock:
+                self._stopped_roles.discard(AgentRole.REVIEWER)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                reviewer_future = pool.submit(agents[AgentRole.REVIEWER], reviewer_prompt)
+                tester_result = agents[AgentRole.TESTER](tester_prompt)
+                tests_failed = (
+                    tester_result.success
+                    and not self._parse_test_outcome(tester_result.output_text)
                 )
+                if tests_failed and not reviewer_future.done():
+                    logger.info("Tester reported failures — stopping reviewer early")
+                    if not reviewer_future.cancel():
+                        self._terminate_runner(AgentRole.REVIEWER)
+                reviewer_cancelled = reviewer_future.cancelled()
+                if reviewer_cancelled:
+                    reviewer_result = AgentResult(
+                        role=AgentRole.REVIEWER, success=False,
+                        output_text="(skipped: tester reported failures)",
+                    )
+                else:
+                    reviewer_result = reviewer_future.result()
+            _record(tester_result)
+            # A reviewer cancelled before it started never invoked the CLI,
+            # so it must not count towards invocations or cost
+            if not reviewer_cancelled:
+                _record(reviewer_result)
+
+            # Fix 7: Check tester result — if the tester CLI crashed or the
+            # tests failed, treat it as a revision-needed signal rather than
+            # silently continuing.
+            if not tester_result.success or tests_failed:
+                if tests_failed:
+                    logger.warning("Tester reported test failures — treating as revision needed")
+                    failure = "Tests failed"
+                    feedback = f"VERDICT: REVISE\nTester reported failures:\n{tester_result.output_text}"
+                else:
+                    logger.warning(
+                        "Tester agent failed: %s — treating as revision needed",
+                        tester_result.error,
+                    )
+                    failure = f"Tester failed: {tester_result.error}"
+                    feedback = f"VERDICT: REVISE\n{failure}"
                 if revision < max_revisions:
                     revision += 1
                     result.revision_count = revision
-                    rollback_fn(snapshot)
-                    workspace.write("review.md", f"VERDICT: REVISE\nTester failed: {tester_result.error}")
+                    self._rollback_if_changed(rollback_fn, snapshot)
+                    review_text = feedback
                     continue
                 else:
-                    result.error = f"Tester failed after exhausting revisions: {tester_result.error}"
+                    result.error = f"{failure} after exhausting revisions"
                     result.revision_count = revision
                     logger.info(result.format_cost_report())
                     return result
 
-            # --- Reviewer ---
-            reviewer_prompt = (
-                f"You are the REVIEWER agent.\n\n"
-                f"TASK:\n{task_desc}\n\n"
-                f"Review the code changes. Write your review to "
-                f"{self._ws_dir}/review.md.\n"
-                f"End your review with either:\n"
-                f"VERDICT: APPROVED\n"
-                f"or:\n"
-                f"VERDICT: REVISE"
-            )
-            reviewer_result = _run_agent(AgentRole.REVIEWER, reviewer_prompt)
-            result.agent_results.append(reviewer_result)
-            result.total_cost_usd += reviewer_result.cost_usd
-            result.total_duration_seconds += reviewer_result.duration_seconds
-            self._update_cost_summary(result, reviewer_result)
-
             # Determine verdict
             if not getattr(ap.reviewer, "enabled", True):
                 # Reviewer disabled -> auto-approve
@@ -382,10 +638,8 @@ class AgentPipeline:
                 result.revision_count = revision
                 if self._cycle_state is not None:
                     self._cycle_state.update(pipeline_revision=revision)
-                rollback_fn(snapshot)
-                # Restore review feedback so the next iteration can read it
-                # (rollback's git clean -fd deletes untracked workspace files)
-                workspace.write("review.md", review_content)
+                self._rollback_if_changed(rollback_fn, snapshot)
+                review_text = review_content
                 # Loop continues with new iteration
             else:
                 # Exhausted revisions
@@ -395,3 +649,48 @@ class AgentPipeline:
                 result.revision_count = revision
                 logger.info(result.format_cost_report())
                 return result
+
+    def run_batch(
+        self,
+        groups: Sequence[Tuple[list, str, Callable[[Snapshot], None], Snapshot]],
+    ) -> List[PipelineResult]:
+        """Run independent task groups through concurrent pipelines.
+
+        Each group is a ``(tasks, target_dir, rollback_fn, snapshot)`` tuple.
+        Groups edit and roll back their working tree independently, so every
+        group needs its own target_dir (e.g. a git worktree); each clone gets
+        its agent workspace under that directory.  All groups share this
+        pipeline's cost budget, and terminate() stops every group.
+
+        Results are returned in the same order as *groups*.
+        """
+        if not groups:
+            return []
+        target_dirs = [str(Path(g[1]).resolve()) for g in groups]
+        if len(set(target_dirs)) != len(target_dirs):
+            raise ValueError(
+                "run_batch requires a distinct target_dir per task group; "
+                "concurrent pipelines cannot share a working tree"
+            )
+
+        ledger = _CostLedger()
+        pipelines = []
+        for _, target_dir, _, _ in groups:
+            pipeline = AgentPipeline(dataclasses.replace(self.config, target_dir=target_dir))
+            pipeline._cost_ledger = ledger
+            pipeline._terminated = self._terminated
+            pipelines.append(pipeline)
+        with self._runner_lock:
+            self._batch_pipelines = pipelines
+
+        max_workers = max(1, min(len(groups), self.config.parallel.max_workers))
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(pipeline.run, tasks, rollback_fn, snapshot)
+                    for pipeline, (tasks, _, rollback_fn, snapshot) in zip(pipelines, groups)
+                ]
+                return [f.result() for f in futures]
+        finally:
+            with self._runner_lock:
+                self._batch_pipelines = []
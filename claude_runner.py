@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
+import queue
+import random
+import re
 import signal
 import subprocess
 import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
-from config_schema import Config
+from config_schema import _DATACLASS_SLOTS, Config
 from process_utils import kill_process_group
 
+# orjson is an optional, faster drop-in for json.loads.  Its decode error
+# subclasses json.JSONDecodeError, so callers catch the same exception.
+_json_loads: Callable[[Any], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# raw_decode keeps no state on the decoder, so one instance serves every call
+_JSON_DECODER = json.JSONDecoder()
+
 logger = logging.getLogger(__name__)
 
 # Circuit breaker defaults
@@ -40,6 +58,15 @@ _CB_ERROR_PATTERNS = (
     "server error",
 )
 
+# One case-insensitive pass over stderr instead of lowering it and testing
+# each pattern separately.
+_CB_ERROR_RE = re.compile("|".join(map(re.escape, _CB_ERROR_PATTERNS)), re.IGNORECASE)
+_RATE_LIMIT_RE = re.compile(r"rate limit|429|too many requests", re.IGNORECASE)
+# A whole line holding one {...} value; the regex engine picks these out
+# without splitting stdout into lines or stripping each one.
+_JSON_LINE_RE = re.compile(r"^[ \t]*(\{.*\})[ \t\r]*$", re.MULTILINE)
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after[: ]\s*(\d+)", re.IGNORECASE)
+
 
 class CircuitBreaker:
     """Circuit breaker to temporarily disable API calls after repeated failures.
@@ -49,7 +76,9 @@ class CircuitBreaker:
       - OPEN: calls are blocked, returns failure immediately
       - HALF_OPEN: allows a limited number of probe calls to test recovery
 
-    Thread-safe via a threading.Lock.
+    Thread-safe via a threading.Lock.  The common CLOSED case is checked
+    without it: _state is a single attribute read, and every transition
+    out of CLOSED still happens under the lock.
     """
 
     STATE_CLOSED = "closed"
@@ -119,6 +148,8 @@ class CircuitBreaker:
 
     def allow_request(self) -> bool:
         """Check if a request is allowed through the circuit breaker."""
+        if self._state == self.STATE_CLOSED:
+            return True
         with self._lock:
             state = self._get_state()
             if state == self.STATE_CLOSED:
@@ -133,6 +164,8 @@ class CircuitBreaker:
 
     def record_success(self) -> None:
         """Record a successful call — resets the circuit breaker to CLOSED."""
+        if self._state == self.STATE_CLOSED and self._consecutive_failures == 0:
+            return  # nothing to reset
         with self._lock:
             if self._state != self.STATE_CLOSED:
                 logger.info(
@@ -195,7 +228,263 @@ class CircuitBreaker:
             self.recovery_timeout = self._base_recovery_timeout
 
 
-@dataclass
+class ClaudeSessionError(Exception):
+    """Raised when a persistent Claude CLI session cannot complete a prompt."""
+
+
+class ClaudeSession:
+    """A long-lived ``claude`` process that accepts prompts over stdin.
+
+    The CLI runs with stream-json input and output: each prompt is written
+    as one JSON line and answered by a stream of JSON events ending with a
+    ``{"type": "result", ...}`` event.  Successive prompts share the process,
+    its conversation and its warm prompt cache instead of paying CLI
+    startup on every call.
+    """
+
+    STDERR_TAIL_LINES = 50
+
+    def __init__(self, cmd: List[str], cwd: str):
+        self._cmd = cmd
+        self._cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr_tail: Deque[str] = deque(maxlen=self.STDERR_TAIL_LINES)
+        self._last_total_cost = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> None:
+        """Spawn the CLI process and the threads draining its output pipes."""
+        self._proc = subprocess.Popen(
+            self._cmd,
+            cwd=self._cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        threading.Thread(
+            target=self._pump_stdout, args=(self._proc.stdout,), daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._pump_stderr, args=(self._proc.stderr,), daemon=True,
+        ).start()
+        logger.info("Started persistent Claude CLI session (pid=%s)", self._proc.pid)
+
+    def _pump_stdout(self, stream: IO[str]) -> None:
+        try:
+            for line in stream:
+                self._lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._lines.put(None)  # EOF marker
+
+    def _pump_stderr(self, stream: IO[str]) -> None:
+        try:
+            for line in stream:
+                self._stderr_tail.append(line)
+        except (OSError, ValueError):
+            pass
+
+    def send(self, prompt: str, timeout: float) -> Dict[str, Any]:
+        """Send one prompt and return the CLI's result event for it.
+
+        Raises subprocess.TimeoutExpired if no result arrives within
+        *timeout* seconds, and ClaudeSessionError if the process is gone.
+        """
+        proc = self._proc
+        if proc is None or proc.stdin is None or proc.poll() is not None:
+            raise ClaudeSessionError("Claude CLI session is not running")
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        try:
+            proc.stdin.write(json.dumps(message) + "\n")
+            proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise ClaudeSessionError(f"Failed to write prompt to Claude CLI session: {e}")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self._cmd, timeout)
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                raise ClaudeSessionError(
+                    f"Claude CLI session exited unexpectedly: "
+                    f"{''.join(self._stderr_tail).strip()}"
+                )
+            line = line.strip()
+            if not line.startswith("{"):
+                continue
+            try:
+                event = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(event, dict) and event.get("type") == "result":
+                return self._with_prompt_cost(event)
+
+    def _with_prompt_cost(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert the session-cumulative total_cost_usd into this prompt's share."""
+        total = event.get("total_cost_usd")
+        if isinstance(total, (int, float)):
+            event = dict(event, total_cost_usd=max(0.0, total - self._last_total_cost))
+            self._last_total_cost = total
+        return event
+
+    def close(self) -> None:
+        """End the session: close stdin so the CLI exits, then make sure it is gone."""
+        proc = self._proc
+        if proc is None:
+            return
+        self._proc = None
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            kill_process_group(proc)
+
+    def kill(self) -> None:
+        """Kill the session process immediately."""
+        proc = self._proc
+        if proc is not None:
+            kill_process_group(proc)
+
+
+class SessionPool:
+    """Warm ClaudeSession processes checked out one prompt at a time.
+
+    At most *size* sessions exist at once.  Returned sessions wait on an
+    idle list and are closed once unused for *idle_timeout* seconds, so a
+    quiet runner does not keep CLI processes around indefinitely.  Idle
+    sessions are reaped whenever the pool is touched, and a daemon timer
+    reaps them while the pool has idle sessions but no traffic.
+    """
+
+    def __init__(self, factory: Callable[[], ClaudeSession], size: int,
+                 idle_timeout: float):
+        self._factory = factory
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[float, ClaudeSession]] = []  # (last_used, session)
+        self._in_use: Set[ClaudeSession] = set()
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
+
+    def _arm_reaper_locked(self) -> None:
+        """Schedule reap() for when the oldest idle session expires (lock held)."""
+        if not self._idle or (self._reaper is not None and self._reaper.is_alive()):
+            return
+        oldest = min(last_used for last_used, _ in self._idle)
+        delay = max(0.0, oldest + self.idle_timeout - time.monotonic())
+        self._reaper = threading.Timer(delay, self._reap_and_rearm)
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _reap_and_rearm(self) -> None:
+        self.reap()
+        with self._lock:
+            self._reaper = None
+            self._arm_reaper_locked()
+
+    def _take_stale_locked(self) -> List[ClaudeSession]:
+        """Remove idle sessions past idle_timeout or already dead (lock held)."""
+        cutoff = time.monotonic() - self.idle_timeout
+        keep, stale = [], []
+        for last_used, session in self._idle:
+            if last_used >= cutoff and session.alive:
+                keep.append((last_used, session))
+            else:
+                stale.append(session)
+        self._idle = keep
+        return stale
+
+    def acquire(self) -> Optional[ClaudeSession]:
+        """Check out a session, starting one if below capacity.
+
+        Returns None when every session is already checked out.
+        """
+        session = None
+        with self._lock:
+            stale = self._take_stale_locked()
+            if self._idle:
+                _, session = self._idle.pop()  # most recently used is warmest
+            elif len(self._in_use) >= self.size:
+                for s in stale:
+                    s.close()
+                return None
+            else:
+                session = self._factory()
+            self._in_use.add(session)
+        for s in stale:
+            s.close()
+        if not session.alive:
+            try:
+                session.start()
+            except OSError:
+                with self._lock:
+                    self._in_use.discard(session)
+                raise
+        return session
+
+    def release(self, session: ClaudeSession, healthy: bool = True) -> None:
+        """Return a checked-out session; unhealthy or dead ones are closed."""
+        with self._lock:
+            self._in_use.discard(session)
+            if healthy and session.alive:
+                self._idle.append((time.monotonic(), session))
+                self._arm_reaper_locked()
+                return
+        session.close()
+
+    def reap(self) -> int:
+        """Close idle sessions unused for idle_timeout; return how many."""
+        with self._lock:
+            stale = self._take_stale_locked()
+        for session in stale:
+            session.close()
+        return len(stale)
+
+    def kill_in_use(self) -> None:
+        """Kill every checked-out session (used by terminate())."""
+        with self._lock:
+            sessions = list(self._in_use)
+        for session in sessions:
+            session.kill()
+
+    def close(self) -> None:
+        """Close all idle sessions.  Checked-out ones close on release."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.cancel()
+        for _, session in idle:
+            session.close()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_dir(path: str) -> str:
+    """Resolve symlinks in an absolute --add-dir path, memoized per path.
+
+    Callers pass the same worktree directories on every call, so the
+    filesystem walk in Path.resolve() only needs to happen once each.
+    """
+    return str(Path(path).resolve())
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ClaudeResult:
     success: bool
     result_text: str = ""
@@ -203,35 +492,127 @@ class ClaudeResult:
     duration_seconds: float = 0.0
     raw_json: Optional[Dict[str, Any]] = None
     error: str = ""
+    session_id: str = ""
 
 
 class ClaudeRunner:
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, session_id: Optional[str] = None,
+                 keep_raw: bool = False):
         self.config = config
+        # The full CLI response can hold a long tool-call transcript; only
+        # keep it on ClaudeResult.raw_json when a caller asks for it.
+        self.keep_raw = keep_raw
+        # When set, every run() continues the same CLI conversation: the
+        # first call creates it with --session-id, later ones --resume it.
+        self.session_id = session_id
+        self._has_run = False
+        self._cmd_flags: Tuple[Optional[Tuple[str, str, int]], Tuple[str, ...]] = (None, ())
         self.max_retries = config.claude.max_retries
         self.retry_delays = config.claude.retry_delays
         self.rate_limit_base_delay = config.claude.rate_limit_base_delay
         self.rate_limit_multiplier = config.claude.rate_limit_multiplier
+        self.rate_limit_max_delay = config.claude.rate_limit_max_delay
+        # Empty means every nonzero exit code is worth another attempt
+        self.retryable_exit_codes = frozenset(config.claude.retryable_exit_codes)
+        # Written only by the thread in run() and read by terminate().  A
+        # single attribute load/store is atomic, so no lock is needed.
         self._current_process: subprocess.Popen | None = None
-        self._process_lock = threading.Lock()
         self._terminated = False  # Set by terminate() to stop retry loop
+        self._wake = threading.Event()  # Set by terminate() to cut a backoff short
+        self._pool = SessionPool(
+            lambda: ClaudeSession(self._build_session_command(), self.config.target_dir),
+            size=max(1, config.claude.session_pool_size),
+            idle_timeout=config.claude.session_idle_timeout,
+        )
         self.circuit_breaker = CircuitBreaker(
             on_open=self._on_circuit_breaker_open,
         )
+        # Child runners of an in-flight run_many(); replaced, never mutated,
+        # so terminate() can read it without a lock.
+        self._batch_runners: List[ClaudeRunner] = []
 
     def _build_command(self, prompt: str) -> List[str]:
-        """Build the CLI command list."""
+        """Build the CLI command list.
+
+        The flags after the prompt are cached and rebuilt only when the
+        command, model or max_turns settings change (workers adjust
+        max_turns between calls).
+        """
+        cc = self.config.claude
+        key = (cc.command, cc.resolved_model or cc.model, cc.max_turns)
+        cached_key, flags = self._cmd_flags
+        if cached_key != key:
+            flags = ("--model", key[1], "--max-turns", str(key[2]), "--output-format", "json")
+            self._cmd_flags = (key, flags)
+        cmd = [cc.command, "-p", prompt, *flags]
+        if self.session_id:
+            flag = "--resume" if self._has_run else "--session-id"
+            cmd.extend([flag, self.session_id])
+        return cmd
+
+    def _build_session_command(self) -> List[str]:
+        """Build the CLI command list for a persistent stream-json session."""
         cc = self.config.claude
         model = cc.resolved_model or cc.model
-        cmd = [
+        return [
             cc.command,
-            "-p", prompt,
+            "-p",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
             "--model", model,
             "--max-turns", str(cc.max_turns),
-            "--output-format", "json",
         ]
-        return cmd
+
+    def send(self, prompt: str) -> ClaudeResult:
+        """Run a prompt through a warm session from the pool.
+
+        Prompts that reuse a session continue its conversation.  If no
+        session is free or the session cannot be used, falls back to a
+        cold one-shot spawn with its usual retry handling.
+        """
+        try:
+            return self._send(prompt)
+        finally:
+            self.reset()
+
+    def _send(self, prompt: str) -> ClaudeResult:
+        if self._terminated:
+            return self._terminated_result()
+        if not self.circuit_breaker.allow_request():
+            return self._circuit_open_result()
+        session = None
+        try:
+            session = self._pool.acquire()
+            if session is None:
+                logger.debug("No idle Claude session available; using a cold spawn")
+                return self._run_cold(prompt)
+            data = session.send(prompt, timeout=self.config.claude.timeout_seconds)
+        except subprocess.TimeoutExpired:
+            if session is not None:
+                self._pool.release(session, healthy=False)
+            self.circuit_breaker.record_failure()
+            return ClaudeResult(
+                success=False,
+                error=f"Claude CLI timed out after {self.config.claude.timeout_seconds}s",
+            )
+        except (OSError, ClaudeSessionError) as e:
+            if session is not None:
+                self._pool.release(session, healthy=False)
+            if self._terminated:
+                return self._terminated_result()
+            logger.warning(
+                "Persistent Claude session failed (%s); falling back to a one-shot run", e,
+            )
+            return self._run_cold(prompt)
+        self._pool.release(session)
+        self.circuit_breaker.record_success()
+        return self._result_from_json(data)
+
+    def close(self) -> None:
+        """Shut down the runner's idle persistent sessions."""
+        self._pool.close()
 
     def _on_circuit_breaker_open(self, failures: int, recovery_timeout: float) -> None:
         """Notification callback invoked when the circuit breaker opens.
@@ -263,157 +644,269 @@ class ClaudeRunner:
         """Kill a subprocess and its entire process group."""
         kill_process_group(proc)
 
+    def _backoff(self, delay: float) -> None:
+        """Wait before a retry, returning early if terminate() is called."""
+        self._wake.wait(delay)
+
+    def _rate_limit_delay(self, stderr: str, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited call.
+
+        Honors a Retry-After hint in stderr.  Otherwise uses full jitter, a
+        uniform draw up to the capped exponential delay, so runners sharing
+        a quota do not all retry at the same moment.
+        """
+        match = _RETRY_AFTER_RE.search(stderr)
+        if match:
+            return min(self.rate_limit_max_delay, int(match.group(1)))
+        ceiling = self.rate_limit_base_delay * (self.rate_limit_multiplier ** attempt)
+        return random.uniform(0, min(self.rate_limit_max_delay, ceiling))
+
     @staticmethod
     def _is_circuit_breaker_error(stderr: str) -> bool:
-        """Check if stderr indicates a rate limit or server error."""
-        stderr_lower = stderr.lower()
-        return any(pat in stderr_lower for pat in _CB_ERROR_PATTERNS)
+        """Check if stderr indicates a rate limit or server error.
+
+        Matching is case-insensitive, so stderr is never copied to lowercase.
+        """
+        return _CB_ERROR_RE.search(stderr) is not None
 
     def terminate(self) -> None:
         """Terminate any currently running Claude subprocess.
 
         Thread-safe: can be called from a different thread than the one
         executing run().  Also sets _terminated to prevent the retry loop
-        from spawning new processes after the kill.
+        from spawning new processes after the kill.  The flag is cleared
+        when the current call returns, so a terminate() that lands just
+        before a call starts stops that call instead of being lost.
         """
         self._terminated = True
-        with self._process_lock:
-            proc = self._current_process
+        self._wake.set()
+        proc = self._current_process
         if proc is not None:
             logger.warning("Terminating running Claude subprocess (pid=%s)", proc.pid)
             self._kill_process(proc)
+        self._pool.kill_in_use()
+        for child in self._batch_runners:
+            child.terminate()
+
+    def reset(self) -> None:
+        """Clear a previous terminate() so the next call runs normally."""
+        self._terminated = False
+        self._wake.clear()
+
+    @staticmethod
+    def _terminated_result() -> ClaudeResult:
+        return ClaudeResult(
+            success=False,
+            error="Terminated by signal — aborting retries",
+        )
 
-    def _parse_json_response(self, stdout: str) -> Dict[str, Any]:
+    @staticmethod
+    def _decode_object_at(text: str, pos: int) -> Optional[Dict[str, Any]]:
+        """Decode a top-level JSON object starting at *pos*, or return None.
+
+        An object followed by ',', '}' or ']' is a nested value of a larger
+        object rather than the CLI's result, so it is rejected too.
+        """
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(obj, dict):
+            return None
+        if text[end:end + 64].lstrip()[:1] in (",", "}", "]"):
+            return None
+        return obj
+
+    def _parse_json_response(self, stdout: str, try_lines: bool = True) -> Dict[str, Any]:
         """Parse JSON from Claude CLI output.
 
         The CLI may print banner/info lines before the actual JSON,
-        and log/warning lines after it. We extract only the first
-        valid top-level JSON object.
+        and log/warning lines after it.  The result object comes last,
+        so candidates are tried from the end of the output backwards.
+        Pass try_lines=False when every whole line was already tried
+        (as _stream_output does) to go straight to the raw_decode scan.
         """
-        if not stdout or not stdout.strip():
+        stripped = stdout.strip() if stdout else ""
+        if not stripped:
             raise ValueError("Claude CLI produced empty output (no JSON to parse)")
 
-        # Strategy 1a: Try each line as a complete JSON object starting with '{'.
-        # This handles the common case where the JSON is on its own line.
-        for line in stdout.splitlines():
-            line = line.strip()
-            if not line or not line.startswith("{"):
-                continue
+        # Fast path: the whole output is one JSON object with no banner or
+        # trailing log lines around it.
+        if stripped.startswith("{") and stripped.endswith("}"):
             try:
-                obj = json.loads(line)
+                obj = _json_loads(stripped)
                 if isinstance(obj, dict):
                     return obj
             except json.JSONDecodeError:
                 pass
 
-        # Strategy 1b: Try finding JSON mid-line (preceded by text on the same line).
-        for line in stdout.splitlines():
-            line = line.strip()
-            brace_pos = line.find("{")
-            if brace_pos <= 0:
-                continue
-            # Try from each '{' position after the start of the line
-            while brace_pos != -1:
-                candidate = line[brace_pos:]
+        # Strategy 1: Try each line, last first, as a complete JSON object.
+        # This handles the common case where the JSON is on its own line.
+        if try_lines:
+            for line in reversed(_JSON_LINE_RE.findall(stdout)):
                 try:
-                    obj = json.loads(candidate)
+                    obj = _json_loads(line)
                     if isinstance(obj, dict):
                         return obj
                 except json.JSONDecodeError:
                     pass
-                brace_pos = line.find("{", brace_pos + 1)
 
-        # Strategy 2: Fall back to raw_decode for multi-line JSON.
-        # Try parsing from any '{' position to handle JSON starting mid-line.
-        decoder = json.JSONDecoder()
-        for i, ch in enumerate(stdout):
-            if ch != "{":
-                continue
-            try:
-                obj, end = decoder.raw_decode(stdout, i)
-                if isinstance(obj, dict):
-                    return obj
-            except json.JSONDecodeError:
-                pass
+        # Strategy 2: raw_decode from each '{', last first, to handle JSON
+        # that starts mid-line or spans several lines.  rfind() jumps
+        # between braces in C, so text without braces costs no Python work.
+        # The result usually opens at column 0, so that brace is tried
+        # before walking back through every other one.
+        line_start = stdout.rfind("\n{")
+        if line_start != -1:
+            obj = self._decode_object_at(stdout, line_start + 1)
+            if obj is not None:
+                return obj
+        elif stdout.startswith("{"):
+            obj = self._decode_object_at(stdout, 0)
+            if obj is not None:
+                return obj
+
+        pos = len(stdout)
+        while True:
+            pos = stdout.rfind("{", 0, pos)
+            if pos == -1:
+                break
+            obj = self._decode_object_at(stdout, pos)
+            if obj is not None:
+                return obj
 
         raise ValueError("No JSON object found in Claude CLI output")
 
     def run(self, prompt: str,
             add_dirs: Optional[List[str]] = None) -> ClaudeResult:
-        """Run Claude CLI with the given prompt and return parsed result."""
-        self._terminated = False  # Reset on each new run
+        """Run Claude CLI with the given prompt and return parsed result.
+
+        With claude.session_pool_size > 0 the prompt goes to a warm pooled
+        session; calls with add_dirs always spawn a fresh process since
+        the extra directories are fixed when a session starts.
+        """
+        if self.config.claude.session_pool_size > 0 and not add_dirs:
+            return self.send(prompt)
+        try:
+            return self._run_cold(prompt, add_dirs)
+        finally:
+            self.reset()
+
+    def run_many(self, prompts: List[str],
+                 max_workers: Optional[int] = None) -> List[ClaudeResult]:
+        """Run independent prompts concurrently and return results in order.
+
+        Each prompt gets its own child runner (and CLI process) so the
+        per-call process state does not collide; the children share this
+        runner's circuit breaker.  max_workers defaults to
+        parallel.max_workers.
+        """
+        if not prompts:
+            return []
+        children = []
+        for _ in prompts:
+            child = ClaudeRunner(self.config, keep_raw=self.keep_raw)
+            child.circuit_breaker = self.circuit_breaker
+            children.append(child)
+        self._batch_runners = children
+
+        workers = max(1, min(len(prompts), max_workers or self.config.parallel.max_workers))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._run_child, child, prompt)
+                    for child, prompt in zip(children, prompts)
+                ]
+                return [f.result() for f in futures]
+        finally:
+            self._batch_runners = []
+            for child in children:
+                child.close()
+            self.reset()
+
+    def _run_child(self, child: ClaudeRunner, prompt: str) -> ClaudeResult:
+        """Run one run_many() prompt unless the batch was terminated."""
+        if self._terminated:
+            return self._terminated_result()
+        return child.run(prompt)
+
+    def _run_cold(self, prompt: str,
+                  add_dirs: Optional[List[str]] = None) -> ClaudeResult:
+        """Spawn a one-shot Claude CLI process, retrying transient failures."""
         cmd = self._build_command(prompt)
         # Always use the main project dir as cwd (macOS sandbox restriction:
         # sandbox_apply fails with exit 71 when cwd is outside the project).
         cwd = self.config.target_dir
         if add_dirs:
-            for d in add_dirs:
-                cmd.extend(["--add-dir", str(Path(d).resolve())])
+            # Overlapping lists from callers collapse to one flag per directory
+            for d in dict.fromkeys(_resolve_dir(os.path.abspath(d)) for d in add_dirs):
+                cmd.extend(["--add-dir", d])
 
         logger.info("Running Claude CLI in %s", cwd)
-        logger.debug("Command: %s", " ".join(cmd))
+        if logger.isEnabledFor(logging.DEBUG):
+            # The prompt can be long; only join it when the line is emitted
+            logger.debug("Command: %s", " ".join(cmd))
 
         # Check circuit breaker before attempting the call
         if not self.circuit_breaker.allow_request():
-            logger.warning(
-                "Circuit breaker is OPEN — blocking Claude API call to prevent "
-                "further cost accumulation"
-            )
-            return ClaudeResult(
-                success=False,
-                error="Circuit breaker is open: too many consecutive API failures. "
-                      "Will automatically retry after recovery timeout.",
-            )
+            return self._circuit_open_result()
+
+        max_retries = self.max_retries
+        timeout = self.config.claude.timeout_seconds
+        # Delay before each retry, repeating the last configured one as needed
+        # (an empty list means retry immediately)
+        delays: List[float] = list(self.retry_delays[:max_retries])
+        last_delay = self.retry_delays[-1] if self.retry_delays else 0
+        delays += [last_delay] * (max_retries - len(delays))
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(max_retries + 1):
             # If terminate() was called (e.g. signal handler), stop retrying
             if self._terminated:
-                return ClaudeResult(
-                    success=False,
-                    error="Terminated by signal — aborting retries",
-                )
+                return self._terminated_result()
             try:
+                # subprocess only takes its posix_spawn path with no cwd, no
+                # new session/process group and close_fds=False, none of which
+                # fit here.  On Linux the default path already uses vfork(), so
+                # the parent's page tables are not copied either way.
                 popen_proc = subprocess.Popen(
                     cmd,
                     cwd=cwd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
                     start_new_session=True,
                 )
-                with self._process_lock:
-                    self._current_process = popen_proc
+                self._current_process = popen_proc
+                if self.session_id and not self._has_run:
+                    # The CLI creates the session as soon as it starts, so
+                    # retries and later calls must resume it; passing
+                    # --session-id again would be rejected.  Flags follow the
+                    # prompt at index 2.
+                    self._has_run = True
+                    cmd[cmd.index("--session-id", 3)] = "--resume"
+                # terminate() sets the flag before reading _current_process,
+                # so a call that raced with the spawn is caught here.
+                if self._terminated:
+                    self._kill_process(popen_proc)
                 try:
-                    stdout, stderr = popen_proc.communicate(
-                        timeout=self.config.claude.timeout_seconds,
+                    raw_stdout, stderr, streamed_data = self._stream_output(
+                        popen_proc, timeout,
                     )
-                except subprocess.TimeoutExpired:
-                    self._kill_process(popen_proc)
-                    raise
                 finally:
-                    with self._process_lock:
-                        self._current_process = None
-
-                # Build a CompletedProcess-like namespace for downstream code
-                class _ProcResult:
-                    pass
-                proc = _ProcResult()
-                proc.returncode = popen_proc.returncode
-                proc.stdout = stdout
-                proc.stderr = stderr
+                    self._current_process = None
+                returncode = popen_proc.returncode
             except subprocess.TimeoutExpired:
-                if attempt < self.max_retries:
-                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                if attempt < max_retries:
+                    delay = delays[attempt]
                     logger.warning(
                         "Claude CLI timed out (attempt %d/%d), retrying in %ds",
-                        attempt + 1, self.max_retries + 1, delay,
+                        attempt + 1, max_retries + 1, delay,
                     )
-                    time.sleep(delay)
+                    self._backoff(delay)
                     continue
                 self.circuit_breaker.record_failure()
                 return ClaudeResult(
                     success=False,
-                    error=f"Claude CLI timed out after {self.config.claude.timeout_seconds}s",
+                    error=f"Claude CLI timed out after {timeout}s",
                 )
             except FileNotFoundError:
                 return ClaudeResult(
@@ -421,70 +914,153 @@ class ClaudeRunner:
                     error=f"Claude CLI command not found: {self.config.claude.command}",
                 )
             except OSError as e:
-                if attempt < self.max_retries:
-                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                if attempt < max_retries:
+                    delay = delays[attempt]
                     logger.warning(
                         "Claude CLI OS error (attempt %d/%d): %s, retrying in %ds",
-                        attempt + 1, self.max_retries + 1, e, delay,
+                        attempt + 1, max_retries + 1, e, delay,
                     )
-                    time.sleep(delay)
+                    self._backoff(delay)
                     continue
                 return ClaudeResult(
                     success=False,
                     error=f"Failed to run Claude CLI: {e}",
                 )
 
-            if proc.returncode != 0:
-                if attempt < self.max_retries:
-                    stderr_lower = proc.stderr.lower()
-                    if "rate limit" in stderr_lower or "429" in stderr_lower or "too many requests" in stderr_lower:
-                        delay = self.rate_limit_base_delay * (self.rate_limit_multiplier ** attempt)
+            if returncode != 0:
+                retryable = (not self.retryable_exit_codes
+                             or returncode in self.retryable_exit_codes)
+                if attempt < max_retries and retryable:
+                    if _RATE_LIMIT_RE.search(stderr):
+                        delay = self._rate_limit_delay(stderr, attempt)
                         logger.warning(
-                            "Rate limited (attempt %d/%d), backing off %ds",
-                            attempt + 1, self.max_retries + 1, delay,
+                            "Rate limited (attempt %d/%d), backing off %.1fs",
+                            attempt + 1, max_retries + 1, delay,
                         )
                     else:
-                        delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                        delay = delays[attempt]
                         logger.warning(
                             "Claude CLI exited with code %d (attempt %d/%d), retrying in %ds",
-                            proc.returncode, attempt + 1, self.max_retries + 1, delay,
+                            returncode, attempt + 1, max_retries + 1, delay,
                         )
-                    time.sleep(delay)
+                    self._backoff(delay)
                     continue
                 # All retries exhausted — update circuit breaker if the error
                 # matches rate-limit or server-error patterns.
-                if self._is_circuit_breaker_error(proc.stderr):
+                if self._is_circuit_breaker_error(stderr):
                     self.circuit_breaker.record_failure()
                 return ClaudeResult(
                     success=False,
-                    error=f"Claude CLI exited with code {proc.returncode}: {proc.stderr.strip()}",
+                    error=f"Claude CLI exited with code {returncode}: {stderr.strip()}",
                 )
 
             # Parse JSON before exiting the loop — retry on truncated output
             try:
-                data = self._parse_json_response(proc.stdout)
+                if streamed_data is not None:
+                    data = streamed_data
+                else:
+                    stdout = raw_stdout.decode("utf-8", errors="replace")
+                    data = self._parse_json_response(stdout, try_lines=False)
             except (ValueError, json.JSONDecodeError) as e:
-                stdout_stripped = proc.stdout.strip()
+                stdout_stripped = stdout.strip()
                 looks_truncated = "{" in stdout_stripped and not stdout_stripped.endswith("}")
-                if looks_truncated and attempt < self.max_retries:
-                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
+                if looks_truncated and attempt < max_retries:
+                    delay = delays[attempt]
                     logger.warning(
                         "Output appears truncated (attempt %d/%d), retrying in %ds",
-                        attempt + 1, self.max_retries + 1, delay,
+                        attempt + 1, max_retries + 1, delay,
                     )
-                    time.sleep(delay)
+                    self._backoff(delay)
                     continue
                 return ClaudeResult(
                     success=False,
                     error=f"Failed to parse Claude CLI output: {e}",
-                    result_text=proc.stdout,
+                    result_text=stdout,
                 )
 
             break  # successful parse — exit retry loop
 
         # Successful API call — reset circuit breaker
         self.circuit_breaker.record_success()
+        return self._result_from_json(data)
+
+    def _stream_output(
+        self, popen_proc: subprocess.Popen, timeout: float,
+    ) -> Tuple[bytes, str, Optional[Dict[str, Any]]]:
+        """Read the CLI's output as it arrives, decoding the result line early.
+
+        stdout is consumed line by line on this thread while a helper thread
+        drains stderr, so a one-line JSON result is decoded as soon as it is
+        printed.  Pipes are binary: JSON lines go to the parser as bytes and
+        the rest of stdout is returned undecoded, since it is only needed
+        when no result line was found.  Returns (stdout, stderr, data),
+        where data is the last line holding a JSON object, or None if there
+        was none.  Kills the process group and raises
+        subprocess.TimeoutExpired if the CLI outlives *timeout* seconds.
+        """
+        out_pipe, err_pipe = popen_proc.stdout, popen_proc.stderr
+        if out_pipe is None or err_pipe is None:
+            raise ValueError("_stream_output needs piped stdout and stderr")
+        deadline = time.monotonic() + timeout
+        timed_out = threading.Event()
+
+        def _on_timeout() -> None:
+            timed_out.set()
+            self._kill_process(popen_proc)
+
+        stderr_chunks: List[bytes] = []
+
+        def _drain_stderr() -> None:
+            try:
+                stderr_chunks.extend(err_pipe)
+            except (OSError, ValueError):
+                pass
+
+        stderr_reader = threading.Thread(target=_drain_stderr, daemon=True)
+        stderr_reader.start()
+        watchdog = threading.Timer(timeout, _on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+
+        stdout_lines: List[bytes] = []
+        data: Optional[Dict[str, Any]] = None
+        try:
+            for line in out_pipe:
+                stdout_lines.append(line)
+                stripped = line.strip()
+                if stripped.startswith(b"{"):
+                    try:
+                        obj = _json_loads(stripped)
+                    except ValueError:  # JSONDecodeError or invalid UTF-8
+                        continue
+                    if isinstance(obj, dict):
+                        data = obj
+            popen_proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            self._kill_process(popen_proc)
+            raise
+        finally:
+            watchdog.cancel()
+        stderr_reader.join(timeout=5)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(popen_proc.args, timeout)
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+        return b"".join(stdout_lines), stderr, data
+
+    @staticmethod
+    def _circuit_open_result() -> ClaudeResult:
+        logger.warning(
+            "Circuit breaker is OPEN — blocking Claude API call to prevent "
+            "further cost accumulation"
+        )
+        return ClaudeResult(
+            success=False,
+            error="Circuit breaker is open: too many consecutive API failures. "
+                  "Will automatically retry after recovery timeout.",
+        )
 
+    def _result_from_json(self, data: Dict[str, Any]) -> ClaudeResult:
+        """Build a successful ClaudeResult from the CLI's JSON result object."""
         if "result" not in data:
             logger.warning(
                 "Claude CLI JSON response missing 'result' field; "
@@ -515,6 +1091,7 @@ class ClaudeRunner:
             result_text=result_text,
             cost_usd=cost_usd,
             duration_seconds=duration,
-            raw_json=data,
+            raw_json=data if self.keep_raw else None,
             error=error_msg,
+            session_id=data.get("session_id") or self.session_id or "",
         )
@@ -2,20 +2,87 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses
+import functools
 import logging
 import os
-import subprocess
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, get_type_hints
+from typing import Dict, List, Optional, Tuple, Union, get_args, get_origin, get_type_hints
 
 import yaml
 
+# libyaml's C loader parses the same documents several times faster
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain dataclasses
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Defaults for list-valued fields; each config instance gets its own list copy
+_DEFAULT_RETRY_DELAYS = (2, 8, 32)
+_DEFAULT_TODO_PATTERNS = ("TODO", "FIXME", "HACK")
+_DEFAULT_EXCLUDE_DIRS = ("__pycache__", ".git", "node_modules", ".venv", "venv")
+_DEFAULT_PROTECTED_FILES = ("main.py", "config.yaml")
+
+# Lookup tables used by validate_config
+_KNOWN_MODEL_ALIASES = frozenset({
+    "opus", "sonnet", "haiku",
+    "claude-opus-4-6", "claude-sonnet-4-20250514",
+    "claude-haiku-3-5-20241022",
+})
+_KNOWN_WEBHOOK_TYPES = frozenset({"slack", "discord", "generic"})
+_PATH_FIELDS = ("history_file", "lock_file", "state_dir", "feedback_dir")  # under paths.
+_AGENT_ROLES = ("planner", "coder", "tester", "reviewer")
+_REQUIRED_ROLE_ATTRS = ("model", "max_turns", "timeout_seconds")
+_WS_RE = re.compile(r"\s")  # any whitespace inside a model name
+# (section, field, zero allowed) for numeric fields that must be positive,
+# or non-negative where zero is allowed
+_RANGE_CHECKS = (
+    ("claude", "timeout_seconds", False),
+    ("validation", "test_timeout", False),
+    ("validation", "lint_timeout", False),
+    ("validation", "build_timeout", False),
+    ("orchestrator", "cycle_timeout_seconds", False),
+    ("claude", "max_retries", True),
+    ("claude", "max_turns", False),
+    ("claude", "rate_limit_max_delay", False),
+    ("claude", "session_pool_size", True),
+    ("claude", "session_idle_timeout", False),
+    ("orchestrator", "loop_interval_seconds", False),
+    ("discovery", "discovery_timeout", False),
+    ("safety", "max_consecutive_failures", False),
+    ("safety", "max_cycles_per_hour", False),
+    ("safety", "max_cost_usd_per_hour", False),
+    ("safety", "min_disk_space_mb", False),
+    ("safety", "min_memory_mb", True),
+)
+
+
+class _ConfigLoader(_SafeLoader):
+    """Safe loader without the timestamp and '=' implicit resolvers.
+
+    Config values are never dates, so plain scalars skip those regex probes;
+    a date-like value simply stays a string.
+    """
+
+    yaml_implicit_resolvers = {
+        first: [
+            (tag, regexp) for tag, regexp in resolvers
+            if tag not in ("tag:yaml.org,2002:timestamp", "tag:yaml.org,2002:value")
+        ]
+        for first, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+    }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ClaudeConfig:
     model: str = "opus"
     resolved_model: str = ""   # Populated at startup by Orchestrator
@@ -23,12 +90,17 @@ class ClaudeConfig:
     timeout_seconds: int = 14400
     command: str = "claude"
     max_retries: int = 3
-    retry_delays: List[int] = field(default_factory=lambda: [2, 8, 32])
+    retry_delays: List[int] = field(default_factory=functools.partial(list, _DEFAULT_RETRY_DELAYS))
     rate_limit_base_delay: int = 5
     rate_limit_multiplier: int = 3
+    rate_limit_max_delay: int = 300     # cap on a single rate-limit backoff
+    retryable_exit_codes: List[int] = field(default_factory=list)  # empty = retry any nonzero exit
+    session_pool_size: int = 0          # >0 serves run() from warm CLI sessions
+    session_idle_timeout: int = 300     # close pooled sessions idle this long
+    resume_sessions: bool = False       # workers continue one CLI conversation per task
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OrchestratorConfig:
     loop_interval_seconds: int = 30
     max_changed_files: int = 20
@@ -56,7 +128,7 @@ class OrchestratorConfig:
     gc_interval: int = 10
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationConfig:
     test_command: str = "python3 -m pytest tests/ -x -q"
     lint_command: str = ""
@@ -66,7 +138,7 @@ class ValidationConfig:
     build_timeout: int = 7200
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DiscoveryConfig:
     enable_test_failures: bool = True
     enable_lint_errors: bool = True
@@ -74,10 +146,8 @@ class DiscoveryConfig:
     enable_coverage: bool = False
     enable_quality_review: bool = False
     enable_claude_ideas: bool = False
-    todo_patterns: List[str] = field(default_factory=lambda: ["TODO", "FIXME", "HACK"])
-    exclude_dirs: List[str] = field(default_factory=lambda: [
-        "__pycache__", ".git", "node_modules", ".venv", "venv",
-    ])
+    todo_patterns: List[str] = field(default_factory=functools.partial(list, _DEFAULT_TODO_PATTERNS))
+    exclude_dirs: List[str] = field(default_factory=functools.partial(list, _DEFAULT_EXCLUDE_DIRS))
     max_todo_tasks: int = 20
     discovery_model: str = "opus"
     discovery_timeout: int = 7200
@@ -86,7 +156,7 @@ class DiscoveryConfig:
     idea_cooldown_seconds: int = 0  # Minimum seconds between claude_ideas runs; 0 = no limit
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SafetyConfig:
     max_consecutive_failures: int = 5
     max_cycles_per_hour: int = 30
@@ -94,12 +164,12 @@ class SafetyConfig:
     min_disk_space_mb: int = 500
     min_memory_mb: int = 256
     max_history_records: int = 1000
-    protected_files: List[str] = field(default_factory=lambda: ["main.py", "config.yaml"])
+    protected_files: List[str] = field(default_factory=functools.partial(list, _DEFAULT_PROTECTED_FILES))
     max_backup_dir_mb: int = 200  # Max size of state/backups directory before cleanup
     max_git_objects_mb: int = 500  # Max size of .git/objects before warning/gc trigger
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentRoleConfig:
     """Per-agent settings."""
     enabled: bool = True
@@ -108,12 +178,13 @@ class AgentRoleConfig:
     timeout_seconds: int = 7200
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentPipelineConfig:
     """Multi-agent pipeline settings."""
     enabled: bool = False
     max_revisions: int = 2
     max_pipeline_cost_usd: float = 0.0  # 0 = use safety.max_cost_usd_per_hour * 0.5
+    persistent_sessions: bool = False  # keep one CLI process per role for the whole run
     planner: AgentRoleConfig = field(default_factory=lambda: AgentRoleConfig(
         model="opus", max_turns=10, timeout_seconds=7200))
     coder: AgentRoleConfig = field(default_factory=lambda: AgentRoleConfig(
@@ -124,7 +195,7 @@ class AgentPipelineConfig:
         model="opus", max_turns=10, timeout_seconds=7200))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParallelConfig:
     enabled: bool = False
     max_workers: int = 3
@@ -135,7 +206,7 @@ class ParallelConfig:
     cleanup_timeout: int = 60
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PathsConfig:
     feedback_dir: str = "feedback"
     feedback_done_dir: str = "feedback/done"
@@ -147,7 +218,7 @@ class PathsConfig:
     agent_workspace_dir: str = "state/agent_workspace"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LoggingConfig:
     level: str = "INFO"
     file: str = "state/auto_claude.log"
@@ -156,7 +227,7 @@ class LoggingConfig:
     format: str = "text"  # "text" or "json"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WebhookConfig:
     """Configuration for a single webhook endpoint."""
     url: str = ""
@@ -164,7 +235,7 @@ class WebhookConfig:
     name: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NotificationEventsConfig:
     """Which events trigger notifications."""
     on_cycle_success: bool = True
@@ -174,7 +245,7 @@ class NotificationEventsConfig:
     on_safety_error: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NotificationsConfig:
     """Top-level notification configuration."""
     enabled: bool = False
@@ -182,7 +253,7 @@ class NotificationsConfig:
     events: NotificationEventsConfig = field(default_factory=NotificationEventsConfig)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Config:
     target_dir: str = "."
     claude: ClaudeConfig = field(default_factory=ClaudeConfig)
@@ -197,28 +268,33 @@ class Config:
     notifications: NotificationsConfig = field(default_factory=NotificationsConfig)
 
 
+@functools.lru_cache(maxsize=None)
+def _hints_for(dc_class) -> dict:
+    """Return get_type_hints() for a config dataclass.
+
+    Annotations are fixed once the class is defined, so they are resolved
+    once per class rather than once per merged key.
+    """
+    return get_type_hints(dc_class)
+
+
 def _get_expected_type(dc_class, field_name: str):
     """Return the expected primitive type for a dataclass field, or None if unknown."""
     try:
-        hints = get_type_hints(dc_class)
+        hints = _hints_for(dc_class)
     except Exception:
         return None
     hint = hints.get(field_name)
     if hint is None:
         return None
-    # Unwrap Optional[X] -> X
-    origin = getattr(hint, "__origin__", None)
-    if origin is type(None):
-        return None
-    # Handle Union (Optional is Union[X, None])
-    import typing
-    if origin is getattr(typing, "Union", None):
-        args = [a for a in hint.__args__ if a is not type(None)]
-        if len(args) == 1:
-            hint = args[0]
-            origin = getattr(hint, "__origin__", None)
-        else:
+    # Unwrap Optional[X] -> X (Optional is Union[X, None])
+    origin = get_origin(hint)
+    if origin is Union:
+        args = [a for a in get_args(hint) if a is not type(None)]
+        if len(args) != 1:
             return None
+        hint = args[0]
+        origin = get_origin(hint)
     # For List[X], accept list
     if origin is list:
         return list
@@ -228,6 +304,19 @@ def _get_expected_type(dc_class, field_name: str):
     return None
 
 
+# Expected type of every config dataclass field, resolved once at import
+# so _merge_dataclass does a single dict lookup per override key.
+_FIELD_TYPES: Dict[type, Dict[str, Optional[type]]] = {
+    cls: {f.name: _get_expected_type(cls, f.name) for f in dataclasses.fields(cls)}
+    for cls in (
+        ClaudeConfig, OrchestratorConfig, ValidationConfig, DiscoveryConfig,
+        SafetyConfig, AgentRoleConfig, AgentPipelineConfig, ParallelConfig,
+        PathsConfig, LoggingConfig, WebhookConfig, NotificationEventsConfig,
+        NotificationsConfig, Config,
+    )
+}
+
+
 def _merge_dataclass(dc_instance, overrides: dict):
     """Merge a dict of overrides into a dataclass instance.
 
@@ -237,11 +326,12 @@ def _merge_dataclass(dc_instance, overrides: dict):
     if not overrides:
         return dc_instance
     dc_class = type(dc_instance)
+    field_types = _FIELD_TYPES[dc_class]
     for key, value in overrides.items():
-        if not hasattr(dc_instance, key):
+        if key not in field_types:
             logger.warning("Unknown config key '%s.%s' — ignoring (typo?)", dc_class.__name__, key)
             continue
-        expected = _get_expected_type(dc_class, key)
+        expected = field_types[key]
         if expected is not None and value is not None:
             # Allow int where float is expected (YAML often produces int for "10.0")
             if expected is float and isinstance(value, int):
@@ -257,10 +347,32 @@ def _merge_dataclass(dc_instance, overrides: dict):
     return dc_instance
 
 
+def _find_git_dir(path: str) -> Optional[Path]:
+    """Return the .git entry that makes *path* part of a repository, or None.
+
+    Walks up from *path* the way git's own discovery does, accepting a
+    .git directory or the .git file used by worktrees and submodules,
+    without spawning `git rev-parse`.
+    """
+    start = Path(path).resolve()
+    for parent in (start, *start.parents):
+        git_dir = parent / ".git"
+        if git_dir.exists():
+            return git_dir
+    return None
+
+
+# Last validated Config per resolved path, with the file's mtime_ns and
+# size when it was read.  Callers always get a deep copy.
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Config]] = {}
+
+
 def load_config(path: Optional[str] = None) -> Config:
     """Load configuration from a YAML file, merging with defaults.
 
-    If path is None, returns a Config with all defaults.
+    If path is None, returns a Config with all defaults.  A file that has
+    not changed since it was last loaded is not parsed again, but it is
+    still validated, since target_dir and the paths may have changed on disk.
     """
     config = Config()
 
@@ -268,11 +380,20 @@ def load_config(path: Optional[str] = None) -> Config:
         return config
 
     config_path = Path(path)
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
+        return config
+    cache_key = str(config_path.resolve())
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        config = copy.deepcopy(cached[2])
+        validate_config(config)
         return config
 
-    with open(config_path, "r") as f:
-        raw = yaml.safe_load(f)
+    # One bytes buffer lets libyaml detect the encoding and scan the whole
+    # document without calling back into Python for each read
+    raw = yaml.load(config_path.read_bytes(), Loader=_ConfigLoader)
 
     if not raw or not isinstance(raw, dict):
         return config
@@ -280,6 +401,9 @@ def load_config(path: Optional[str] = None) -> Config:
     if "target_dir" in raw:
         config.target_dir = raw["target_dir"]
 
+    # Only mapping-valued sections can be merged; anything else is ignored
+    sections = {k: v for k, v in raw.items() if isinstance(v, dict)}
+
     section_map = {
         "claude": config.claude,
         "orchestrator": config.orchestrator,
@@ -292,28 +416,29 @@ def load_config(path: Optional[str] = None) -> Config:
     }
 
     for section_name, dc_instance in section_map.items():
-        if section_name in raw and isinstance(raw[section_name], dict):
-            _merge_dataclass(dc_instance, raw[section_name])
+        section = sections.get(section_name)
+        if section is not None:
+            _merge_dataclass(dc_instance, section)
 
     # Legacy migration: max_tasks_per_cycle -> max_batch_size
-    if "orchestrator" in raw and isinstance(raw["orchestrator"], dict):
-        if "max_tasks_per_cycle" in raw["orchestrator"] and "max_batch_size" not in raw["orchestrator"]:
+    orch_raw = sections.get("orchestrator")
+    if orch_raw is not None:
+        if "max_tasks_per_cycle" in orch_raw and "max_batch_size" not in orch_raw:
             config.orchestrator.max_batch_size = config.orchestrator.max_tasks_per_cycle
 
     # Nested agent pipeline config
-    if "agent_pipeline" in raw and isinstance(raw["agent_pipeline"], dict):
-        ap_raw = raw["agent_pipeline"]
-        _merge_dataclass(config.agent_pipeline, {
-            k: v for k, v in ap_raw.items()
-            if k not in ("planner", "coder", "tester", "reviewer")
-        })
-        for agent_name in ("planner", "coder", "tester", "reviewer"):
-            if agent_name in ap_raw and isinstance(ap_raw[agent_name], dict):
-                _merge_dataclass(getattr(config.agent_pipeline, agent_name), ap_raw[agent_name])
+    ap_raw = sections.get("agent_pipeline")
+    if ap_raw is not None:
+        ap = config.agent_pipeline
+        _merge_dataclass(ap, {k: v for k, v in ap_raw.items() if k not in _AGENT_ROLES})
+        for agent_name, agent_cfg in zip(_AGENT_ROLES, (ap.planner, ap.coder, ap.tester, ap.reviewer)):
+            role_raw = ap_raw.get(agent_name)
+            if isinstance(role_raw, dict):
+                _merge_dataclass(agent_cfg, role_raw)
 
     # Nested notifications config
-    if "notifications" in raw and isinstance(raw["notifications"], dict):
-        notif_raw = raw["notifications"]
+    notif_raw = sections.get("notifications")
+    if notif_raw is not None:
         _merge_dataclass(config.notifications, {
             k: v for k, v in notif_raw.items()
             if k not in ("webhooks", "events")
@@ -321,12 +446,15 @@ def load_config(path: Optional[str] = None) -> Config:
         if "events" in notif_raw and isinstance(notif_raw["events"], dict):
             _merge_dataclass(config.notifications.events, notif_raw["events"])
         if "webhooks" in notif_raw and isinstance(notif_raw["webhooks"], list):
+            # Type-checked like any other section, so a stray key is
+            # reported instead of raising TypeError from the constructor
             config.notifications.webhooks = [
-                WebhookConfig(**wh) for wh in notif_raw["webhooks"]
+                _merge_dataclass(WebhookConfig(), wh) for wh in notif_raw["webhooks"]
                 if isinstance(wh, dict) and wh.get("url")
             ]
 
     validate_config(config)
+    _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
     return config
 
 
@@ -336,17 +464,12 @@ def validate_config(config: Config) -> None:
     Raises ValueError if configuration is invalid.
     """
     # Validate model names are non-empty strings without whitespace
-    _KNOWN_MODEL_ALIASES = {
-        "opus", "sonnet", "haiku",
-        "claude-opus-4-6", "claude-sonnet-4-20250514",
-        "claude-haiku-3-5-20241022",
-    }
     if not config.claude.model or not config.claude.model.strip():
         raise ValueError(
             "claude.model must be a non-empty string"
         )
     model = config.claude.model.strip()
-    if " " in model or "\t" in model:
+    if _WS_RE.search(model):
         raise ValueError(
             f"claude.model contains whitespace: {model!r}"
         )
@@ -360,43 +483,19 @@ def validate_config(config: Config) -> None:
     # Validate discovery model
     if config.discovery.discovery_model:
         dm = config.discovery.discovery_model.strip()
-        if " " in dm or "\t" in dm:
+        if _WS_RE.search(dm):
             raise ValueError(
                 f"discovery.discovery_model contains whitespace: {dm!r}"
             )
 
-    # Validate timeout values are positive integers
-    if config.claude.timeout_seconds <= 0:
-        raise ValueError(
-            f"claude.timeout_seconds must be a positive integer, got {config.claude.timeout_seconds}"
-        )
-    if config.validation.test_timeout <= 0:
-        raise ValueError(
-            f"validation.test_timeout must be a positive integer, got {config.validation.test_timeout}"
-        )
-    if config.validation.lint_timeout <= 0:
-        raise ValueError(
-            f"validation.lint_timeout must be a positive integer, got {config.validation.lint_timeout}"
-        )
-    if config.validation.build_timeout <= 0:
-        raise ValueError(
-            f"validation.build_timeout must be a positive integer, got {config.validation.build_timeout}"
-        )
-    if config.orchestrator.cycle_timeout_seconds <= 0:
-        raise ValueError(
-            f"orchestrator.cycle_timeout_seconds must be a positive integer, "
-            f"got {config.orchestrator.cycle_timeout_seconds}"
-        )
-
-    # Validate max_retries is non-negative
-    if config.claude.max_retries < 0:
-        raise ValueError(
-            f"claude.max_retries must be non-negative, got {config.claude.max_retries}"
-        )
-    if config.claude.max_turns <= 0:
-        raise ValueError(
-            f"claude.max_turns must be positive, got {config.claude.max_turns}"
-        )
+    # Simple range checks on numeric fields
+    for section_name, field_name, allow_zero in _RANGE_CHECKS:
+        value = getattr(getattr(config, section_name), field_name)
+        if (value < 0) if allow_zero else (value <= 0):
+            raise ValueError(
+                f"{section_name}.{field_name} must be "
+                f"{'non-negative' if allow_zero else 'positive'}, got {value}"
+            )
 
     # Cross-field: Claude timeout must exceed test timeout
     if config.claude.timeout_seconds <= config.validation.test_timeout:
@@ -406,60 +505,14 @@ def validate_config(config: Config) -> None:
             f"can complete before Claude times out"
         )
 
-    # Validate orchestrator fields
-    if config.orchestrator.loop_interval_seconds <= 0:
-        raise ValueError(
-            f"orchestrator.loop_interval_seconds must be positive, "
-            f"got {config.orchestrator.loop_interval_seconds}"
-        )
-
-    # Validate discovery timeout
-    if config.discovery.discovery_timeout <= 0:
-        raise ValueError(
-            f"discovery.discovery_timeout must be positive, "
-            f"got {config.discovery.discovery_timeout}"
-        )
-
     # Validate file paths: ensure critical path fields are non-empty
-    _PATH_FIELDS = [
-        ("paths.history_file", config.paths.history_file),
-        ("paths.lock_file", config.paths.lock_file),
-        ("paths.state_dir", config.paths.state_dir),
-        ("paths.feedback_dir", config.paths.feedback_dir),
-    ]
-    for field_name, field_value in _PATH_FIELDS:
+    for field_name in _PATH_FIELDS:
+        field_value = getattr(config.paths, field_name)
         if not field_value or not field_value.strip():
             raise ValueError(
-                f"{field_name} must be a non-empty path"
+                f"paths.{field_name} must be a non-empty path"
             )
 
-    # Validate safety fields
-    if config.safety.max_consecutive_failures <= 0:
-        raise ValueError(
-            f"safety.max_consecutive_failures must be positive, "
-            f"got {config.safety.max_consecutive_failures}"
-        )
-    if config.safety.max_cycles_per_hour <= 0:
-        raise ValueError(
-            f"safety.max_cycles_per_hour must be positive, "
-            f"got {config.safety.max_cycles_per_hour}"
-        )
-    if config.safety.max_cost_usd_per_hour <= 0:
-        raise ValueError(
-            f"safety.max_cost_usd_per_hour must be positive, "
-            f"got {config.safety.max_cost_usd_per_hour}"
-        )
-    if config.safety.min_disk_space_mb <= 0:
-        raise ValueError(
-            f"safety.min_disk_space_mb must be positive, "
-            f"got {config.safety.min_disk_space_mb}"
-        )
-    if config.safety.min_memory_mb < 0:
-        raise ValueError(
-            f"safety.min_memory_mb must be non-negative, "
-            f"got {config.safety.min_memory_mb}"
-        )
-
     # Validate parallel config
     if config.parallel.enabled and config.parallel.max_workers <= 0:
         raise ValueError(
@@ -468,10 +521,9 @@ def validate_config(config: Config) -> None:
         )
 
     # Validate agent pipeline role configs when enabled
-    if config.agent_pipeline.enabled:
-        _REQUIRED_ROLE_ATTRS = ("model", "max_turns", "timeout_seconds")
-        for agent_name in ("planner", "coder", "tester", "reviewer"):
-            agent_cfg = getattr(config.agent_pipeline, agent_name)
+    ap = config.agent_pipeline
+    if ap.enabled:
+        for agent_name, agent_cfg in zip(_AGENT_ROLES, (ap.planner, ap.coder, ap.tester, ap.reviewer)):
             missing = [a for a in _REQUIRED_ROLE_ATTRS if not hasattr(agent_cfg, a)]
             if missing:
                 raise ValueError(
@@ -500,11 +552,7 @@ def validate_config(config: Config) -> None:
         raise ValueError(
             f"target_dir does not exist or is not a directory: {target}"
         )
-    git_check = subprocess.run(
-        ["git", "rev-parse", "--git-dir"],
-        cwd=target, capture_output=True, text=True,
-    )
-    if git_check.returncode != 0:
+    if _find_git_dir(target) is None:
         raise ValueError(
             f"target_dir is not a git repository: {target}"
         )
@@ -523,7 +571,6 @@ def validate_config(config: Config) -> None:
         )
 
     # Validate notifications config
-    _KNOWN_WEBHOOK_TYPES = {"slack", "discord", "generic"}
     if config.notifications.enabled:
         for i, wh in enumerate(config.notifications.webhooks):
             if not wh.url:
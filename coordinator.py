@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import logging
+import queue
 import shutil
 import signal
 import threading
 import time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from config_schema import Config
 from feedback import FeedbackManager
@@ -41,8 +42,18 @@ class ParallelCoordinator:
         self.discovery = TaskDiscovery(config, state_manager=self.state)
         self.feedback = FeedbackManager(config)
         self.max_workers = config.parallel.max_workers
-        self._running = True
+        # Set by the signal handler; also wakes the loop's interval sleep
+        self._shutdown_event = threading.Event()
         self._workers: List[Worker] = []
+        # Workers keep their worktree between cycles and are rebound to new
+        # task groups, so worktrees are not re-created every loop
+        self._worker_pool: List[Worker] = []
+        # Last future submitted for each pool slot; a slot is only rebound
+        # once it is done
+        self._slot_futures: Dict[int, Future] = {}
+        # Created on first use and kept across cycles so worker threads are
+        # not recreated every loop; run() shuts it down when it returns
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def run(self, once: bool = False) -> None:
         """Main loop: discover tasks, dispatch to workers, merge results."""
@@ -60,7 +71,7 @@ class ParallelCoordinator:
                 self.max_workers, once,
             )
 
-            while self._running:
+            while not self._shutdown_event.is_set():
                 try:
                     self._run_cycle()
                 except SafetyError as e:
@@ -71,14 +82,18 @@ class ParallelCoordinator:
                 if once:
                     break
 
-                # Sleep in small increments for signal responsiveness
-                sleep_time = self.config.orchestrator.loop_interval_seconds
-                while sleep_time > 0 and self._running:
-                    time.sleep(min(1, sleep_time))
-                    sleep_time -= 1
+                # Returns early as soon as a signal requests shutdown
+                if self._shutdown_event.wait(
+                    timeout=self.config.orchestrator.loop_interval_seconds,
+                ):
+                    break
 
             logger.info("ParallelCoordinator stopped")
         finally:
+            if self._executor is not None:
+                # Let in-flight workers finish before their worktrees go away
+                self._executor.shutdown(wait=True)
+                self._executor = None
             self._cleanup_all_worktrees()
             self.safety.release_lock()
 
@@ -102,15 +117,25 @@ class ParallelCoordinator:
         )
 
         # Claim feedback files before dispatching
-        for group in groups:
-            for task in group:
-                if task.source == "feedback" and task.source_file:
-                    if not self.feedback.claim_feedback(task.source_file):
-                        logger.warning(
-                            "Could not claim feedback file %s, skipping",
-                            task.source_file,
-                        )
-                        group.remove(task)
+        feedback_files = [
+            t.source_file for g in groups for t in g
+            if t.source == "feedback" and t.source_file
+        ]
+        if feedback_files:
+            failed_claims = set(feedback_files) - self.feedback.claim_batch(feedback_files)
+            for source_file in failed_claims:
+                logger.warning(
+                    "Could not claim feedback file %s, skipping",
+                    source_file,
+                )
+            if failed_claims:
+                groups = [
+                    [
+                        t for t in g
+                        if not (t.source == "feedback" and t.source_file in failed_claims)
+                    ]
+                    for g in groups
+                ]
 
         # Remove empty groups
         groups = [g for g in groups if g]
@@ -119,35 +144,35 @@ class ParallelCoordinator:
 
         # Dispatch workers
         results: List[tuple] = []  # (WorkerResult, Worker)
-        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
-            futures = {}
-            for i, task_group in enumerate(groups):
-                worker = Worker(
-                    config=self.config,
-                    tasks=task_group,
-                    state=self.state,
-                    worker_id=i,
-                    main_repo_dir=self.config.target_dir,
+        # Finished futures are handed over by their done-callbacks, in
+        # completion order
+        done: queue.SimpleQueue = queue.SimpleQueue()
+        futures = {}
+        for i, task_group in enumerate(groups):
+            worker = self._get_or_create_worker(i, task_group)
+            self._workers.append(worker)
+            future = self._get_executor().submit(worker.execute)
+            self._slot_futures[i] = future
+            futures[future] = worker
+            future.add_done_callback(done.put)
+
+        for _ in range(len(futures)):
+            future = done.get()
+            worker = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(
+                    "Worker %d raised exception: %s",
+                    worker.worker_id, e,
                 )
-                self._workers.append(worker)
-                futures[pool.submit(worker.execute)] = worker
-
-            for future in as_completed(futures):
-                worker = futures[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    logger.error(
-                        "Worker %d raised exception: %s",
-                        worker.worker_id, e,
-                    )
-                    result = WorkerResult(
-                        success=False,
-                        branch_name=worker.branch_name,
-                        error=str(e),
-                        tasks=worker.tasks,
-                    )
-                results.append((result, worker))
+                result = WorkerResult(
+                    success=False,
+                    branch_name=worker.branch_name,
+                    error=str(e),
+                    tasks=worker.tasks,
+                )
+            results.append((result, worker))
 
         # Merge successful branches and record cycles
         for result, worker in results:
@@ -164,6 +189,40 @@ class ParallelCoordinator:
         self._workers.clear()
         self.git.prune_worktrees()
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker thread pool, creating it if needed."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="worker",
+            )
+        return self._executor
+
+    def _get_or_create_worker(self, worker_id: int, tasks: List[Task]) -> Worker:
+        """Return the pooled worker for this slot, rebound to the given tasks."""
+        if worker_id < len(self._worker_pool):
+            worker = self._worker_pool[worker_id]
+            previous = self._slot_futures.get(worker_id)
+            if previous is not None and not previous.done():
+                # A cycle that ended abnormally never collected this worker;
+                # its tasks and branch must not change while it runs
+                logger.warning(
+                    "Worker %d from an earlier cycle is still running, waiting for it",
+                    worker_id,
+                )
+                wait([previous])
+                self._cleanup_worker_with_timeout(worker)
+            worker.reset(tasks)
+            return worker
+        worker = Worker(
+            config=self.config,
+            tasks=tasks,
+            state=self.state,
+            worker_id=worker_id,
+            main_repo_dir=self.config.target_dir,
+        )
+        self._worker_pool.append(worker)
+        return worker
+
     def _process_result(self, result: WorkerResult, worker: Worker) -> None:
         """Process a single worker result: merge if successful, record cycle."""
         if result.success:
@@ -243,7 +302,14 @@ class ParallelCoordinator:
                 return True
 
             if strategy == "merge":
-                # 2. Try auto-merge
+                # 2. Try auto-merge, unless an in-memory merge already shows
+                # conflicts; those will not go away on a later attempt.
+                if self.git.merges_cleanly(original_branch, worker.branch_name) is False:
+                    logger.warning(
+                        "Worker %d: branch %s conflicts with %s, skipping merge",
+                        worker.worker_id, worker.branch_name, original_branch,
+                    )
+                    break
                 if self.git.merge_branch(worker.branch_name):
                     logger.info(
                         "Worker %d: auto-merged branch %s into %s",
@@ -258,11 +324,30 @@ class ParallelCoordinator:
                 )
 
             elif strategy == "rebase":
+                # Main already has exactly the worker's content, so there is
+                # nothing to rebase, merge or re-validate.
+                main_tree = self.git.tree_of(original_branch)
+                worker_tree = self.git.tree_of(worker.branch_name)
+                if main_tree and main_tree == worker_tree:
+                    logger.info(
+                        "Worker %d: branch %s has the same tree as %s, nothing to merge",
+                        worker.worker_id, worker.branch_name, original_branch,
+                    )
+                    return True
+
                 # 3. Rebase the worker branch onto main
                 if self.git.rebase_onto(original_branch, worker.branch_name):
                     # Now try fast-forward merge
                     self.git.checkout(original_branch)
                     if self.git.merge_ff_only(worker.branch_name):
+                        # The worker validated its own tree; if the rebase
+                        # left that tree unchanged there is nothing new to test.
+                        if worker_tree and self.git.tree_of(original_branch) == worker_tree:
+                            logger.info(
+                                "Worker %d: rebased tree unchanged, reusing worker validation",
+                                worker.worker_id,
+                            )
+                            return True
                         # Re-validate after rebase
                         validator = Validator(self.config)
                         validation = validator.validate(self.config.target_dir)
@@ -430,7 +515,7 @@ class ParallelCoordinator:
         """Register signal handlers for graceful shutdown."""
         def handler(signum, frame):
             logger.info("Received signal %d, shutting down workers...", signum)
-            self._running = False
+            self._shutdown_event.set()
             # Terminate any running Claude subprocesses in workers
             for worker in self._workers:
                 if worker._claude is not None:
@@ -443,32 +528,46 @@ class ParallelCoordinator:
         signal.signal(signal.SIGTERM, handler)
 
     def _cleanup_worker_with_timeout(self, worker: Worker, timeout: float = 30) -> None:
-        """Clean up a single worker's worktree and branch with a timeout.
+        """Release a single worker's worktree and delete its branch with a timeout.
 
-        Isolates errors between remove_worktree, delete_branch, and
-        prune_worktrees so that a failure in one step doesn't prevent
-        the others from running. Falls back to shutil.rmtree if
-        git worktree remove fails or times out.
+        The worktree is detached from its branch and kept for the worker's
+        next cycle. If the worker never got a usable worktree or detaching
+        fails, the worktree is removed instead. Isolates errors between the
+        steps so that a failure in one doesn't prevent the others from
+        running, and falls back to shutil.rmtree if git worktree remove fails.
         """
+        # self.git already validated the main repo; every call below spawns
+        # its own git process, so sharing it with this thread is safe.
+        main_git = self.git
+
         def _do_cleanup():
-            main_git = GitManager(self.config.target_dir)
-            # Step 1: remove worktree via git
-            try:
-                main_git.remove_worktree(worker.worktree_dir, force=True)
-            except Exception:
-                logger.warning(
-                    "Worker %d: git worktree remove failed, falling back to rmtree",
-                    worker.worker_id,
-                )
+            # Step 1: detach the worktree so it can be reused next cycle
+            detached = False
+            if worker._git is not None:
+                try:
+                    worker._git.detach_head()
+                    detached = True
+                except Exception:
+                    logger.warning(
+                        "Worker %d: could not detach worktree, removing it",
+                        worker.worker_id,
+                    )
+
+            if not detached:
+                # Step 1b: remove worktree via git
+                try:
+                    main_git.remove_worktree(worker.worktree_dir, force=True)
+                except Exception:
+                    logger.warning(
+                        "Worker %d: git worktree remove failed, falling back to rmtree",
+                        worker.worker_id,
+                    )
+
+                # Step 2: force-remove the directory if it still exists
                 wt_path = Path(worker.worktree_dir)
                 if wt_path.exists():
                     shutil.rmtree(str(wt_path), ignore_errors=True)
 
-            # Step 2: force-remove the directory if it still exists
-            wt_path = Path(worker.worktree_dir)
-            if wt_path.exists():
-                shutil.rmtree(str(wt_path), ignore_errors=True)
-
             # Step 3: delete the branch
             try:
                 main_git.delete_branch(worker.branch_name, force=True)
@@ -487,6 +586,17 @@ class ParallelCoordinator:
                 worker.worker_id, timeout,
             )
 
+    def _remove_one_worktree(self, child: Path) -> None:
+        """Remove one worktree directory, falling back to rmtree on error."""
+        try:
+            self.git.remove_worktree(str(child), force=True)
+        except Exception:
+            logger.warning(
+                "Failed to git-remove worktree %s, falling back to rmtree",
+                child,
+            )
+            shutil.rmtree(str(child), ignore_errors=True)
+
     def _cleanup_all_worktrees(self) -> None:
         """Remove all worktree directories on shutdown.
 
@@ -501,17 +611,34 @@ class ParallelCoordinator:
         def _do_cleanup():
             worktree_base = Path(self.config.target_dir) / self.config.parallel.worktree_base_dir
             if worktree_base.exists():
-                # Clean up each worker directory with error isolation
-                for child in worktree_base.iterdir():
-                    if child.is_dir() and child.name.startswith("worker-"):
+                children = [
+                    c for c in worktree_base.iterdir()
+                    if c.is_dir() and c.name.startswith("worker-")
+                ]
+                # Each worktree has its own path, so up to max_workers removals
+                # run at once.  Daemon threads rather than an executor: pool
+                # threads are joined at interpreter exit, which would let a
+                # hung removal outlive the cleanup timeout below.
+                pending: queue.SimpleQueue = queue.SimpleQueue()
+                for child in children:
+                    pending.put(child)
+
+                def _drain():
+                    while True:
                         try:
-                            self.git.remove_worktree(str(child), force=True)
-                        except Exception:
-                            logger.warning(
-                                "Failed to git-remove worktree %s, falling back to rmtree",
-                                child,
-                            )
-                            shutil.rmtree(str(child), ignore_errors=True)
+                            child = pending.get_nowait()
+                        except queue.Empty:
+                            return
+                        self._remove_one_worktree(child)
+
+                removers = [
+                    threading.Thread(target=_drain, daemon=True)
+                    for _ in range(min(len(children), max(1, self.max_workers)))
+                ]
+                for remover in removers:
+                    remover.start()
+                for remover in removers:
+                    remover.join()
 
                 # Remove the base directory if empty
                 try:
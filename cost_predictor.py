@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -23,11 +25,22 @@ _MODEL_COST_PER_M_INPUT_TOKENS = {
     "haiku": 0.25,
 }
 
+# Matches the first known alias anywhere in a model ID, e.g. "claude-opus-4-6"
+_ALIAS_RE = re.compile("|".join(re.escape(k) for k in _MODEL_COST_PER_M_INPUT_TOKENS))
+
 # Output tokens are typically ~3x more expensive; assume output ≈ 50% of input
 OUTPUT_TO_INPUT_RATIO = 0.5
 OUTPUT_COST_MULTIPLIER = 5.0  # output tokens cost ~5x input for opus
 
 
+@functools.lru_cache(maxsize=32)
+def _input_cost_per_m(model: str) -> float:
+    """Return the per-million input token price for a model alias or ID."""
+    match = _ALIAS_RE.search(model.lower())
+    # Default to opus pricing (most expensive, safest estimate)
+    return _MODEL_COST_PER_M_INPUT_TOKENS[match.group(0) if match else "opus"]
+
+
 def estimate_prompt_tokens(prompt_text: str) -> int:
     """Estimate the number of tokens in a prompt string."""
     return max(1, len(prompt_text) // CHARS_PER_TOKEN)
@@ -49,26 +62,13 @@ def estimate_task_cost(
         Estimated cost in USD.
     """
     # Calculate total character count from task descriptions and context
-    total_chars = 0
-    for task in tasks:
-        total_chars += len(task.description)
-        total_chars += len(task.context)
+    total_chars = sum(len(t.description) + len(t.context) for t in tasks)
 
     input_tokens = (total_chars // CHARS_PER_TOKEN) + prompt_overhead
     output_tokens = int(input_tokens * OUTPUT_TO_INPUT_RATIO)
 
     # Look up per-token cost for the model
-    model_lower = model.lower()
-    input_cost_per_m = _MODEL_COST_PER_M_INPUT_TOKENS.get(model_lower)
-    if input_cost_per_m is None:
-        # Try to match by model ID prefix
-        for alias, cost in _MODEL_COST_PER_M_INPUT_TOKENS.items():
-            if alias in model_lower:
-                input_cost_per_m = cost
-                break
-        else:
-            # Default to opus pricing (most expensive, safest estimate)
-            input_cost_per_m = _MODEL_COST_PER_M_INPUT_TOKENS["opus"]
+    input_cost_per_m = _input_cost_per_m(model)
 
     output_cost_per_m = input_cost_per_m * OUTPUT_COST_MULTIPLIER
 
@@ -10,8 +10,9 @@ import json
 import logging
 import os
 import tempfile
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -32,6 +33,9 @@ class CycleState:
     retry_count: int = 0
 
 
+_FIELDS = tuple(f.name for f in fields(CycleState))
+
+
 class CycleStateWriter:
     """Writes current cycle state atomically to a JSON file."""
 
@@ -42,14 +46,29 @@ class CycleStateWriter:
             filename = "current_cycle.json"
         self._path = Path(state_dir) / filename
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Last state written to disk, used to skip writes that change nothing
+        self._cached: Optional[CycleState] = None
+        # Pipeline agents running concurrently (tester and reviewer) update
+        # the same writer; serialize the read-merge-write of _cached
+        self._lock = threading.Lock()
 
     @property
     def path(self) -> str:
         return str(self._path)
 
     def write(self, state: CycleState) -> None:
-        """Atomically write cycle state via tempfile + os.replace."""
-        data = asdict(state)
+        """Atomically write cycle state via tempfile + os.replace.
+
+        Does nothing if the state equals the one last written.
+        """
+        with self._lock:
+            self._write_locked(state)
+
+    def _write_locked(self, state: CycleState) -> None:
+        if state == self._cached:
+            return
+        # Shallow copy: every field is already JSON-serializable
+        data = {k: getattr(state, k) for k in _FIELDS}
         self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = None
         try:
@@ -64,6 +83,9 @@ class CycleStateWriter:
             with f:
                 json.dump(data, f)
             os.replace(tmp_path, str(self._path))
+            # Copy the list so later in-place edits by the caller still
+            # register as a change
+            self._cached = replace(state, task_descriptions=list(state.task_descriptions))
         except OSError as e:
             logger.warning("Failed to write cycle state: %s", e)
             if tmp_path is not None:
@@ -74,20 +96,28 @@ class CycleStateWriter:
 
     def clear(self) -> None:
         """Remove the cycle state file (cycle completed)."""
-        try:
-            self._path.unlink(missing_ok=True)
-        except OSError as e:
-            logger.warning("Failed to clear cycle state: %s", e)
+        with self._lock:
+            self._cached = None
+            try:
+                self._path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Failed to clear cycle state: %s", e)
 
     def update(self, **kwargs: Any) -> None:
-        """Read current state, merge kwargs, and write back."""
-        current = read_cycle_state(str(self._path.parent))
-        if current is None:
-            current = CycleState()
-        for k, v in kwargs.items():
-            if hasattr(current, k):
-                setattr(current, k, v)
-        self.write(current)
+        """Merge kwargs into the last written state and write it back.
+
+        This writer is the only one writing its file, so the last state it
+        wrote is reused instead of reading the file back from disk.
+        """
+        with self._lock:
+            if self._cached is None:
+                current = CycleState()
+            else:
+                current = replace(self._cached, task_descriptions=list(self._cached.task_descriptions))
+            for k, v in kwargs.items():
+                if hasattr(current, k):
+                    setattr(current, k, v)
+            self._write_locked(current)
 
 
 def read_cycle_state(state_dir: str) -> Optional[CycleState]:
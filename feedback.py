@@ -10,7 +10,7 @@ import shutil
 import tempfile
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 from config_schema import Config
 from task_discovery import Task
@@ -282,6 +282,14 @@ class FeedbackManager:
         except FileNotFoundError:
             return False  # another worker already claimed it
 
+    def claim_batch(self, source_files: Iterable[str]) -> Set[str]:
+        """Claim several feedback files in one pass.
+
+        Returns the files that were claimed; files another worker already
+        claimed are left out.
+        """
+        return {f for f in source_files if self.claim_feedback(f)}
+
     def unclaim_feedback(self, source_file: str) -> None:
         """Restore a claimed feedback file back to its original name.
 
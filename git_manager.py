@@ -8,7 +8,7 @@ import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set
 
 from process_utils import kill_process_group, run_with_group_kill
 
@@ -332,6 +332,24 @@ class GitManager:
         status = self._run("status", "--porcelain", check=False)
         return status.stdout.strip() == ""
 
+    def has_changes_since(
+        self, snapshot: Optional[Snapshot] = None, exclude: Sequence[str] = (),
+    ) -> bool:
+        """Check if the working tree or HEAD differs from *snapshot*.
+
+        Paths in *exclude* (relative to the repo root) are ignored.  Returns
+        True whenever git cannot determine the state, so callers that use
+        this to skip a rollback always err on the side of rolling back.
+        """
+        pathspec = ["--", "."] + [f":(exclude){p}" for p in exclude] if exclude else []
+        status = self._run("status", "--porcelain", *pathspec, check=False)
+        if status.returncode != 0 or status.stdout.strip():
+            return True
+        if snapshot is None:
+            return False
+        head = self._run("rev-parse", "HEAD", check=False)
+        return head.returncode != 0 or head.stdout.strip() != snapshot.commit_hash
+
     # ------------------------------------------------------------------
     # Worktree and branch management (for parallel workers)
     # ------------------------------------------------------------------
@@ -340,6 +358,18 @@ class GitManager:
         """Create a new worktree with a new branch at the given path."""
         self._run("worktree", "add", "-b", branch, path)
 
+    def reset_worktree(self, branch: str, start_point: str) -> None:
+        """Point this worktree at a fresh branch and discard any leftovers.
+
+        Lets an existing worktree be reused instead of removed and re-added.
+        """
+        self._run("checkout", "--force", "-B", branch, start_point)
+        self._run("clean", "-fdx")
+
+    def detach_head(self) -> None:
+        """Detach HEAD so the branch checked out here can be deleted."""
+        self._run("checkout", "--detach")
+
     def remove_worktree(self, path: str, force: bool = False) -> None:
         """Remove a worktree directory."""
         args = ["worktree", "remove", path]
@@ -368,6 +398,27 @@ class GitManager:
         result = self._run_with_retry("merge", "--ff-only", branch)
         return result.returncode == 0
 
+    def merges_cleanly(self, base: str, branch: str) -> Optional[bool]:
+        """Check whether merging branch into base would conflict.
+
+        Uses `git merge-tree --write-tree` (git 2.38+), which computes the
+        merge in the object database without touching the index or working
+        tree.  Returns True for a clean merge, False for conflicts, and None
+        when git cannot tell (older git or another error).
+        """
+        result = self._run(
+            "merge-tree", "--write-tree", "--no-messages", base, branch,
+            check=False,
+        )
+        if result.returncode == 0:
+            return True
+        # A conflicted merge still prints the tree OID; a bad ref exits 1
+        # with nothing on stdout
+        if result.returncode == 1 and result.stdout.strip():
+            return False
+        logger.debug("git merge-tree probe unavailable: %s", result.stderr.strip())
+        return None
+
     def abort_merge(self) -> None:
         """Abort an in-progress merge."""
         self._run("merge", "--abort", check=False)
@@ -383,6 +434,15 @@ class GitManager:
             return False
         return True
 
+    def tree_of(self, rev: str) -> str:
+        """Return the tree OID of a commit-ish, or "" if it cannot be resolved."""
+        result = self._run("rev-parse", "--verify", "--quiet", f"{rev}^{{tree}}", check=False)
+        return result.stdout.strip() if result.returncode == 0 else ""
+
+    def head_commit(self) -> str:
+        """Return the commit hash HEAD points at."""
+        return self._run("rev-parse", "HEAD").stdout.strip()
+
     def get_current_branch(self) -> str:
         """Get the current branch name."""
         result = self._run("rev-parse", "--abbrev-ref", "HEAD")
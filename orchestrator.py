@@ -9,6 +9,7 @@ import os
 import re
 import shutil
 import signal
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -247,7 +248,8 @@ class Orchestrator:
         self.feedback = FeedbackManager(config)
         self.cycle_state = CycleStateWriter(str(Path(config.paths.history_file).parent))
         self.notifier = NotificationManager(config.notifications)
-        self._running = True
+        # Set by the signal handler; also wakes the loop's interval sleep
+        self._shutdown_event = threading.Event()
         self._consecutive_exceptions = 0
         self._backoff_seconds = 0
         self._active_pipeline: Optional[AgentPipeline] = None
@@ -268,7 +270,7 @@ class Orchestrator:
         """Register signal handlers for graceful shutdown."""
         def handler(signum, frame):
             logger.info("Received signal %d, shutting down gracefully...", signum)
-            self._running = False
+            self._shutdown_event.set()
             self.claude.terminate()
             pipeline = self._active_pipeline
             if pipeline is not None:
@@ -1287,7 +1289,7 @@ class Orchestrator:
 
         try:
             logger.info("Orchestrator started (once=%s)", once)
-            while self._running:
+            while not self._shutdown_event.is_set():
                 try:
                     self._cycle()
                     # Reset backoff on successful cycle (no exception)
@@ -1334,11 +1336,11 @@ class Orchestrator:
                     )
                 else:
                     logger.debug("Sleeping %ds...", sleep_total)
-                # Sleep in small increments so we can respond to signals
-                while sleep_total > 0 and self._running:
-                    time.sleep(min(1, sleep_total))
-                    sleep_total -= 1
+                # Returns early as soon as a signal requests shutdown
+                if self._shutdown_event.wait(timeout=sleep_total):
+                    break
 
             logger.info("Orchestrator stopped")
         finally:
+            self.claude.close()
             self.safety.release_lock()
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
@@ -18,6 +20,7 @@ from agent_pipeline import (
 )
 from claude_runner import ClaudeResult
 from config_schema import AgentPipelineConfig, AgentRoleConfig, Config
+from git_manager import GitManager
 
 
 class TestAgentWorkspace:
@@ -32,6 +35,10 @@ class TestAgentWorkspace:
         ws.clean()
         assert ws.read("nonexistent.md") is None
 
+    def test_read_missing_workspace_dir_returns_none(self, tmp_path):
+        ws = AgentWorkspace(str(tmp_path / "never_created"))
+        assert ws.read("plan.md") is None
+
     def test_clean_removes_files(self, tmp_path):
         ws = AgentWorkspace(str(tmp_path / "workspace"))
         ws.clean()
@@ -40,6 +47,37 @@ class TestAgentWorkspace:
         ws.clean()
         assert not ws.exists("plan.md")
 
+    def test_clean_removes_nested_dirs(self, tmp_path):
+        root = tmp_path / "workspace"
+        (root / "sub" / "deeper").mkdir(parents=True)
+        (root / "sub" / "deeper" / "f.txt").write_text("x")
+        ws = AgentWorkspace(str(root))
+        ws.clean()
+        assert root.is_dir()
+        assert list(root.iterdir()) == []
+
+    def test_write_batch(self, tmp_path):
+        ws = AgentWorkspace(str(tmp_path / "new" / "workspace"))
+        ws.write_batch([("plan.md", "the plan"), ("review.md", "VERDICT: REVISE \u2713")])
+        assert ws.read("plan.md") == "the plan"
+        assert ws.read("review.md") == "VERDICT: REVISE \u2713"
+
+    def test_write_batch_truncates_existing(self, tmp_path):
+        ws = AgentWorkspace(str(tmp_path / "workspace"))
+        ws.write("plan.md", "a much longer original plan")
+        ws.write_batch([("plan.md", "short")])
+        assert ws.read("plan.md") == "short"
+
+    def test_write_is_atomic_on_failure(self, tmp_path):
+        """A failed write leaves the previous file intact and no temp files behind."""
+        ws = AgentWorkspace(str(tmp_path / "workspace"))
+        ws.write("review.md", "VERDICT: REVISE")
+        with patch("agent_pipeline.os.write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                ws.write("review.md", "VERDICT: APPROVED")
+        assert ws.read("review.md") == "VERDICT: REVISE"
+        assert os.listdir(tmp_path / "workspace") == ["review.md"]
+
     def test_exists(self, tmp_path):
         ws = AgentWorkspace(str(tmp_path / "workspace"))
         ws.clean()
@@ -83,6 +121,61 @@ class TestParseReviewVerdict:
     def test_verdict_with_extra_whitespace(self):
         assert self.pipeline._parse_review_verdict("  VERDICT:   APPROVED  \nOK.") is True
 
+    def test_last_verdict_wins(self):
+        content = "VERDICT: REVISE\nFixed in follow-up.\nVERDICT: APPROVED\n"
+        assert self.pipeline._parse_review_verdict(content) is True
+
+    def test_verdict_on_first_line_of_multiline_review(self):
+        content = "VERDICT: REVISE\n" + "detail line\n" * 50
+        assert self.pipeline._parse_review_verdict(content) is False
+
+    def test_verdict_mid_sentence_ignored(self):
+        content = "I would not say VERDICT: REVISE here.\nVERDICT: APPROVED"
+        assert self.pipeline._parse_review_verdict(content) is True
+        assert self.pipeline._parse_review_verdict("Not a VERDICT: REVISE line") is True
+
+    def test_verdict_found_before_long_tail(self):
+        content = "VERDICT: REVISE\n" + "trailing detail line\n" * 1000
+        assert self.pipeline._parse_review_verdict(content) is False
+
+    def test_tail_verdict_beats_earlier_one_in_long_review(self):
+        content = "VERDICT: REVISE\n" + "detail\n" * 1000 + "VERDICT: APPROVED\n"
+        assert self.pipeline._parse_review_verdict(content) is True
+
+    def test_verdict_with_crlf_line_endings(self):
+        assert self.pipeline._parse_review_verdict("Notes\r\nVERDICT: REVISE\r\n") is False
+
+
+class TestResultDataclasses:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_results_are_slotted(self):
+        agent_result = AgentResult(role=AgentRole.CODER, success=True)
+        pipeline_result = PipelineResult(success=False)
+        assert not hasattr(agent_result, "__dict__")
+        assert not hasattr(pipeline_result, "__dict__")
+        with pytest.raises(AttributeError):
+            agent_result.unknown_field = 1
+
+    def test_pipeline_result_defaults_not_shared(self):
+        a = PipelineResult(success=False)
+        b = PipelineResult(success=False)
+        a.agent_results.append(AgentResult(role=AgentRole.CODER, success=True))
+        assert b.agent_results == []
+
+
+class TestParseTestOutcome:
+    def test_passed(self):
+        assert AgentPipeline._parse_test_outcome("All 12 tests ok.\nTESTS: PASSED") is True
+
+    def test_failed(self):
+        assert AgentPipeline._parse_test_outcome("test_x FAILED\nTESTS: FAILED\n") is False
+
+    def test_no_marker_defaults_passed(self):
+        assert AgentPipeline._parse_test_outcome("1 FAILED, but no marker") is True
+
+    def test_empty_defaults_passed(self):
+        assert AgentPipeline._parse_test_outcome("") is True
+
 
 @dataclass
 class MockTask:
@@ -148,6 +241,50 @@ class TestAgentPipelineFlow:
         assert "Planner failed" in result.error
         assert len(result.agent_results) == 1
 
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_empty_plan_retries_planner_then_fails(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+
+        runner_instance = MockRunner.return_value
+        runner_instance.run.return_value = _make_success_result("   \n")
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is False
+        assert "empty plan" in result.error
+        assert [r.role for r in result.agent_results] == [AgentRole.PLANNER] * 2
+        # No coder call was wasted on the empty plan
+        assert runner_instance.run.call_count == 2
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_empty_plan_recovered_on_retry(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.reviewer.enabled = False
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+
+        planner_calls = {"n": 0}
+        runner_instance = MockRunner.return_value
+
+        def side_effect_fn(prompt):
+            if "PLANNER" in prompt:
+                planner_calls["n"] += 1
+                return _make_success_result("" if planner_calls["n"] == 1 else "a real plan")
+            return _make_success_result("output")
+
+        runner_instance.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is True
+        assert planner_calls["n"] == 2
+        coder_prompt = [
+            c[0][0] for c in runner_instance.run.call_args_list if "CODER" in c[0][0]
+        ][0]
+        assert "a real plan" in coder_prompt
+
     @patch("agent_pipeline.ClaudeRunner")
     def test_coder_failure_stops_pipeline(self, MockRunner, tmp_path):
         self.config.target_dir = str(tmp_path)
@@ -245,6 +382,14 @@ class TestAgentPipelineFlow:
         assert result.revision_count == 1
         # Rollback: once after planner, once before revision retry
         assert rollback_fn.call_count == 2
+        # The rejected review is fed into the second coder prompt
+        coder_prompts = [
+            c[0][0] for c in runner_instance.run.call_args_list if "CODER" in c[0][0]
+        ]
+        assert len(coder_prompts) == 2
+        assert "Fix the naming." in coder_prompts[1]
+        # Review feedback is appended after the unchanged first-pass prompt
+        assert coder_prompts[1].startswith(coder_prompts[0])
 
     @patch("agent_pipeline.ClaudeRunner")
     def test_max_revisions_exhausted(self, MockRunner, tmp_path):
@@ -304,6 +449,365 @@ class TestAgentPipelineFlow:
         assert rollback_fn.call_count == 2
         rollback_fn.assert_any_call("snap")
 
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_tester_and_reviewer_run_concurrently(self, MockRunner, tmp_path):
+        """Tester and reviewer should overlap; results keep tester-first order."""
+        self.config.target_dir = str(tmp_path)
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+        ws_dir = Path(str(tmp_path)) / self.config.paths.agent_workspace_dir
+
+        # Each side waits for the other: a sequential pipeline would time out.
+        barrier = threading.Barrier(2, timeout=5)
+        runner_instance = MockRunner.return_value
+
+        def side_effect_fn(prompt):
+            if "TESTER" in prompt:
+                barrier.wait()
+                return _make_success_result("tests pass")
+            if "REVIEWER" in prompt:
+                barrier.wait()
+                ws_dir.mkdir(parents=True, exist_ok=True)
+                (ws_dir / "review.md").write_text("VERDICT: APPROVED\nOK.")
+                return _make_success_result("review")
+            return _make_success_result("output")
+
+        runner_instance.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is True
+        roles = [r.role for r in result.agent_results]
+        assert roles == [
+            AgentRole.PLANNER, AgentRole.CODER, AgentRole.TESTER, AgentRole.REVIEWER,
+        ]
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_tester_failure_overrides_reviewer_approval(self, MockRunner, tmp_path):
+        """A crashed tester forces a revision even if the reviewer approved."""
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 0
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+        ws_dir = Path(str(tmp_path)) / self.config.paths.agent_workspace_dir
+
+        runner_instance = MockRunner.return_value
+
+        def side_effect_fn(prompt):
+            if "TESTER" in prompt:
+                return _make_failure_result("tester crashed")
+            if "REVIEWER" in prompt:
+                ws_dir.mkdir(parents=True, exist_ok=True)
+                (ws_dir / "review.md").write_text("VERDICT: APPROVED\nOK.")
+                return _make_success_result("review")
+            return _make_success_result("output")
+
+        runner_instance.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is False
+        assert "Tester failed" in result.error
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_reported_test_failures_trigger_revision(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 1
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+
+        tester_count = {"n": 0}
+        runner_instance = MockRunner.return_value
+
+        def side_effect_fn(prompt):
+            if "TESTER" in prompt:
+                tester_count["n"] += 1
+                if tester_count["n"] == 1:
+                    return _make_success_result("test_foo FAILED\nTESTS: FAILED")
+                return _make_success_result("TESTS: PASSED")
+            if "REVIEWER" in prompt:
+                return _make_success_result("VERDICT: APPROVED")
+            return _make_success_result("output")
+
+        runner_instance.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is True
+        assert result.revision_count == 1
+        coder_prompts = [
+            c[0][0] for c in runner_instance.run.call_args_list if "CODER" in c[0][0]
+        ]
+        assert "test_foo FAILED" in coder_prompts[1]
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_test_failures_stop_running_reviewer(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 0
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+
+        reviewer_started = threading.Event()
+        reviewer_released = threading.Event()
+
+        def side_effect_fn(prompt):
+            if "TESTER" in prompt:
+                reviewer_started.wait(timeout=5)
+                return _make_success_result("TESTS: FAILED")
+            if "REVIEWER" in prompt:
+                reviewer_started.set()
+                # Blocks until terminated; a real subprocess would be killed
+                assert reviewer_released.wait(timeout=5)
+                return _make_failure_result("Terminated by signal")
+            return _make_success_result("output")
+
+        # One distinct runner per role, as in production
+        def make_runner(agent_config):
+            runner = MagicMock()
+            runner.run.side_effect = side_effect_fn
+            runner.terminate.side_effect = reviewer_released.set
+            return runner
+
+        MockRunner.side_effect = make_runner
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        reviewer_runner = pipeline._runners[AgentRole.REVIEWER]
+        reviewer_runner.terminate.assert_called_once()
+        assert pipeline._runners[AgentRole.TESTER].terminate.call_count == 0
+        assert result.success is False
+        assert "Tests failed" in result.error
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_reviewer_stop_before_its_call_starts_sticks(self, MockRunner, tmp_path):
+        """A stop landing after the reviewer thread starts but before it
+        registers its runner must still skip the reviewer's CLI call."""
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 0
+        cycle_state = MagicMock()
+        pipeline = AgentPipeline(self.config, cycle_state=cycle_state)
+
+        reviewer_entered = threading.Event()
+        reviewer_stopped = threading.Event()
+
+        def update(**kwargs):
+            if kwargs.get("pipeline_agent") == AgentRole.REVIEWER.value:
+                reviewer_entered.set()
+                assert reviewer_stopped.wait(timeout=5)
+
+        cycle_state.update.side_effect = update
+        terminate_runner = pipeline._terminate_runner
+
+        def stop(role):
+            terminate_runner(role)
+            reviewer_stopped.set()
+
+        pipeline._terminate_runner = stop
+
+        def side_effect_fn(prompt):
+            if "TESTER" in prompt:
+                # The reviewer future is running, so cancel() cannot succeed
+                assert reviewer_entered.wait(timeout=5)
+                return _make_success_result("TESTS: FAILED")
+            return _make_success_result("output")
+
+        MockRunner.return_value.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], MagicMock(), "snap")
+
+        prompts = [c[0][0] for c in MockRunner.return_value.run.call_args_list]
+        assert not any("REVIEWER" in p for p in prompts)
+        reviewer = [r for r in result.agent_results if r.role == AgentRole.REVIEWER]
+        assert reviewer[0].success is False
+        assert reviewer[0].error == "Stopped early"
+        assert result.success is False
+
+    @patch("agent_pipeline.ThreadPoolExecutor")
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_cancelled_reviewer_not_recorded(self, MockRunner, MockPool, tmp_path):
+        from concurrent.futures import Future
+
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 0
+        pipeline = AgentPipeline(self.config)
+        # The reviewer is queued but never started, so cancel() succeeds
+        MockPool.return_value.__enter__.return_value.submit.side_effect = (
+            lambda *a, **kw: Future()
+        )
+
+        def side_effect_fn(prompt):
+            if "TESTER" in prompt:
+                return _make_success_result("TESTS: FAILED")
+            return _make_success_result("output")
+
+        MockRunner.return_value.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], MagicMock(), "snap")
+
+        assert result.success is False
+        assert all(r.role != AgentRole.REVIEWER for r in result.agent_results)
+        assert "reviewer" not in result.agent_cost_summary
+
+    def test_terminate_kills_all_active_runners(self, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        pipeline = AgentPipeline(self.config)
+        runners = [MagicMock(), MagicMock()]
+        pipeline._active_runners.update(runners)
+
+        pipeline.terminate()
+
+        for runner in runners:
+            runner.terminate.assert_called_once()
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_rollback_skipped_when_planner_leaves_repo_clean(self, MockRunner, tmp_git_repo):
+        self.config.target_dir = tmp_git_repo
+        self.config.agent_pipeline.reviewer.enabled = False
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+        snapshot = GitManager(tmp_git_repo).create_snapshot()
+
+        MockRunner.return_value.run.return_value = _make_success_result("output")
+
+        result = pipeline.run([MockTask()], rollback_fn, snapshot)
+
+        assert result.success is True
+        rollback_fn.assert_not_called()
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_rollback_skipped_when_planner_only_writes_plan(self, MockRunner, tmp_git_repo):
+        self.config.target_dir = tmp_git_repo
+        self.config.agent_pipeline.reviewer.enabled = False
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+        snapshot = GitManager(tmp_git_repo).create_snapshot()
+        ws_dir = Path(tmp_git_repo) / self.config.paths.agent_workspace_dir
+
+        def side_effect_fn(prompt):
+            if "PLANNER" in prompt:
+                ws_dir.mkdir(parents=True, exist_ok=True)
+                (ws_dir / "plan.md").write_text("1. Fix the bug")
+            return _make_success_result("output")
+
+        MockRunner.return_value.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, snapshot)
+
+        assert result.success is True
+        rollback_fn.assert_not_called()
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_rollback_runs_when_workspace_is_repo_root(self, MockRunner, tmp_git_repo):
+        self.config.target_dir = tmp_git_repo
+        self.config.paths.agent_workspace_dir = "."
+        self.config.agent_pipeline.reviewer.enabled = False
+        pipeline = AgentPipeline(self.config)
+        assert pipeline._status_exclude == ()
+        rollback_fn = MagicMock()
+        snapshot = GitManager(tmp_git_repo).create_snapshot()
+
+        def side_effect_fn(prompt):
+            if "PLANNER" in prompt:
+                Path(tmp_git_repo, "README.md").write_text("changed by planner")
+            return _make_success_result("output")
+
+        MockRunner.return_value.run.side_effect = side_effect_fn
+
+        pipeline.run([MockTask()], rollback_fn, snapshot)
+
+        rollback_fn.assert_called_once_with(snapshot)
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_rollback_runs_when_planner_dirties_repo(self, MockRunner, tmp_git_repo):
+        self.config.target_dir = tmp_git_repo
+        self.config.agent_pipeline.reviewer.enabled = False
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+        snapshot = GitManager(tmp_git_repo).create_snapshot()
+
+        def side_effect_fn(prompt):
+            if "PLANNER" in prompt:
+                Path(tmp_git_repo, "README.md").write_text("changed by planner")
+            return _make_success_result("output")
+
+        MockRunner.return_value.run.side_effect = side_effect_fn
+
+        pipeline.run([MockTask()], rollback_fn, snapshot)
+
+        rollback_fn.assert_called_once_with(snapshot)
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_plan_and_feedback_restored_for_coder(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 1
+        pipeline = AgentPipeline(self.config)
+        rollback_fn = MagicMock()
+        ws_dir = Path(str(tmp_path)) / self.config.paths.agent_workspace_dir
+
+        seen = []
+        reviewer_count = {"n": 0}
+        runner_instance = MockRunner.return_value
+
+        def side_effect_fn(prompt):
+            if "CODER" in prompt:
+                seen.append((
+                    (ws_dir / "plan.md").read_text(),
+                    (ws_dir / "previous_review.md").exists(),
+                    (ws_dir / "review.md").exists(),
+                ))
+            if "REVIEWER" in prompt:
+                reviewer_count["n"] += 1
+                ws_dir.mkdir(parents=True, exist_ok=True)
+                verdict = "REVISE" if reviewer_count["n"] == 1 else "APPROVED"
+                (ws_dir / "review.md").write_text(f"VERDICT: {verdict}")
+            return _make_success_result("the plan")
+
+        runner_instance.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is True
+        # First pass: plan only; revision: plan plus previous review, never a stale review.md
+        assert seen == [("the plan", False, False), ("the plan", True, False)]
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_plan_read_before_rollback_and_reused(self, MockRunner, tmp_path):
+        """plan.md is read once, before rollback can delete it, and reused on revisions."""
+        import shutil
+
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.max_revisions = 1
+        self.config.agent_pipeline.tester.enabled = False
+        pipeline = AgentPipeline(self.config)
+        ws_dir = Path(str(tmp_path)) / self.config.paths.agent_workspace_dir
+        # Simulate git clean -fd removing the untracked workspace
+        rollback_fn = MagicMock(side_effect=lambda snap: shutil.rmtree(ws_dir, ignore_errors=True))
+
+        reviewer_count = {"n": 0}
+        runner_instance = MockRunner.return_value
+
+        def side_effect_fn(prompt):
+            if "PLANNER" in prompt:
+                ws_dir.mkdir(parents=True, exist_ok=True)
+                (ws_dir / "plan.md").write_text("PLAN FROM FILE")
+                return _make_success_result("planner stdout")
+            if "REVIEWER" in prompt:
+                reviewer_count["n"] += 1
+                verdict = "REVISE" if reviewer_count["n"] == 1 else "APPROVED"
+                return _make_success_result(f"VERDICT: {verdict}")
+            return _make_success_result("output")
+
+        runner_instance.run.side_effect = side_effect_fn
+
+        result = pipeline.run([MockTask()], rollback_fn, "snap")
+
+        assert result.success is True
+        coder_prompts = [
+            c[0][0] for c in runner_instance.run.call_args_list if "CODER" in c[0][0]
+        ]
+        assert len(coder_prompts) == 2
+        assert all("PLAN FROM FILE" in p for p in coder_prompts)
+
     def test_per_agent_model_overrides(self, tmp_path):
         """Each agent should get its own model config (no mock on ClaudeRunner)."""
         self.config.target_dir = str(tmp_path)
@@ -325,6 +829,27 @@ class TestAgentPipelineFlow:
         assert reviewer_runner.config.claude.model == "opus"
         assert reviewer_runner.config.claude.max_turns == 10
 
+    def test_runner_cached_per_role(self, tmp_path):
+        """Each role's runner is built once and reused across calls."""
+        self.config.target_dir = str(tmp_path)
+        pipeline = AgentPipeline(self.config)
+
+        planner_runner = pipeline._build_runner_for_agent(AgentRole.PLANNER)
+        assert pipeline._build_runner_for_agent(AgentRole.PLANNER) is planner_runner
+        assert pipeline._build_runner_for_agent(AgentRole.CODER) is not planner_runner
+
+    def test_agent_runner_does_not_mutate_parent_config(self, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.claude.resolved_model = "claude-opus-4-6"
+        self.config.agent_pipeline.coder.model = "haiku"
+        pipeline = AgentPipeline(self.config)
+
+        runner = pipeline._build_runner_for_agent(AgentRole.CODER)
+
+        assert runner.config.claude is not self.config.claude
+        assert self.config.claude.model == "opus"
+        assert self.config.claude.resolved_model == "claude-opus-4-6"
+
     @patch("agent_pipeline.ClaudeRunner")
     def test_cost_accumulation(self, MockRunner, tmp_path):
         """Total cost should accumulate across all agents."""
@@ -354,6 +879,37 @@ class TestAgentPipelineFlow:
         assert result.total_cost_usd == pytest.approx(0.28)
         assert result.total_duration_seconds == pytest.approx(14.0)
 
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_persistent_sessions_use_send_and_close(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.reviewer.enabled = False
+        self.config.agent_pipeline.persistent_sessions = True
+        pipeline = AgentPipeline(self.config)
+
+        runner_instance = MockRunner.return_value
+        runner_instance.send.return_value = _make_success_result("output")
+
+        result = pipeline.run([MockTask()], MagicMock(), "snap")
+
+        assert result.success is True
+        assert runner_instance.send.call_count == 3
+        runner_instance.run.assert_not_called()
+        assert runner_instance.close.called
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_sessions_not_used_by_default(self, MockRunner, tmp_path):
+        self.config.target_dir = str(tmp_path)
+        self.config.agent_pipeline.reviewer.enabled = False
+        pipeline = AgentPipeline(self.config)
+
+        runner_instance = MockRunner.return_value
+        runner_instance.run.return_value = _make_success_result("output")
+
+        pipeline.run([MockTask()], MagicMock(), "snap")
+
+        runner_instance.send.assert_not_called()
+        runner_instance.close.assert_not_called()
+
     @patch("agent_pipeline.ClaudeRunner")
     def test_multiple_tasks(self, MockRunner, tmp_path):
         """Pipeline should handle batch tasks."""
@@ -378,6 +934,12 @@ class TestAgentPipelineFlow:
         assert "Task A" in first_call_prompt
         assert "Task B" in first_call_prompt
 
+    def test_build_task_description(self):
+        pipeline = AgentPipeline(self.config)
+        assert pipeline._build_task_description([MockTask(description="Only")]) == "Only"
+        tasks = [MockTask(description="Task A"), MockTask(description="Task B")]
+        assert pipeline._build_task_description(tasks) == "1. Task A\n2. Task B"
+
     def test_resolved_model_propagated_to_agent_runner(self, tmp_path):
         """Agent runners should use their role-specific model, not the parent's resolved_model."""
         self.config.target_dir = str(tmp_path)
@@ -460,6 +1022,81 @@ class TestPipelineCostGuard:
         assert "cost limit" in result.error.lower()
 
 
+class TestRunBatch:
+    def _approve_all(self, prompt):
+        return _make_success_result("VERDICT: APPROVED" if "REVIEWER" in prompt else "output")
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_groups_run_concurrently_in_separate_dirs(self, MockRunner, tmp_path):
+        config = Config()
+        config.target_dir = str(tmp_path)
+        config.parallel.max_workers = 2
+        pipeline = AgentPipeline(config)
+        dir_a, dir_b = tmp_path / "a", tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+
+        # Both planners must be in flight at once or the barrier times out.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def side_effect_fn(prompt):
+            if "PLANNER" in prompt:
+                barrier.wait()
+            return self._approve_all(prompt)
+
+        MockRunner.return_value.run.side_effect = side_effect_fn
+        rollback_a, rollback_b = MagicMock(), MagicMock()
+
+        results = pipeline.run_batch([
+            ([MockTask(description="Task A")], str(dir_a), rollback_a, "snap-a"),
+            ([MockTask(description="Task B")], str(dir_b), rollback_b, "snap-b"),
+        ])
+
+        assert [r.success for r in results] == [True, True]
+        rollback_a.assert_called_with("snap-a")
+        rollback_b.assert_called_with("snap-b")
+
+    def test_shared_target_dir_rejected(self, tmp_path):
+        config = Config()
+        config.target_dir = str(tmp_path)
+        pipeline = AgentPipeline(config)
+        groups = [
+            ([MockTask()], str(tmp_path), MagicMock(), "s1"),
+            ([MockTask()], str(tmp_path), MagicMock(), "s2"),
+        ]
+        with pytest.raises(ValueError, match="distinct target_dir"):
+            pipeline.run_batch(groups)
+
+    def test_empty_batch(self, tmp_path):
+        config = Config()
+        config.target_dir = str(tmp_path)
+        assert AgentPipeline(config).run_batch([]) == []
+
+    @patch("agent_pipeline.ClaudeRunner")
+    def test_cost_guard_shared_across_groups(self, MockRunner, tmp_path):
+        config = Config()
+        config.target_dir = str(tmp_path)
+        config.parallel.max_workers = 1  # deterministic ordering
+        config.agent_pipeline.max_pipeline_cost_usd = 0.30
+        pipeline = AgentPipeline(config)
+        dir_a, dir_b = tmp_path / "a", tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+
+        MockRunner.return_value.run.side_effect = lambda prompt: ClaudeResult(
+            success=True, result_text="output", cost_usd=0.20, duration_seconds=1.0,
+        )
+
+        results = pipeline.run_batch([
+            ([MockTask()], str(dir_a), MagicMock(), "snap-a"),
+            ([MockTask()], str(dir_b), MagicMock(), "snap-b"),
+        ])
+
+        # Group A's planner alone stays under budget; by the time group B
+        # has planned, the combined spend exceeds it.
+        assert "cost limit" in results[1].error.lower()
+
+
 class TestBuildRunnerValidation:
     """Test that _build_runner_for_agent validates role config attributes."""
 
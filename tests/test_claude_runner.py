@@ -1,13 +1,20 @@
 """Tests for claude_runner module."""
 
+import io
 import json
 import subprocess
+import sys
+import textwrap
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from claude_runner import CircuitBreaker, ClaudeResult, ClaudeRunner
+from claude_runner import (
+    CircuitBreaker, ClaudeResult, ClaudeRunner, ClaudeSession, ClaudeSessionError,
+    SessionPool, _resolve_dir,
+)
 from config_schema import Config
 
 
@@ -29,6 +36,14 @@ class TestBuildCommand:
         assert "--output-format" in cmd
         assert "json" in cmd
 
+    def test_build_command_tracks_config_changes(self, runner):
+        first = runner._build_command("a")
+        runner.config.claude.max_turns = 7
+        second = runner._build_command("b")
+        assert first[first.index("--max-turns") + 1] == "25"
+        assert second[second.index("--max-turns") + 1] == "7"
+        assert second[:3] == [runner.config.claude.command, "-p", "b"]
+
     def test_build_command_uses_resolved_model(self):
         config = Config()
         config.claude.resolved_model = "claude-opus-4-6"
@@ -46,6 +61,58 @@ class TestBuildCommand:
         assert cmd[model_idx] == "opus"
 
 
+class TestSessionContinuity:
+    def test_no_session_flags_by_default(self, runner):
+        cmd = runner._build_command("test")
+        assert "--session-id" not in cmd
+        assert "--resume" not in cmd
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_first_call_creates_then_resumes(self, mock_popen, default_config):
+        runner = ClaudeRunner(default_config, session_id="abc-123")
+        assert runner._build_command("test")[-2:] == ["--session-id", "abc-123"]
+
+        mock_popen.return_value = _make_popen_mock(
+            stdout=json.dumps({"result": "ok", "session_id": "abc-123"}),
+        )
+        result = runner.run("test")
+
+        assert result.session_id == "abc-123"
+        assert runner._build_command("again")[-2:] == ["--resume", "abc-123"]
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_spawned_call_switches_to_resume_even_on_failure(self, mock_popen, default_config):
+        runner = ClaudeRunner(default_config, session_id="abc-123")
+        runner.max_retries = 0
+        mock_popen.return_value = _make_popen_mock(stdout="not json")
+        runner.run("test")
+        assert runner._build_command("again")[-2:] == ["--resume", "abc-123"]
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_retry_after_failed_first_attempt_resumes(self, mock_popen, default_config):
+        runner = ClaudeRunner(default_config, session_id="abc-123")
+        runner.max_retries = 1
+        runner.retry_delays = [0]
+        procs = iter([
+            _make_popen_mock(returncode=1, stderr="boom"),
+            _make_popen_mock(stdout=json.dumps({"result": "ok", "session_id": "abc-123"})),
+        ])
+        cmds = []
+
+        def spawn(cmd, **kwargs):
+            cmds.append(list(cmd))
+            return next(procs)
+
+        mock_popen.side_effect = spawn
+
+        result = runner.run("test")
+
+        assert result.success is True
+        first_cmd, retry_cmd = cmds
+        assert first_cmd[-2:] == ["--session-id", "abc-123"]
+        assert retry_cmd[-2:] == ["--resume", "abc-123"]
+
+
 class TestParseJsonResponse:
     def test_clean_json(self, runner):
         stdout = '{"result": "Fixed it", "cost_usd": 0.05}'
@@ -168,6 +235,48 @@ class TestParseJsonResponse:
         assert data["result"] == 'Use {"key": "val"} syntax'
         assert data["cost_usd"] == 0.01
 
+    def test_last_object_wins(self, runner):
+        stdout = '{"type": "progress"}\n{"result": "Done"}\n'
+        assert runner._parse_json_response(stdout) == {"result": "Done"}
+
+    def test_nested_last_member_not_mistaken_for_result(self, runner):
+        stdout = 'Banner\n{\n  "result": "Done",\n  "meta": {"k": 1}\n}\n'
+        data = runner._parse_json_response(stdout)
+        assert data["result"] == "Done"
+        assert data["meta"] == {"k": 1}
+
+    def test_multiline_json_after_large_banner(self, runner):
+        banner = "log line without braces\n" * 50000
+        stdout = banner + '{\n  "result": "Done"\n}\n'
+        assert runner._parse_json_response(stdout)["result"] == "Done"
+
+    def test_column_zero_object_tried_first(self, runner):
+        stdout = 'Banner\n{\n  "result": "Done",\n  "meta": {"a": {"b": 1}}\n}\n'
+        with patch.object(ClaudeRunner, "_decode_object_at",
+                          wraps=ClaudeRunner._decode_object_at) as decode:
+            data = runner._parse_json_response(stdout, try_lines=False)
+        assert data["result"] == "Done"
+        decode.assert_called_once_with(stdout, stdout.index("\n{") + 1)
+
+    def test_bare_multiline_object_decoded_in_one_call(self, runner):
+        stdout = '\n{\n  "result": "Done",\n  "meta": {"k": 1}\n}\n'
+        with patch.object(ClaudeRunner, "_decode_object_at") as decode:
+            data = runner._parse_json_response(stdout, try_lines=False)
+        assert data == {"result": "Done", "meta": {"k": 1}}
+        decode.assert_not_called()
+
+    def test_try_lines_false_skips_line_strategy(self, runner):
+        with patch("claude_runner._json_loads") as loads:
+            data = runner._parse_json_response('Info: {"result": "ok"}\n', try_lines=False)
+        assert data == {"result": "ok"}
+        loads.assert_not_called()
+
+    def test_line_parsing_uses_module_loader(self, runner):
+        """Per-line parsing goes through _json_loads (orjson when installed)."""
+        with patch("claude_runner._json_loads", side_effect=json.loads) as loads:
+            assert runner._parse_json_response('banner\n{"result": "ok"}\n') == {"result": "ok"}
+        loads.assert_called_once_with('{"result": "ok"}')
+
     def test_multiline_json_with_braces_in_strings(self, runner):
         """Multiline JSON where string values contain unmatched braces."""
         stdout = (
@@ -184,15 +293,17 @@ class TestParseJsonResponse:
         assert data["cost_usd"] == 0.02
 
 
-def _make_popen_mock(returncode=0, stdout="", stderr="", communicate_effect=None):
+def _make_popen_mock(returncode=0, stdout="", stderr="", wait_effect=None):
     """Create a mock subprocess.Popen that behaves like the real thing."""
     mock_proc = MagicMock()
     mock_proc.pid = 12345
     mock_proc.returncode = returncode
-    if communicate_effect is not None:
-        mock_proc.communicate.side_effect = communicate_effect
+    mock_proc.stdout = io.BytesIO(stdout.encode())
+    mock_proc.stderr = io.BytesIO(stderr.encode())
+    if wait_effect is not None:
+        mock_proc.wait.side_effect = wait_effect
     else:
-        mock_proc.communicate.return_value = (stdout, stderr)
+        mock_proc.wait.return_value = returncode
     return mock_proc
 
 
@@ -220,6 +331,17 @@ class TestRun:
         popen_call = mock_popen.call_args
         assert popen_call.kwargs["cwd"] == runner.config.target_dir
 
+    @patch("claude_runner.subprocess.Popen")
+    def test_spawn_keeps_fast_fork_path(self, mock_popen, runner):
+        """No preexec_fn or pass_fds, which would force a slow fork+exec."""
+        mock_popen.return_value = _make_popen_mock(stdout='{"result": "Done"}')
+        runner.run("Fix the bug")
+        kwargs = mock_popen.call_args.kwargs
+        assert "preexec_fn" not in kwargs
+        assert "pass_fds" not in kwargs
+        assert "close_fds" not in kwargs
+        assert kwargs["start_new_session"] is True
+
     @patch("claude_runner.subprocess.Popen")
     def test_add_dirs_appends_flags(self, mock_popen, runner):
         """add_dirs should append --add-dir flags to the command."""
@@ -236,6 +358,33 @@ class TestRun:
         assert "/tmp/worktree-0" in dirs[0]
         assert "/tmp/worktree-1" in dirs[1]
 
+    @patch("claude_runner.subprocess.Popen")
+    def test_add_dirs_deduplicated(self, mock_popen, runner, tmp_path):
+        mock_popen.return_value = _make_popen_mock(
+            stdout='{"result": "Done", "cost_usd": 0.01}',
+        )
+        other = tmp_path / "other"
+        other.mkdir()
+        runner.run("Fix", add_dirs=[str(tmp_path), str(other), str(tmp_path / ".")])
+        cmd = mock_popen.call_args[0][0]
+        dirs = [cmd[i + 1] for i, x in enumerate(cmd) if x == "--add-dir"]
+        assert dirs == [str(tmp_path.resolve()), str(other.resolve())]
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_add_dirs_resolved_once_per_path(self, mock_popen, runner, tmp_path):
+        mock_popen.side_effect = lambda *a, **k: _make_popen_mock(
+            stdout='{"result": "Done", "cost_usd": 0.01}',
+        )
+        _resolve_dir.cache_clear()
+        with patch("claude_runner.Path.resolve", autospec=True,
+                   side_effect=lambda p: p) as mock_resolve:
+            runner.run("one", add_dirs=[str(tmp_path)])
+            runner.run("two", add_dirs=[str(tmp_path)])
+        _resolve_dir.cache_clear()
+        assert mock_resolve.call_count == 1
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("--add-dir") + 1] == str(tmp_path)
+
     @patch("claude_runner.subprocess.Popen")
     def test_add_dirs_none_no_flags(self, mock_popen, runner):
         """When add_dirs is None, no --add-dir flags should be added."""
@@ -250,7 +399,7 @@ class TestRun:
     @patch("claude_runner.subprocess.Popen")
     def test_timeout(self, mock_popen, runner):
         mock_popen.return_value = _make_popen_mock(
-            communicate_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300),
+            wait_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300),
         )
         result = runner.run("Fix the bug")
         assert result.success is False
@@ -284,14 +433,158 @@ class TestRun:
         assert "parse" in result.error.lower()
 
 
+class TestStreamOutput:
+    """_stream_output against a real process."""
+
+    def _spawn(self, code):
+        return subprocess.Popen(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+
+    def test_result_line_decoded_while_streaming(self, runner):
+        proc = self._spawn(
+            "import sys\n"
+            "print('banner')\n"
+            "print('{\"result\": \"ok\"}')\n"
+            "print('trailing log')\n"
+            "sys.stderr.write('warn')\n"
+        )
+        stdout, stderr, data = runner._stream_output(proc, timeout=10)
+        assert data == {"result": "ok"}
+        assert stdout.splitlines() == [b"banner", b'{"result": "ok"}', b"trailing log"]
+        assert stderr == "warn"
+        assert proc.returncode == 0
+
+    def test_multiline_json_left_for_fallback_parser(self, runner):
+        proc = self._spawn("print('{\\n  \"result\": \"ok\"\\n}')")
+        stdout, _, data = runner._stream_output(proc, timeout=10)
+        assert data is None
+        assert runner._parse_json_response(stdout.decode()) == {"result": "ok"}
+
+    def test_invalid_utf8_line_skipped(self, runner):
+        proc = self._spawn(
+            "import sys\n"
+            "sys.stdout.buffer.write(b'{\"bad\": \"\\xff\"}\\n{\"result\": \"ok\"}\\n')\n"
+        )
+        _, _, data = runner._stream_output(proc, timeout=10)
+        assert data == {"result": "ok"}
+
+    def test_timeout_kills_process(self, runner):
+        proc = self._spawn("import time; print('started', flush=True); time.sleep(30)")
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            runner._stream_output(proc, timeout=0.5)
+        assert time.monotonic() - start < 10
+        assert proc.poll() is not None
+
+
+class TestTerminate:
+    def test_terminate_kills_current_process(self, runner):
+        proc = MagicMock()
+        runner._current_process = proc
+        with patch.object(runner, "_kill_process") as mock_kill:
+            runner.terminate()
+        mock_kill.assert_called_once_with(proc)
+        assert runner._terminated is True
+
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_terminate_racing_spawn_kills_new_process(self, mock_popen, mock_sleep, runner):
+        """A terminate() landing while Popen runs still kills the new process."""
+        proc = _make_popen_mock(returncode=-9)
+
+        def spawn(*args, **kwargs):
+            runner.terminate()  # _current_process is still None here
+            return proc
+
+        mock_popen.side_effect = spawn
+        with patch.object(runner, "_kill_process") as mock_kill:
+            result = runner.run("Fix the bug")
+        mock_kill.assert_called_once_with(proc)
+        assert result.success is False
+        assert "Terminated" in result.error
+        assert runner._current_process is None
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_terminate_before_run_stops_that_run(self, mock_popen, runner):
+        """A terminate() landing before run() starts is not reset by it."""
+        mock_popen.return_value = _make_popen_mock(stdout='{"result": "ok"}')
+        runner.terminate()
+        result = runner.run("Fix the bug")
+        assert result.success is False
+        assert "Terminated" in result.error
+        mock_popen.assert_not_called()
+        # The stop covers one call only
+        assert runner.run("Fix the bug").success is True
+
+
+class TestRunMany:
+    @patch("claude_runner.subprocess.Popen")
+    def test_results_in_prompt_order(self, mock_popen, runner):
+        def spawn(cmd, **kwargs):
+            time.sleep(0.05 if cmd[2] == "first" else 0)
+            return _make_popen_mock(stdout=json.dumps({"result": cmd[2]}))
+
+        mock_popen.side_effect = spawn
+        results = runner.run_many(["first", "second", "third"], max_workers=3)
+        assert [r.result_text for r in results] == ["first", "second", "third"]
+        assert mock_popen.call_count == 3
+
+    def test_empty_batch(self, runner):
+        assert runner.run_many([]) == []
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_children_share_circuit_breaker(self, mock_popen, runner):
+        mock_popen.return_value = _make_popen_mock(returncode=0, stdout='{"result": "ok"}')
+        seen = []
+        original = ClaudeRunner._run_child
+
+        def record(self, child, prompt):
+            seen.append(child.circuit_breaker)
+            return original(self, child, prompt)
+
+        with patch.object(ClaudeRunner, "_run_child", record):
+            runner.run_many(["a", "b"])
+        assert seen == [runner.circuit_breaker, runner.circuit_breaker]
+        assert runner._batch_runners == []
+
+    def test_terminate_reaches_children(self, runner):
+        child = MagicMock()
+        runner._batch_runners = [child]
+        runner.terminate()
+        child.terminate.assert_called_once_with()
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_terminated_batch_skips_remaining_prompts(self, mock_popen, runner):
+        def spawn(cmd, **kwargs):
+            runner.terminate()
+            return _make_popen_mock(stdout='{"result": "ok"}')
+
+        mock_popen.side_effect = spawn
+        results = runner.run_many(["a", "b", "c"], max_workers=1)
+        assert mock_popen.call_count == 1
+        assert all("Terminated" in r.error for r in results[1:])
+
+
 class TestRetryLogic:
-    @patch("claude_runner.time.sleep")
+    def test_terminate_cuts_backoff_short(self, runner):
+        """terminate() from another thread ends a retry wait immediately."""
+        timer = threading.Timer(0.2, runner.terminate)
+        timer.start()
+        start = time.monotonic()
+        runner._backoff(30)
+        assert time.monotonic() - start < 5
+        timer.join()
+
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_retry_on_timeout(self, mock_popen, mock_sleep, runner):
         """Retries on TimeoutExpired, succeeds on third attempt."""
         mock_popen.side_effect = [
-            _make_popen_mock(communicate_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300)),
-            _make_popen_mock(communicate_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300)),
+            _make_popen_mock(wait_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300)),
+            _make_popen_mock(wait_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300)),
             _make_popen_mock(returncode=0, stdout='{"result": "Done", "cost_usd": 0.01}'),
         ]
         result = runner.run("Fix the bug")
@@ -302,7 +595,7 @@ class TestRetryLogic:
         mock_sleep.assert_any_call(2)
         mock_sleep.assert_any_call(8)
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_retry_on_nonzero_exit(self, mock_popen, mock_sleep, runner):
         """Retries on non-zero exit code, succeeds on third attempt."""
@@ -316,7 +609,7 @@ class TestRetryLogic:
         assert result.result_text == "Fixed"
         assert mock_popen.call_count == 3
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_no_retry_on_file_not_found(self, mock_popen, mock_sleep, runner):
         """FileNotFoundError is not retryable — returns immediately."""
@@ -327,7 +620,7 @@ class TestRetryLogic:
         assert mock_popen.call_count == 1
         mock_sleep.assert_not_called()
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_no_retry_on_json_parse_failure(self, mock_popen, mock_sleep, runner):
         """JSON parse failure is not retryable — CLI ran fine, output was bad."""
@@ -341,12 +634,12 @@ class TestRetryLogic:
         assert mock_popen.call_count == 1
         mock_sleep.assert_not_called()
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_all_retries_exhausted(self, mock_popen, mock_sleep, runner):
         """All retries exhausted returns failure."""
         mock_popen.side_effect = [
-            _make_popen_mock(communicate_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300))
+            _make_popen_mock(wait_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300))
             for _ in range(4)
         ]
         result = runner.run("Fix the bug")
@@ -355,19 +648,32 @@ class TestRetryLogic:
         assert mock_popen.call_count == 4  # 1 initial + 3 retries
         assert mock_sleep.call_count == 3
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_retry_delays_are_exponential(self, mock_popen, mock_sleep, runner):
         """Verify exponential backoff delays: 2, 8, 32."""
         mock_popen.side_effect = [
-            _make_popen_mock(communicate_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300))
+            _make_popen_mock(wait_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300))
             for _ in range(4)
         ]
         runner.run("Fix the bug")
         delays = [call.args[0] for call in mock_sleep.call_args_list]
         assert delays == [2, 8, 32]
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_empty_retry_delays_retry_immediately(self, mock_popen, mock_sleep, default_config):
+        default_config.claude.retry_delays = []
+        runner = ClaudeRunner(default_config)
+        mock_popen.side_effect = [
+            _make_popen_mock(wait_effect=subprocess.TimeoutExpired(cmd="claude", timeout=300)),
+            _make_popen_mock(returncode=0, stdout='{"result": "Done", "cost_usd": 0.01}'),
+        ]
+        result = runner.run("Fix the bug")
+        assert result.success is True
+        mock_sleep.assert_called_once_with(0)
+
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_retry_on_os_error(self, mock_popen, mock_sleep, runner):
         """Retries on OSError, succeeds on second attempt."""
@@ -380,12 +686,38 @@ class TestRetryLogic:
         assert mock_popen.call_count == 2
         mock_sleep.assert_called_once_with(2)
 
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_unlisted_exit_code_not_retried(self, mock_popen, mock_sleep, default_config):
+        default_config.claude.retryable_exit_codes = [1, 124]
+        runner = ClaudeRunner(default_config)
+        mock_popen.return_value = _make_popen_mock(returncode=2, stderr="bad usage")
+        result = runner.run("Fix the bug")
+        assert result.success is False
+        assert "code 2" in result.error
+        assert mock_popen.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_listed_exit_code_retried(self, mock_popen, mock_sleep, default_config):
+        default_config.claude.retryable_exit_codes = [1, 124]
+        runner = ClaudeRunner(default_config)
+        mock_popen.side_effect = [
+            _make_popen_mock(returncode=124, stderr="timeout"),
+            _make_popen_mock(returncode=0, stdout='{"result": "Done"}'),
+        ]
+        result = runner.run("Fix the bug")
+        assert result.success is True
+        assert mock_popen.call_count == 2
+
 
 class TestRateLimitBackoff:
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.random.uniform", side_effect=lambda low, high: high)
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
-    def test_rate_limit_exponential_backoff(self, mock_popen, mock_sleep, runner):
-        """Rate limit errors should use exponential backoff (5, 15, 45) not fixed delays."""
+    def test_rate_limit_exponential_backoff(self, mock_popen, mock_sleep, mock_uniform, runner):
+        """Rate limit waits are drawn up to an exponential ceiling (5, 15, 45)."""
         mock_popen.side_effect = [
             _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
             _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
@@ -395,10 +727,65 @@ class TestRateLimitBackoff:
         result = runner.run("Fix the bug")
         assert result.success is False
         delays = [call.args[0] for call in mock_sleep.call_args_list]
-        # Exponential: 5 * 3^0 = 5, 5 * 3^1 = 15, 5 * 3^2 = 45
+        # Ceilings: 5 * 3^0 = 5, 5 * 3^1 = 15, 5 * 3^2 = 45
         assert delays == [5, 15, 45]
+        assert all(call.args[0] == 0 for call in mock_uniform.call_args_list)
+
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_rate_limit_backoff_is_jittered(self, mock_popen, mock_sleep, runner):
+        mock_popen.side_effect = [
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+        ]
+        runner.run("Fix the bug")
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        for delay, ceiling in zip(delays, [5, 15, 45]):
+            assert 0 <= delay <= ceiling
+
+    @patch("claude_runner.random.uniform", side_effect=lambda low, high: high)
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_rate_limit_backoff_capped(self, mock_popen, mock_sleep, mock_uniform, runner):
+        runner.rate_limit_max_delay = 10
+        mock_popen.side_effect = [
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+            _make_popen_mock(returncode=1, stderr="rate limit exceeded"),
+        ]
+        runner.run("Fix the bug")
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [5, 10, 10]
+
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_uppercase_stderr_classified_without_lowering(self, mock_popen, mock_sleep, runner):
+        runner.max_retries = 1
+        mock_popen.side_effect = [
+            _make_popen_mock(returncode=1, stderr="RATE LIMIT EXCEEDED; RETRY-AFTER: 7"),
+            _make_popen_mock(returncode=1, stderr="SERVICE UNAVAILABLE"),
+        ]
+        with patch.object(runner.circuit_breaker, "record_failure") as record_failure:
+            result = runner.run("Fix the bug")
+        assert result.success is False
+        mock_sleep.assert_called_once_with(7)
+        record_failure.assert_called_once()
+
+    @patch("claude_runner.ClaudeRunner._backoff")
+    @patch("claude_runner.subprocess.Popen")
+    def test_retry_after_hint_honored(self, mock_popen, mock_sleep, runner):
+        mock_popen.side_effect = [
+            _make_popen_mock(returncode=1, stderr="429 Too Many Requests; Retry-After: 12"),
+            _make_popen_mock(returncode=0, stdout='{"result": "Done", "cost_usd": 0.01}'),
+        ]
+        result = runner.run("Fix the bug")
+        assert result.success is True
+        mock_sleep.assert_called_once_with(12)
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
     def test_non_rate_limit_uses_fixed_delays(self, mock_popen, mock_sleep, runner):
         """Non-rate-limit errors should still use the fixed delays (2, 8, 32)."""
@@ -413,9 +800,10 @@ class TestRateLimitBackoff:
         delays = [call.args[0] for call in mock_sleep.call_args_list]
         assert delays == [2, 8, 32]
 
-    @patch("claude_runner.time.sleep")
+    @patch("claude_runner.random.uniform", side_effect=lambda low, high: high)
+    @patch("claude_runner.ClaudeRunner._backoff")
     @patch("claude_runner.subprocess.Popen")
-    def test_rate_limit_429_detected(self, mock_popen, mock_sleep, runner):
+    def test_rate_limit_429_detected(self, mock_popen, mock_sleep, mock_uniform, runner):
         """429 in stderr should trigger rate limit backoff."""
         mock_popen.side_effect = [
             _make_popen_mock(returncode=1, stderr="HTTP 429 Too Many Requests"),
@@ -423,7 +811,30 @@ class TestRateLimitBackoff:
         ]
         result = runner.run("Fix the bug")
         assert result.success is True
-        mock_sleep.assert_called_once_with(5)  # 5 * 3^0 = 5
+        mock_sleep.assert_called_once_with(5)  # ceiling 5 * 3^0 = 5
+
+
+class TestKeepRaw:
+    @patch("claude_runner.subprocess.Popen")
+    def test_raw_json_dropped_by_default(self, mock_popen, runner):
+        mock_popen.return_value = _make_popen_mock(stdout='{"result": "Done", "usage": {}}')
+        result = runner.run("Fix the bug")
+        assert result.result_text == "Done"
+        assert result.raw_json is None
+
+    @patch("claude_runner.subprocess.Popen")
+    def test_raw_json_kept_on_request(self, mock_popen, default_config):
+        runner = ClaudeRunner(default_config, keep_raw=True)
+        mock_popen.return_value = _make_popen_mock(stdout='{"result": "Done", "usage": {}}')
+        result = runner.run("Fix the bug")
+        assert result.raw_json == {"result": "Done", "usage": {}}
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_result_is_slotted(self):
+        result = ClaudeResult(success=True)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_field = 1
 
 
 class TestCostParsing:
@@ -527,6 +938,19 @@ class TestCircuitBreaker:
         cb = CircuitBreaker()
         assert cb.state == CircuitBreaker.STATE_CLOSED
 
+    def test_closed_fast_path_skips_lock(self):
+        cb = CircuitBreaker()
+        cb._lock = MagicMock()
+        assert cb.allow_request() is True
+        cb.record_success()
+        cb._lock.__enter__.assert_not_called()
+
+    def test_success_after_failure_still_resets(self):
+        cb = CircuitBreaker(failure_threshold=3)
+        cb.record_failure()
+        cb.record_success()
+        assert cb._consecutive_failures == 0
+
     def test_allow_request_when_closed(self):
         cb = CircuitBreaker()
         assert cb.allow_request() is True
@@ -661,3 +1085,179 @@ class TestCircuitBreakerIntegration:
         assert ClaudeRunner._is_circuit_breaker_error("server is overloaded") is True
         assert ClaudeRunner._is_circuit_breaker_error("normal error") is False
         assert ClaudeRunner._is_circuit_breaker_error("success") is False
+
+
+# A stand-in for `claude -p --input-format stream-json --output-format stream-json`:
+# answers each stdin message with a system event and a result event whose
+# total_cost_usd is cumulative, and exits on "exit".
+_FAKE_CLI = textwrap.dedent("""
+    import json, sys
+    turn = 0
+    for line in sys.stdin:
+        content = json.loads(line)["message"]["content"]
+        if content == "exit":
+            sys.exit(3)
+        turn += 1
+        print(json.dumps({"type": "system", "subtype": "init"}), flush=True)
+        print(json.dumps({
+            "type": "result", "result": "echo " + content,
+            "total_cost_usd": 0.5 * turn, "duration_ms": 1000, "num_turns": 1,
+        }), flush=True)
+""")
+
+
+@pytest.fixture
+def fake_cli_cmd(tmp_path):
+    script = tmp_path / "fake_claude.py"
+    script.write_text(_FAKE_CLI)
+    return [sys.executable, str(script)]
+
+
+class TestClaudeSession:
+    def test_prompts_share_one_process(self, fake_cli_cmd, tmp_path):
+        session = ClaudeSession(fake_cli_cmd, str(tmp_path))
+        session.start()
+        try:
+            first = session.send("one", timeout=10)
+            second = session.send("two", timeout=10)
+            assert first["result"] == "echo one"
+            assert second["result"] == "echo two"
+            assert session.alive
+        finally:
+            session.close()
+        assert not session.alive
+
+    def test_cost_is_per_prompt(self, fake_cli_cmd, tmp_path):
+        session = ClaudeSession(fake_cli_cmd, str(tmp_path))
+        session.start()
+        try:
+            assert session.send("one", timeout=10)["total_cost_usd"] == pytest.approx(0.5)
+            assert session.send("two", timeout=10)["total_cost_usd"] == pytest.approx(0.5)
+        finally:
+            session.close()
+
+    def test_process_exit_raises(self, fake_cli_cmd, tmp_path):
+        session = ClaudeSession(fake_cli_cmd, str(tmp_path))
+        session.start()
+        try:
+            with pytest.raises(ClaudeSessionError):
+                session.send("exit", timeout=10)
+        finally:
+            session.close()
+
+    def test_send_without_start_raises(self, fake_cli_cmd, tmp_path):
+        with pytest.raises(ClaudeSessionError):
+            ClaudeSession(fake_cli_cmd, str(tmp_path)).send("one", timeout=1)
+
+
+class TestRunnerSend:
+    def test_send_reuses_session(self, runner, fake_cli_cmd, tmp_path):
+        runner.config.target_dir = str(tmp_path)
+        with patch.object(runner, "_build_session_command", return_value=fake_cli_cmd), \
+                patch.object(runner, "_run_cold") as mock_cold:
+            try:
+                first = runner.send("one")
+                second = runner.send("two")
+                assert len(runner._pool._idle) == 1
+            finally:
+                runner.close()
+        assert first.success and first.result_text == "echo one"
+        assert second.result_text == "echo two"
+        assert second.cost_usd == pytest.approx(0.5)
+        mock_cold.assert_not_called()
+        assert runner._pool._idle == []
+
+    def test_send_falls_back_to_cold_spawn_when_session_dies(
+        self, runner, fake_cli_cmd, tmp_path,
+    ):
+        runner.config.target_dir = str(tmp_path)
+        fallback = ClaudeResult(success=True, result_text="cold")
+        with patch.object(runner, "_build_session_command", return_value=fake_cli_cmd), \
+                patch.object(runner, "_run_cold", return_value=fallback) as mock_cold:
+            result = runner.send("exit")
+        assert result is fallback
+        mock_cold.assert_called_once_with("exit")
+        assert runner._pool._idle == []
+
+    def test_send_blocked_by_open_circuit_breaker(self, runner):
+        runner.circuit_breaker._state = CircuitBreaker.STATE_OPEN
+        runner.circuit_breaker._opened_at = time.monotonic()
+        with patch.object(runner._pool, "acquire") as mock_acquire:
+            result = runner.send("one")
+        assert result.success is False
+        assert "Circuit breaker" in result.error
+        mock_acquire.assert_not_called()
+
+    def test_session_command_uses_stream_json(self, runner):
+        cmd = runner._build_session_command()
+        assert cmd[:2] == [runner.config.claude.command, "-p"]
+        assert cmd[cmd.index("--input-format") + 1] == "stream-json"
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+
+    def test_run_uses_pool_when_enabled(self, runner):
+        runner.config.claude.session_pool_size = 2
+        with patch.object(runner, "send", return_value=ClaudeResult(success=True)) as mock_send, \
+                patch.object(runner, "_run_cold") as mock_cold:
+            runner.run("one")
+            runner.run("two", add_dirs=["/tmp"])
+        mock_send.assert_called_once_with("one")
+        mock_cold.assert_called_once_with("two", ["/tmp"])
+
+
+def _fake_session(alive=True):
+    session = MagicMock(spec=ClaudeSession)
+    session.alive = alive
+    return session
+
+
+class TestSessionPool:
+    def test_reuses_released_session(self):
+        factory = MagicMock(side_effect=lambda: _fake_session())
+        pool = SessionPool(factory, size=2, idle_timeout=60)
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        assert factory.call_count == 1
+
+    def test_exhausted_pool_returns_none(self):
+        pool = SessionPool(lambda: _fake_session(), size=1, idle_timeout=60)
+        assert pool.acquire() is not None
+        assert pool.acquire() is None
+
+    def test_unhealthy_release_closes_session(self):
+        pool = SessionPool(lambda: _fake_session(), size=1, idle_timeout=60)
+        session = pool.acquire()
+        pool.release(session, healthy=False)
+        session.close.assert_called_once()
+        assert pool.acquire() is not session
+
+    def test_idle_sessions_are_reaped(self):
+        pool = SessionPool(lambda: _fake_session(), size=1, idle_timeout=60)
+        session = pool.acquire()
+        pool.release(session)
+        with patch("claude_runner.time.monotonic", return_value=time.monotonic() + 120):
+            assert pool.reap() == 1
+        session.close.assert_called_once()
+        pool.close()
+
+    def test_idle_sessions_reaped_without_traffic(self):
+        pool = SessionPool(lambda: _fake_session(), size=1, idle_timeout=0.05)
+        session = pool.acquire()
+        pool.release(session)
+        pool._reaper.join(timeout=5)
+        session.close.assert_called_once()
+        assert pool._reaper is None
+
+    def test_close_cancels_reaper(self):
+        pool = SessionPool(lambda: _fake_session(), size=1, idle_timeout=60)
+        pool.release(pool.acquire())
+        reaper = pool._reaper
+        pool.close()
+        reaper.join(timeout=1)
+        assert not reaper.is_alive()
+
+    def test_kill_in_use(self):
+        pool = SessionPool(lambda: _fake_session(), size=1, idle_timeout=60)
+        session = pool.acquire()
+        pool.kill_in_use()
+        session.kill.assert_called_once()
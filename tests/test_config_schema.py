@@ -1,8 +1,11 @@
 """Tests for config_schema module."""
 
+import shutil
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -41,6 +44,22 @@ class TestConfigDefaults:
         assert "TODO" in config.discovery.todo_patterns
         assert "FIXME" in config.discovery.todo_patterns
 
+    def test_list_defaults_not_shared(self):
+        a, b = Config(), Config()
+        a.claude.retry_delays.append(99)
+        a.safety.protected_files.append("x.py")
+        assert b.claude.retry_delays == [2, 8, 32]
+        assert b.safety.protected_files == ["main.py", "config.yaml"]
+        assert isinstance(b.discovery.exclude_dirs, list)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_config_dataclasses_are_slotted(self):
+        config = Config()
+        for section in (config, config.claude, config.agent_pipeline.coder, config.notifications):
+            assert not hasattr(section, "__dict__")
+        with pytest.raises(AttributeError):
+            config.claude.modle = "typo"
+
 
 class TestLoadConfig:
     def test_load_config_none_returns_defaults(self):
@@ -96,6 +115,90 @@ class TestLoadConfig:
         config = load_config(str(f))
         assert config.claude.model == "haiku"
 
+    def test_load_config_ignores_non_mapping_sections(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        f.write_text(
+            f"target_dir: {git_repo}\n"
+            "claude: opus\n"
+            "agent_pipeline: [1, 2]\n"
+            "orchestrator:\n  max_tasks_per_cycle: 4\n"
+        )
+        config = load_config(str(f))
+        assert config.claude.model == ClaudeConfig().model
+        assert config.agent_pipeline == AgentPipelineConfig()
+        assert config.orchestrator.max_batch_size == 4
+
+    def test_load_config_webhooks(self, tmp_path, git_repo, caplog):
+        f = tmp_path / "config.yaml"
+        f.write_text(
+            f"target_dir: {git_repo}\n"
+            "notifications:\n"
+            "  enabled: true\n"
+            "  webhooks:\n"
+            "    - url: https://hooks.example.com/a\n"
+            "      type: slack\n"
+            "      channel: ops\n"
+            "    - type: discord\n"
+            "    - not-a-mapping\n"
+        )
+        config = load_config(str(f))
+        assert len(config.notifications.webhooks) == 1
+        wh = config.notifications.webhooks[0]
+        assert (wh.url, wh.type, wh.name) == ("https://hooks.example.com/a", "slack", "")
+        assert any("WebhookConfig.channel" in r.message for r in caplog.records)
+
+    def test_load_config_keeps_date_like_strings(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        f.write_text(f"target_dir: {git_repo}\ndiscovery:\n  discovery_prompt: 2024-01-02\n")
+        config = load_config(str(f))
+        assert config.discovery.discovery_prompt == "2024-01-02"
+
+    def test_load_config_reads_utf8_bytes(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        f.write_bytes(
+            f"target_dir: {git_repo}\n"
+            "safety:\n  protected_files:\n    - docs/caf\u00e9.md\n".encode("utf-8")
+        )
+        config = load_config(str(f))
+        assert "docs/caf\u00e9.md" in config.safety.protected_files
+
+
+class TestLoadConfigCache:
+    def _write(self, path, git_repo, max_turns):
+        path.write_text(f"target_dir: {git_repo}\nclaude:\n  max_turns: {max_turns}\n")
+
+    def test_unchanged_file_not_parsed_again(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        self._write(f, git_repo, 10)
+        first = load_config(str(f))
+        with patch("config_schema.yaml.load") as mock_load:
+            second = load_config(str(f))
+        mock_load.assert_not_called()
+        assert second == first
+        assert second is not first
+        assert second.claude is not first.claude
+
+    def test_changed_file_reloaded(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        self._write(f, git_repo, 10)
+        assert load_config(str(f)).claude.max_turns == 10
+        self._write(f, git_repo, 120)
+        assert load_config(str(f)).claude.max_turns == 120
+
+    def test_caller_mutation_not_cached(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        self._write(f, git_repo, 10)
+        load_config(str(f)).claude.max_turns = 99
+        assert load_config(str(f)).claude.max_turns == 10
+
+
+    def test_cache_hit_revalidates_target_dir(self, tmp_path, git_repo):
+        f = tmp_path / "config.yaml"
+        self._write(f, git_repo, 10)
+        load_config(str(f))
+        shutil.rmtree(git_repo)
+        with pytest.raises(ValueError):
+            load_config(str(f))
 
 class TestNewConfigFields:
     def test_discovery_model_default(self):
@@ -506,6 +609,32 @@ class TestValidateTargetDir:
         # Should not raise
         validate_config(config)
 
+    def test_subdirectory_of_repo_passes(self, git_repo):
+        from config_schema import validate_config
+        sub = git_repo / "pkg" / "mod"
+        sub.mkdir(parents=True)
+        config = Config()
+        config.target_dir = str(sub)
+        validate_config(config)
+
+    def test_worktree_git_file_passes(self, tmp_path):
+        from config_schema import validate_config
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+        config = Config()
+        config.target_dir = str(worktree)
+        validate_config(config)
+
+    def test_git_check_spawns_no_process(self, git_repo):
+        from config_schema import validate_config
+        config = Config()
+        config.target_dir = str(git_repo)
+        with patch("subprocess.run") as mock_run, patch("subprocess.Popen") as mock_popen:
+            validate_config(config)
+        mock_run.assert_not_called()
+        mock_popen.assert_not_called()
+
 
 class TestValidateBatchSizeOrdering:
     """Tests for batch size ordering validation in validate_config()."""
@@ -595,6 +724,20 @@ class TestValidateModelNames:
         with pytest.raises(ValueError, match="contains whitespace"):
             validate_config(config)
 
+    def test_model_with_embedded_newline_raises(self):
+        from config_schema import validate_config
+        config = Config()
+        config.claude.model = "claude-opus\n-4-6"
+        with pytest.raises(ValueError, match="contains whitespace"):
+            validate_config(config)
+
+    def test_discovery_model_with_tab_raises(self):
+        from config_schema import validate_config
+        config = Config()
+        config.discovery.discovery_model = "son\tnet"
+        with pytest.raises(ValueError, match="discovery.discovery_model contains whitespace"):
+            validate_config(config)
+
     def test_known_alias_passes(self):
         from config_schema import validate_config
         config = Config()
@@ -647,6 +790,20 @@ class TestValidateMaxRetries:
         with pytest.raises(ValueError, match="claude.max_turns"):
             validate_config(config)
 
+    def test_negative_session_pool_size_raises(self):
+        from config_schema import validate_config
+        config = Config()
+        config.claude.session_pool_size = -1
+        with pytest.raises(ValueError, match="claude.session_pool_size"):
+            validate_config(config)
+
+    def test_zero_session_idle_timeout_raises(self):
+        from config_schema import validate_config
+        config = Config()
+        config.claude.session_idle_timeout = 0
+        with pytest.raises(ValueError, match="claude.session_idle_timeout"):
+            validate_config(config)
+
 
 class TestValidateFilePaths:
     """Tests for file path validation."""
@@ -686,6 +843,27 @@ class TestValidateFilePaths:
         validate_config(config)
 
 
+class TestRangeChecks:
+    def test_every_range_check_names_a_numeric_field(self):
+        from config_schema import _RANGE_CHECKS
+        config = Config()
+        for section_name, field_name, _ in _RANGE_CHECKS:
+            assert isinstance(getattr(getattr(config, section_name), field_name), (int, float))
+
+    def test_fractional_cost_cap_passes(self):
+        from config_schema import validate_config
+        config = Config()
+        config.safety.max_cost_usd_per_hour = 0.5
+        validate_config(config)
+
+    def test_message_names_field_and_value(self):
+        from config_schema import validate_config
+        config = Config()
+        config.validation.lint_timeout = -3
+        with pytest.raises(ValueError, match=r"validation\.lint_timeout must be positive, got -3"):
+            validate_config(config)
+
+
 class TestValidateMemoryConfig:
     """Tests for min_memory_mb validation."""
 
@@ -705,3 +883,54 @@ class TestValidateMemoryConfig:
     def test_default_min_memory(self):
         config = Config()
         assert config.safety.min_memory_mb == 256
+
+
+class TestMergeDataclass:
+    """Tests for _merge_dataclass and its field type lookup."""
+
+    def test_expected_types(self):
+        from config_schema import _get_expected_type
+        assert _get_expected_type(ClaudeConfig, "max_turns") is int
+        assert _get_expected_type(ClaudeConfig, "retry_delays") is list
+        assert _get_expected_type(ClaudeConfig, "no_such_field") is None
+
+    def test_optional_hints_unwrapped(self):
+        from dataclasses import dataclass
+        from typing import List, Optional, Union
+        from config_schema import _get_expected_type
+
+        @dataclass
+        class Sample:
+            limit: Optional[int] = None
+            names: Optional[List[str]] = None
+            either: Union[int, str] = 0
+
+        assert _get_expected_type(Sample, "limit") is int
+        assert _get_expected_type(Sample, "names") is list
+        assert _get_expected_type(Sample, "either") is None
+
+    def test_type_hints_resolved_once_per_class(self):
+        from config_schema import _get_expected_type, _hints_for
+        _hints_for.cache_clear()
+        _get_expected_type(ClaudeConfig, "max_turns")
+        _get_expected_type(ClaudeConfig, "model")
+        assert _hints_for.cache_info().misses == 1
+
+    def test_merge_uses_precomputed_types(self):
+        from config_schema import _FIELD_TYPES, _hints_for, _merge_dataclass
+        assert _FIELD_TYPES[ClaudeConfig]["retry_delays"] is list
+        _hints_for.cache_clear()
+        cfg = _merge_dataclass(ClaudeConfig(), {"max_turns": 5, "model": "sonnet"})
+        assert cfg.max_turns == 5
+        assert _hints_for.cache_info().misses == 0
+
+    def test_wrong_type_skipped(self):
+        from config_schema import _merge_dataclass
+        cfg = _merge_dataclass(ClaudeConfig(), {"max_turns": "many", "timeout_seconds": 60})
+        assert cfg.max_turns == ClaudeConfig().max_turns
+        assert cfg.timeout_seconds == 60
+
+    def test_non_field_attribute_rejected(self):
+        from config_schema import _merge_dataclass
+        cfg = _merge_dataclass(ClaudeConfig(), {"__class__": "x", "__init__": 1})
+        assert type(cfg) is ClaudeConfig
@@ -179,6 +179,250 @@ class TestMergeWorkerBranch:
         main_git.delete_branch(branch_name, force=True)
 
 
+    def test_merge_strategy_skips_known_conflict(self, parallel_config):
+        parallel_config.parallel.merge_strategy = "merge"
+        coord = ParallelCoordinator(parallel_config)
+        coord.git = MagicMock()
+        coord.git.get_current_branch.return_value = "main"
+        coord.git.merge_ff_only.return_value = False
+        coord.git.merges_cleanly.return_value = False
+        worker = MagicMock(branch_name="auto-claude/w0", worker_id=0)
+
+        result = coord._merge_worker_branch(
+            worker, WorkerResult(success=True, branch_name="auto-claude/w0", tasks=[]),
+        )
+        assert result is False
+        coord.git.merge_branch.assert_not_called()
+        coord.git.abort_merge.assert_not_called()
+        coord.git.merges_cleanly.assert_called_once_with("main", "auto-claude/w0")
+
+    def test_merge_strategy_merges_when_probe_unavailable(self, parallel_config):
+        parallel_config.parallel.merge_strategy = "merge"
+        coord = ParallelCoordinator(parallel_config)
+        coord.git = MagicMock()
+        coord.git.get_current_branch.return_value = "main"
+        coord.git.merge_ff_only.return_value = False
+        coord.git.merges_cleanly.return_value = None
+        coord.git.merge_branch.return_value = True
+        worker = MagicMock(branch_name="auto-claude/w0", worker_id=0)
+
+        result = coord._merge_worker_branch(
+            worker, WorkerResult(success=True, branch_name="auto-claude/w0", tasks=[]),
+        )
+        assert result is True
+        coord.git.merge_branch.assert_called_once_with("auto-claude/w0")
+
+
+    def test_rebase_skipped_when_trees_match(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        coord.git = MagicMock()
+        coord.git.get_current_branch.return_value = "main"
+        coord.git.merge_ff_only.return_value = False
+        coord.git.tree_of.return_value = "abc123"
+        worker = MagicMock(branch_name="auto-claude/w0", worker_id=0)
+
+        with patch("coordinator.Validator") as MockValidator:
+            result = coord._merge_worker_branch(
+                worker, WorkerResult(success=True, branch_name="auto-claude/w0", tasks=[]),
+            )
+        assert result is True
+        coord.git.rebase_onto.assert_not_called()
+        MockValidator.assert_not_called()
+
+
+    def test_revalidation_skipped_when_rebase_keeps_worker_tree(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        coord.git = MagicMock()
+        coord.git.get_current_branch.return_value = "main"
+        coord.git.merge_ff_only.side_effect = [False, True]
+        coord.git.rebase_onto.return_value = True
+        # main, worker before rebase, then main after the fast-forward
+        coord.git.tree_of.side_effect = ["main-tree", "worker-tree", "worker-tree"]
+        worker = MagicMock(branch_name="auto-claude/w0", worker_id=0)
+
+        with patch("coordinator.Validator") as MockValidator:
+            result = coord._merge_worker_branch(
+                worker, WorkerResult(success=True, branch_name="auto-claude/w0", tasks=[]),
+            )
+        assert result is True
+        coord.git.rebase_onto.assert_called_once_with("main", "auto-claude/w0")
+        MockValidator.assert_not_called()
+
+    def test_revalidation_runs_when_rebase_changes_tree(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        coord.git = MagicMock()
+        coord.git.get_current_branch.return_value = "main"
+        coord.git.merge_ff_only.side_effect = [False, True]
+        coord.git.rebase_onto.return_value = True
+        coord.git.tree_of.side_effect = ["main-tree", "worker-tree", "merged-tree"]
+        worker = MagicMock(branch_name="auto-claude/w0", worker_id=0)
+
+        with patch("coordinator.Validator") as MockValidator:
+            MockValidator.return_value.validate.return_value = MagicMock(passed=True)
+            result = coord._merge_worker_branch(
+                worker, WorkerResult(success=True, branch_name="auto-claude/w0", tasks=[]),
+            )
+        assert result is True
+        MockValidator.return_value.validate.assert_called_once()
+
+
+class TestRunCycle:
+    def _stub_coordinator(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        coord.safety = MagicMock()
+        coord.git = MagicMock()
+        coord._check_worktree_disk_space = MagicMock()
+        coord._gather_tasks = MagicMock(return_value=[
+            Task(description="Lint 1", priority=3, source="lint"),
+            Task(description="Lint 2", priority=3, source="lint"),
+        ])
+        coord._process_result = MagicMock()
+        coord._cleanup_worker_with_timeout = MagicMock()
+        return coord
+
+    def test_worker_threads_reused_across_cycles(self, parallel_config):
+        coord = self._stub_coordinator(parallel_config)
+        thread_names = []
+
+        def make_worker(**kwargs):
+            worker = MagicMock(worker_id=kwargs["worker_id"], tasks=kwargs["tasks"])
+
+            def execute():
+                thread_names.append(threading.current_thread().name)
+                return WorkerResult(success=False, branch_name="b", tasks=kwargs["tasks"])
+
+            worker.execute.side_effect = execute
+            return worker
+
+        with patch("coordinator.Worker", side_effect=make_worker):
+            coord._run_cycle()
+            executor = coord._executor
+            coord._run_cycle()
+        assert coord._executor is executor
+        assert len(thread_names) == 4
+        assert all(name.startswith("worker") for name in thread_names)
+        assert coord._process_result.call_count == 4
+        coord._executor.shutdown()
+
+    def test_workers_pooled_across_cycles(self, parallel_config):
+        coord = self._stub_coordinator(parallel_config)
+        coord._gather_tasks = MagicMock(side_effect=[
+            [Task(description="a", priority=2, source="lint")],
+            [Task(description="b", priority=2, source="lint")],
+        ])
+
+        with patch("coordinator.Worker") as MockWorker:
+            MockWorker.return_value.execute.return_value = WorkerResult(success=False)
+            coord._run_cycle()
+            coord._run_cycle()
+
+        assert MockWorker.call_count == 1
+        worker = MockWorker.return_value
+        worker.reset.assert_called_once()
+        assert worker.reset.call_args[0][0][0].description == "b"
+        coord._executor.shutdown()
+
+    def test_unclaimed_feedback_not_dispatched(self, parallel_config):
+        coord = self._stub_coordinator(parallel_config)
+        coord._gather_tasks = MagicMock(return_value=[
+            Task(description="FB 1", priority=1, source="feedback", source_file="f1.md"),
+            Task(description="FB 2", priority=1, source="feedback", source_file="f2.md"),
+            Task(description="Lint", priority=3, source="lint"),
+        ])
+        coord.feedback = MagicMock()
+        coord.feedback.claim_batch.return_value = {"f2.md"}
+
+        with patch("coordinator.Worker") as MockWorker:
+            MockWorker.return_value.execute.return_value = WorkerResult(success=False)
+            coord._run_cycle()
+
+        coord.feedback.claim_batch.assert_called_once_with(["f1.md", "f2.md"])
+        dispatched = [c.kwargs["tasks"][0].description for c in MockWorker.call_args_list]
+        assert dispatched == ["FB 2", "Lint"]
+        coord._executor.shutdown()
+
+    def test_pooled_worker_not_rebound_while_running(self, parallel_config):
+        from concurrent.futures import Future
+
+        coord = self._stub_coordinator(parallel_config)
+        worker = MagicMock()
+        coord._worker_pool.append(worker)
+        pending = Future()
+        coord._slot_futures[0] = pending
+        order = []
+        worker.reset.side_effect = lambda tasks: order.append(("reset", pending.done()))
+        timer = threading.Timer(0.2, lambda: pending.set_result(None))
+        timer.start()
+
+        coord._get_or_create_worker(0, [Task(description="a", priority=2, source="lint")])
+        timer.join()
+
+        assert order == [("reset", True)]
+        coord._cleanup_worker_with_timeout.assert_called_once_with(worker)
+
+    def test_worker_exception_becomes_failed_result(self, parallel_config):
+        coord = self._stub_coordinator(parallel_config)
+
+        def make_worker(**kwargs):
+            worker = MagicMock(worker_id=kwargs["worker_id"], tasks=kwargs["tasks"],
+                               branch_name=f"b{kwargs['worker_id']}")
+            if kwargs["worker_id"] == 0:
+                worker.execute.side_effect = RuntimeError("boom")
+            else:
+                worker.execute.return_value = WorkerResult(
+                    success=True, branch_name="b1", tasks=kwargs["tasks"],
+                )
+            return worker
+
+        with patch("coordinator.Worker", side_effect=make_worker):
+            coord._run_cycle()
+        results = {w.worker_id: r for (r, w), _ in coord._process_result.call_args_list}
+        assert results[0].success is False
+        assert results[0].error == "boom"
+        assert results[1].success is True
+        coord._executor.shutdown()
+
+
+class TestRun:
+    def _stub_coordinator(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        coord._setup_signals = MagicMock()
+        coord.safety = MagicMock()
+        coord._cleanup_all_worktrees = MagicMock()
+        return coord
+
+    def test_run_can_be_called_twice(self, parallel_config):
+        coord = self._stub_coordinator(parallel_config)
+        coord._run_cycle = MagicMock(
+            side_effect=lambda: coord._get_executor().submit(lambda: None).result(),
+        )
+        coord.run(once=True)
+        coord.run(once=True)
+        assert coord._run_cycle.call_count == 2
+        assert coord._executor is None
+
+    def test_workers_finish_before_worktree_cleanup(self, parallel_config):
+        coord = self._stub_coordinator(parallel_config)
+        finished = threading.Event()
+
+        def slow_worker():
+            time.sleep(0.2)
+            finished.set()
+
+        def cycle():
+            coord._get_executor().submit(slow_worker)
+            raise RuntimeError("dispatch failed")
+
+        coord._run_cycle = MagicMock(side_effect=cycle)
+        seen_at_cleanup = []
+        coord._cleanup_all_worktrees.side_effect = (
+            lambda: seen_at_cleanup.append(finished.is_set())
+        )
+
+        coord.run(once=True)
+        assert seen_at_cleanup == [True]
+
+
 class TestGatherTasks:
     def test_gather_tasks_deduplicates(self, parallel_config):
         """Tasks recently attempted are excluded."""
@@ -266,6 +510,20 @@ class TestCleanupAllWorktreesTimeout:
         # (since error isolation means we continue)
 
 
+    def test_cleanup_removes_worktrees_concurrently(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        worktree_base = Path(parallel_config.target_dir) / ".worktrees"
+        for i in range(2):
+            (worktree_base / f"worker-{i}").mkdir(parents=True, exist_ok=True)
+
+        # Both removals must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        with patch.object(coord.git, "remove_worktree", side_effect=lambda *a, **kw: barrier.wait()):
+            with patch.object(coord.git, "prune_worktrees"):
+                coord._cleanup_all_worktrees()
+        assert not barrier.broken
+
+
 class TestCleanupWorkerWithTimeout:
     def test_worker_cleanup_completes(self, parallel_config):
         """Worker cleanup that finishes in time completes normally."""
@@ -278,6 +536,49 @@ class TestCleanupWorkerWithTimeout:
         coord._cleanup_worker_with_timeout(worker, timeout=5)
         # Should complete without error
 
+    def test_worker_cleanup_reuses_coordinator_git(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        worker = MagicMock()
+        worker.worker_id = 0
+        worker.worktree_dir = str(Path(parallel_config.target_dir) / ".worktrees" / "worker-0")
+        worker.branch_name = "auto-claude/test-0"
+        worker._git = None
+
+        with patch("coordinator.GitManager") as MockGit:
+            with patch.object(coord.git, "remove_worktree") as remove:
+                with patch.object(coord.git, "delete_branch") as delete:
+                    coord._cleanup_worker_with_timeout(worker, timeout=5)
+        MockGit.assert_not_called()
+        remove.assert_called_once_with(worker.worktree_dir, force=True)
+        delete.assert_called_once_with("auto-claude/test-0", force=True)
+
+    def test_worker_cleanup_keeps_detached_worktree(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        worker = MagicMock()
+        worker.worker_id = 0
+        worker.worktree_dir = str(Path(parallel_config.target_dir) / ".worktrees" / "worker-0")
+        worker.branch_name = "auto-claude/test-0"
+
+        with patch.object(coord.git, "remove_worktree") as remove:
+            with patch.object(coord.git, "delete_branch") as delete:
+                coord._cleanup_worker_with_timeout(worker, timeout=5)
+        worker._git.detach_head.assert_called_once()
+        remove.assert_not_called()
+        delete.assert_called_once_with("auto-claude/test-0", force=True)
+
+    def test_worker_cleanup_removes_worktree_when_detach_fails(self, parallel_config):
+        coord = ParallelCoordinator(parallel_config)
+        worker = MagicMock()
+        worker.worker_id = 0
+        worker.worktree_dir = str(Path(parallel_config.target_dir) / ".worktrees" / "worker-0")
+        worker.branch_name = "auto-claude/test-0"
+        worker._git.detach_head.side_effect = RuntimeError("locked")
+
+        with patch.object(coord.git, "remove_worktree") as remove:
+            with patch.object(coord.git, "delete_branch"):
+                coord._cleanup_worker_with_timeout(worker, timeout=5)
+        remove.assert_called_once_with(worker.worktree_dir, force=True)
+
     def test_worker_cleanup_timeout_logged(self, parallel_config, caplog):
         """Worker cleanup that hangs is abandoned after the timeout."""
         import logging
@@ -287,14 +588,10 @@ class TestCleanupWorkerWithTimeout:
         worker.worker_id = 42
         worker.worktree_dir = str(Path(parallel_config.target_dir) / ".worktrees" / "worker-42")
         worker.branch_name = "auto-claude/test-42"
+        worker._git = None
 
-        # Override to hang
-        original_init = None
-
-        with patch("coordinator.GitManager") as MockGit:
-            mock_git_instance = MockGit.return_value
-            mock_git_instance.remove_worktree.side_effect = lambda *a, **kw: time.sleep(60)
-
+        with patch.object(coord.git, "remove_worktree",
+                          side_effect=lambda *a, **kw: time.sleep(60)):
             with caplog.at_level(logging.WARNING):
                 coord._cleanup_worker_with_timeout(worker, timeout=1)
 
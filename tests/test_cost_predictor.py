@@ -10,6 +10,7 @@ from cost_predictor import (
     OUTPUT_COST_MULTIPLIER,
     OUTPUT_TO_INPUT_RATIO,
     _MODEL_COST_PER_M_INPUT_TOKENS,
+    _input_cost_per_m,
     check_cost_budget,
     estimate_prompt_tokens,
     estimate_task_cost,
@@ -85,6 +86,14 @@ class TestEstimateTaskCost(unittest.TestCase):
         cost_opus = estimate_task_cost([task], "opus", prompt_overhead=0)
         self.assertAlmostEqual(cost_prefix, cost_opus)
 
+    def test_model_price_lookup_cached(self):
+        _input_cost_per_m.cache_clear()
+        estimate_task_cost([], "claude-sonnet-4-6")
+        estimate_task_cost([], "claude-sonnet-4-6")
+        info = _input_cost_per_m.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
     def test_empty_tasks(self):
         cost = estimate_task_cost([], "opus", prompt_overhead=500)
         # Cost comes from prompt_overhead only
@@ -2,7 +2,9 @@
 
 import json
 import os
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -68,6 +70,77 @@ class TestCycleStateWriter:
         assert result.phase == "validating"
         assert result.retry_count == 2
 
+    def test_unchanged_state_not_rewritten(self, tmp_path):
+        writer = CycleStateWriter(str(tmp_path))
+        writer.write(CycleState(phase="executing", task_descriptions=["a"]))
+        os.unlink(tmp_path / "current_cycle.json")
+
+        writer.write(CycleState(phase="executing", task_descriptions=["a"]))
+        assert not (tmp_path / "current_cycle.json").exists()
+
+        writer.write(CycleState(phase="executing", task_descriptions=["a", "b"]))
+        assert (tmp_path / "current_cycle.json").exists()
+
+    def test_in_place_list_edit_is_written(self, tmp_path):
+        writer = CycleStateWriter(str(tmp_path))
+        state = CycleState(phase="executing", task_descriptions=["a"])
+        writer.write(state)
+        state.task_descriptions.append("b")
+        writer.write(state)
+
+        result = read_cycle_state(str(tmp_path))
+        assert result.task_descriptions == ["a", "b"]
+
+    def test_write_after_clear_recreates_file(self, tmp_path):
+        writer = CycleStateWriter(str(tmp_path))
+        writer.write(CycleState(phase="executing"))
+        writer.clear()
+        writer.write(CycleState(phase="executing"))
+        assert (tmp_path / "current_cycle.json").exists()
+
+    def test_update_does_not_read_from_disk(self, tmp_path):
+        writer = CycleStateWriter(str(tmp_path))
+        writer.write(CycleState(phase="planning", task_description="Fix bug"))
+        with patch("cycle_state.read_cycle_state") as read:
+            writer.update(phase="executing")
+        read.assert_not_called()
+        result = read_cycle_state(str(tmp_path))
+        assert result.phase == "executing"
+        assert result.task_description == "Fix bug"
+
+    def test_concurrent_updates_keep_both_fields(self, tmp_path):
+        writer = CycleStateWriter(str(tmp_path))
+        first_writing = threading.Event()
+        real_replace = os.replace
+
+        def slow_replace(src, dst):
+            # Hold the first write open while the second update runs
+            if not first_writing.is_set():
+                first_writing.set()
+                threading.Event().wait(0.2)
+            real_replace(src, dst)
+
+        with patch("cycle_state.os.replace", side_effect=slow_replace):
+            t = threading.Thread(target=writer.update, kwargs={"phase": "validating"})
+            t.start()
+            assert first_writing.wait(timeout=5)
+            writer.update(pipeline_agent="reviewer")
+            t.join()
+
+        result = read_cycle_state(str(tmp_path))
+        assert result.phase == "validating"
+        assert result.pipeline_agent == "reviewer"
+
+    def test_worker_update_keeps_own_state(self, tmp_path):
+        CycleStateWriter(str(tmp_path)).write(CycleState(task_description="main"))
+        writer = CycleStateWriter(str(tmp_path), worker_id=1)
+        writer.write(CycleState(phase="planning", task_description="worker"))
+        writer.update(phase="executing")
+
+        data = json.loads((tmp_path / "current_cycle_worker_1.json").read_text())
+        assert data["task_description"] == "worker"
+        assert data["phase"] == "executing"
+
     def test_atomic_write(self, tmp_path):
         """Write should be atomic — no partial files."""
         writer = CycleStateWriter(str(tmp_path))
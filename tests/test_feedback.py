@@ -134,6 +134,21 @@ class TestFeedbackManager:
         assert Path(fb_mgr.failed_dir).exists()
 
 
+    def test_claim_batch_returns_claimed_files(self, fb_mgr):
+        fb_dir = Path(fb_mgr.feedback_dir)
+        first = fb_dir / "a.md"
+        second = fb_dir / "b.md"
+        first.write_text("A")
+        second.write_text("B")
+        missing = str(fb_dir / "gone.md")
+
+        claimed = fb_mgr.claim_batch([str(first), missing, str(second)])
+
+        assert claimed == {str(first), str(second)}
+        assert (fb_dir / "a.md.claimed").exists()
+        assert (fb_dir / "b.md.claimed").exists()
+        assert not first.exists()
+
 class TestAtomicMoveRetry:
     def test_atomic_move_retries_on_read_failure(self, fb_mgr, tmp_path):
         """_atomic_move retries when src.read_text() fails on first attempt."""
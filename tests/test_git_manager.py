@@ -26,6 +26,36 @@ class TestGitManager:
         Path(tmp_git_repo, "new_file.txt").write_text("hello")
         assert gm.is_clean() is False
 
+    def test_has_changes_since_clean_repo(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        snap = gm.create_snapshot()
+        assert gm.has_changes_since(snap) is False
+        assert gm.has_changes_since() is False
+
+    def test_has_changes_since_dirty_tree(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        snap = gm.create_snapshot()
+        Path(tmp_git_repo, "new_file.txt").write_text("hello")
+        assert gm.has_changes_since(snap) is True
+
+    def test_has_changes_since_ignores_excluded_paths(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        snap = gm.create_snapshot()
+        ws = Path(tmp_git_repo) / "state" / "agent_workspace"
+        ws.mkdir(parents=True)
+        (ws / "plan.md").write_text("plan")
+        assert gm.has_changes_since(snap, exclude=["state/agent_workspace"]) is False
+        assert gm.has_changes_since(snap) is True
+        (Path(tmp_git_repo) / "state" / "stray.txt").write_text("x")
+        assert gm.has_changes_since(snap, exclude=["state/agent_workspace"]) is True
+
+    def test_has_changes_since_moved_head(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        snap = gm.create_snapshot()
+        Path(tmp_git_repo, "feature.py").write_text("# feature\n")
+        gm.commit("add feature")
+        assert gm.has_changes_since(snap) is True
+
     def test_get_changed_files(self, tmp_git_repo):
         gm = GitManager(tmp_git_repo)
         Path(tmp_git_repo, "a.txt").write_text("a")
@@ -396,6 +426,57 @@ class TestWorktreeManagement:
 
         gm.delete_branch("merge-branch", force=True)
 
+    def _diverge(self, gm, repo, name, branch_text, main_text, filename="shared.txt"):
+        wt_path = str(Path(repo) / ".worktrees" / name)
+        Path(wt_path).parent.mkdir(parents=True, exist_ok=True)
+        gm.create_worktree(wt_path, name)
+        Path(wt_path, filename).write_text(branch_text)
+        GitManager(wt_path).commit("Branch change", files=[filename])
+        gm.remove_worktree(wt_path, force=True)
+        Path(repo, filename).write_text(main_text)
+        gm.commit("Main change", files=[filename])
+
+    def test_merges_cleanly_reports_conflict(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        original = gm.get_current_branch()
+        self._diverge(gm, tmp_git_repo, "probe-conflict", "branch\n", "main\n")
+        head = gm._run("rev-parse", "HEAD").stdout
+
+        assert gm.merges_cleanly(original, "probe-conflict") is False
+        # The probe leaves HEAD and the working tree alone
+        assert gm._run("rev-parse", "HEAD").stdout == head
+        assert gm.is_clean()
+
+        gm.delete_branch("probe-conflict", force=True)
+
+    def test_merges_cleanly_reports_clean_merge(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        original = gm.get_current_branch()
+        wt_path = str(Path(tmp_git_repo) / ".worktrees" / "probe-clean")
+        Path(wt_path).parent.mkdir(parents=True, exist_ok=True)
+        gm.create_worktree(wt_path, "probe-clean")
+        Path(wt_path, "branch_only.txt").write_text("from branch")
+        GitManager(wt_path).commit("Branch file", files=["branch_only.txt"])
+        gm.remove_worktree(wt_path, force=True)
+        Path(tmp_git_repo, "main_only.txt").write_text("from main")
+        gm.commit("Main file", files=["main_only.txt"])
+
+        assert gm.merges_cleanly(original, "probe-clean") is True
+        assert not Path(tmp_git_repo, "branch_only.txt").exists()
+
+        gm.delete_branch("probe-clean", force=True)
+
+    def test_merges_cleanly_unknown_on_git_error(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        assert gm.merges_cleanly("HEAD", "no-such-branch") is None
+
+    def test_tree_of(self, tmp_git_repo):
+        gm = GitManager(tmp_git_repo)
+        tree = gm.tree_of("HEAD")
+        assert len(tree) >= 40
+        assert gm._run("cat-file", "-t", tree).stdout.strip() == "tree"
+        assert gm.tree_of("no-such-branch") == ""
+
     def test_prune_worktrees(self, tmp_git_repo):
         """prune_worktrees doesn't error on a clean repo."""
         gm = GitManager(tmp_git_repo)
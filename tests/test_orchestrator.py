@@ -1,5 +1,6 @@
 """Tests for orchestrator module."""
 
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -129,6 +130,15 @@ class TestOrchestrator:
         # Should have run exactly one cycle
         orch.git.create_snapshot.assert_called_once()
 
+    def test_shutdown_interrupts_loop_sleep(self, orch):
+        orch.config.orchestrator.loop_interval_seconds = 3600
+        timer = threading.Timer(0.2, orch._shutdown_event.set)
+        timer.start()
+        start = time.monotonic()
+        orch.run()
+        timer.join()
+        assert time.monotonic() - start < 30
+
     def test_build_prompt(self, orch):
         task = Task(description="Fix the bug", priority=2, source="test_failure")
         prompt = orch._build_prompt(task)
@@ -59,6 +59,34 @@ class TestWorkerWorktree:
         assert not Path(worker.worktree_dir).exists()
 
 
+    def test_reset_reuses_existing_worktree(self, worker_config, tmp_git_repo):
+        """A pooled worker switches its existing worktree to a fresh branch."""
+        state = MagicMock(spec=LockedStateManager)
+        tasks = [Task(description="Fix bug", priority=1, source="lint")]
+        worker = Worker(worker_config, tasks, state, worker_id=0, main_repo_dir=tmp_git_repo)
+        worker._setup_worktree()
+        Path(worker.worktree_dir, "leftover.txt").write_text("stale")
+        Path(worker.worktree_dir, "README.md").write_text("edited")
+        first_branch = worker.branch_name
+        subprocess.run(["git", "checkout", "--detach"], cwd=worker.worktree_dir,
+                       check=True, capture_output=True)
+        subprocess.run(["git", "branch", "-D", first_branch], cwd=tmp_git_repo,
+                       check=True, capture_output=True)
+
+        worker.reset([Task(description="Next", priority=1, source="lint")])
+        worker.branch_name = "auto-claude/reused-0"
+        with patch("worker.GitManager.create_worktree") as create:
+            worker._setup_worktree()
+        create.assert_not_called()
+
+        head = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"],
+                              cwd=worker.worktree_dir, capture_output=True, text=True)
+        assert head.stdout.strip() == "auto-claude/reused-0"
+        assert not Path(worker.worktree_dir, "leftover.txt").exists()
+        assert Path(worker.worktree_dir, "README.md").read_text() != "edited"
+        assert worker.tasks[0].description == "Next"
+        worker.cleanup()
+
 class TestWorkerExecute:
     def test_execute_no_changes(self, worker_config, tmp_git_repo):
         """Worker returns failure when Claude makes no changes."""
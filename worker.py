@@ -6,6 +6,7 @@ import ast
 import logging
 import shutil
 import time
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
@@ -67,6 +68,13 @@ class Worker:
         self._git: Optional[GitManager] = None
         self._claude: Optional[ClaudeRunner] = None
 
+    def reset(self, tasks: List[Task]) -> None:
+        """Rebind a pooled worker to a new task group for the next cycle."""
+        self.tasks = tasks
+        self.branch_name = f"auto-claude/{int(time.time())}-{self.worker_id}"
+        self._git = None
+        self._claude = None
+
     def execute(self) -> WorkerResult:
         """Full worker lifecycle: create worktree -> plan -> execute -> validate -> commit.
 
@@ -90,7 +98,10 @@ class Worker:
         try:
             # Create worker-local components pointing at the worktree
             self._git = GitManager(self.worktree_dir)
-            self._claude = ClaudeRunner(self.config)
+            # Plan, execution and validation retries form one conversation,
+            # so with resume_sessions the CLI keeps its context between them.
+            session_id = str(uuid.uuid4()) if self.config.claude.resume_sessions else None
+            self._claude = ClaudeRunner(self.config, session_id=session_id)
 
             # Create worker-specific cycle state writer
             state_dir = str(Path(self.config.paths.state_dir))
@@ -340,11 +351,35 @@ class Worker:
             )
         finally:
             cycle_state.clear()
+            if self._claude is not None:
+                self._claude.close()
 
     def _setup_worktree(self) -> None:
-        """Create a git worktree with a new branch."""
+        """Create a git worktree with a new branch.
+
+        A worktree left behind by a previous cycle is switched to the new
+        branch and cleaned instead of being re-created.
+        """
         Path(self.worktree_dir).parent.mkdir(parents=True, exist_ok=True)
         main_git = GitManager(self.main_repo_dir)
+        if Path(self.worktree_dir, ".git").exists():
+            try:
+                GitManager(self.worktree_dir).reset_worktree(
+                    self.branch_name, main_git.head_commit(),
+                )
+                logger.info(
+                    "Worker %d: reused worktree at %s (branch %s)",
+                    self.worker_id, self.worktree_dir, self.branch_name,
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    "Worker %d: could not reuse worktree, re-creating: %s",
+                    self.worker_id, e,
+                )
+                main_git.remove_worktree(self.worktree_dir, force=True)
+                shutil.rmtree(self.worktree_dir, ignore_errors=True)
+                main_git.prune_worktrees()
         main_git.create_worktree(self.worktree_dir, self.branch_name)
         logger.info(
             "Worker %d: created worktree at %s (branch %s)",